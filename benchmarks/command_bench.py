@@ -0,0 +1,302 @@
+"""명령어 처리량 벤치마크
+
+실제 Cog(Finance, Fishing, Game, UserManagement)를 불러온 Bot에 가짜 메시지를 보내
+명령어별 처리량, 지연시간, 명령어당 DB 쿼리 수를 측정합니다.
+디스코드와 MySQL 없이 SQLite 저장소로 실행합니다.
+
+사용법:
+    python -m benchmarks.command_bench --users 1000 --concurrency 50 --ops 2000
+"""
+import discord
+from discord.ext import commands
+from discord.ext.commands import converter
+
+import time
+import random
+import asyncio
+import logging
+import argparse
+import statistics
+
+from src.classes.bot import Bot
+from src.classes.database import DataSQL
+from src.classes.database.backends import SQLiteBackend
+
+BOT_ID = 100_000_000_000_000_000
+USER_ID_BASE = 200_000_000_000_000_000
+BENCH_COMMANDS = ("coin_flip", "attendance", "send_money", "ranking", "fishing_button", "fishing_session", "net_fishing", "chat")
+CHAT_MESSAGES = ("ㅋㅋㅋㅋ", "오늘 점심 뭐 먹지", ";;", "ㄴㅅ 하러 갈 사람", ";ㅋㅋ 농담", "https://example.com")
+BENCH_COGS = ("src.cogs.finance", "src.cogs.fishing", "src.cogs.game", "src.cogs.user_management")
+
+BENCH_BOT_SETTING = { # 벤치마크용 봇 설정
+    "attendance_cooldown": "24",
+    "attendance_bonus_money": "1000000",
+    "attendance_bonus_money_prob": "1",
+    "attendance_multiple": "100",
+    "attendance_random_money_min": "10",
+    "attendance_random_money_max": "100",
+    "fishing_random_min": "2",
+    "fishing_random_max": "8",
+    "fishing_timeout": "2",
+    "coinflip_loss_min": "1",
+    "coinflip_loss_max": "5",
+    "ticitactoe_game_timeout": "60",
+    "tictactoe_invite_timeout": "60",
+}
+
+BENCH_FISH = ( # 벤치마크용 물고기 목록 (name, rating, min_length, max_length, default_price, const_value, description)
+    ("멸치", 0, 50, 150, 1, 1.0, "작지만 흔한 물고기."),
+    ("고등어", 0, 200, 450, 2, 1.0, "푸른 등을 가진 물고기."),
+    ("광어", 1, 300, 800, 5, 1.0, "눈이 한쪽으로 몰린 납작한 물고기."),
+    ("우럭", 1, 200, 500, 5, 1.2, "바위틈에 사는 물고기."),
+    ("참돔", 2, 300, 1000, 20, 1.0, "붉은빛이 도는 귀한 물고기."),
+    ("참치", 3, 1000, 3000, 50, 1.0, "바다를 빠르게 헤엄치는 큰 물고기."),
+    ("철갑상어", 4, 1000, 5000, 200, 1.0, "비늘 대신 골판을 가진 물고기."),
+    ("실러캔스", 5, 1500, 2000, 1000, 1.0, "살아있는 화석이라 불리는 물고기."),
+)
+
+
+class FakeUser():
+    def __init__(self, id: int, name: str) -> None:
+        self.id = id
+        self.name = name
+        self.display_name = name
+        self.global_name = name
+        self.mention = f"<@{id}>"
+        self.bot = False
+
+    def __eq__(self, other: object) -> bool:
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class FakeMessage():
+    _next_id = 1
+
+    def __init__(self, content: str, author: FakeUser, channel: "FakeChannel") -> None:
+        self.id = FakeMessage._next_id
+        FakeMessage._next_id += 1
+        self.content = content
+        self.author = author
+        self.channel = channel
+        self.guild = channel.guild
+        self.mentions = []
+        self.attachments = []
+        self.created_at = discord.utils.utcnow() # 명령어 쿨타임 계산에 사용
+        self.edited_at = None
+        self._state = None
+
+    async def edit(self, **kwargs) -> "FakeMessage":
+        self.channel.edits += 1
+        if "content" in kwargs and kwargs["content"] is not None:
+            self.content = kwargs["content"]
+        return self
+
+    async def reply(self, content: str = None, **kwargs) -> "FakeMessage":
+        return await self.channel.send(content, **kwargs)
+
+    async def fetch(self) -> "FakeMessage":
+        return self
+
+
+class FakeChannel():
+    def __init__(self, guild: "FakeGuild") -> None:
+        self.id = 1
+        self.guild = guild
+        self.sent = 0
+        self.edits = 0
+
+    async def send(self, content: str = None, **kwargs) -> FakeMessage:
+        self.sent += 1
+        return FakeMessage(content or "", self.guild.me, self)
+
+
+class FakeGuild():
+    def __init__(self, members: list[FakeUser], me: FakeUser) -> None:
+        self.id = 1
+        self.me = me
+        self.members = members
+        self._members = {member.id: member for member in members}
+
+    def get_member(self, user_id: int) -> FakeUser | None:
+        return self._members.get(user_id)
+
+    def get_member_named(self, name: str) -> FakeUser | None:
+        return discord.utils.get(self.members, name=name)
+
+
+class FakeResponse():
+    async def defer(self, **kwargs) -> None:
+        pass
+
+    async def edit_message(self, **kwargs) -> None:
+        pass
+
+    async def send_message(self, *args, **kwargs) -> None:
+        pass
+
+
+class FakeInteraction():
+    def __init__(self, user: FakeUser, message: FakeMessage) -> None:
+        self.user = user
+        self.message = message
+        self.response = FakeResponse()
+
+
+class BenchContext(commands.Context):
+    async def send(self, content: str = None, **kwargs) -> FakeMessage:
+        return await self.message.channel.send(content, **kwargs)
+
+    async def reply(self, content: str = None, **kwargs) -> FakeMessage:
+        return await self.send(content, **kwargs)
+
+    async def defer(self, **kwargs) -> None:
+        pass
+
+
+class BenchMemberConverter(commands.Converter):
+    """가짜 길드에서 멘션으로 멤버를 찾는 컨버터"""
+
+    async def convert(self, ctx: commands.Context, argument: str) -> FakeUser:
+        member = ctx.guild.get_member(int(argument.strip("<@!>"))) if argument.strip("<@!>").isdigit() else None
+        if member is None:
+            raise commands.MemberNotFound(argument)
+        return member
+
+
+class Harness():
+    def __init__(self, bot: Bot, users: list[FakeUser], channel: FakeChannel) -> None:
+        self.bot = bot
+        self.users = users
+        self.channel = channel
+
+    async def invoke(self, author: FakeUser, content: str) -> None:
+        message = FakeMessage(content, author, self.channel)
+        ctx = await self.bot.get_context(message, cls=BenchContext)
+        await self.bot.invoke(ctx)
+
+    async def run_command(self, name: str, user: FakeUser) -> None:
+        match name:
+            case "coin_flip":
+                await self.invoke(user, f";동전던지기 {random.choice('앞뒤')} {random.choice(['10%', '100', '올인'])}")
+            case "attendance":
+                await self.invoke(user, ";돈받기")
+            case "send_money":
+                other = random.choice(self.users)
+                await self.invoke(user, f";송금 {other.mention} {random.randint(1, 100)}")
+            case "ranking":
+                await self.invoke(user, ";랭킹")
+            case "fishing_button":
+                await self.fishing_button(user)
+            case "fishing_session":
+                await self.invoke(user, ";낚시")
+            case "net_fishing": # 유저마다 쿨타임이 있으므로 대부분 쿨타임 안내로 끝남
+                await self.invoke(user, ";그물낚시")
+            case "chat": # 명령어가 아닌 일반 채팅 (on_message에서 걸러짐)
+                await self.bot.on_message(FakeMessage(random.choice(CHAT_MESSAGES), user, self.channel))
+
+    async def fishing_button(self, user: FakeUser) -> None:
+        from src.cogs.fishing import FishingView
+        from src.classes.session import SessionKind
+
+        cog = self.bot.get_cog("Fishing")
+        message = FakeMessage(";낚시", user, self.channel)
+        ctx = await self.bot.get_context(message, cls=BenchContext)
+        if not await self.bot.sessions.acquire(SessionKind.FISHING, user.id):
+            return
+
+        view = FishingView(cog, ctx) # 타이머 없이 물고기가 걸린 상태로 시작
+        button = view.children[0]
+        button.style = discord.ButtonStyle.green
+        await button.callback(FakeInteraction(user, await self.channel.send("무언가가 걸린것 같다!")))
+
+
+async def setup_bot(bot: Bot, users: int, sqlite_path: str, ledger: bool = False) -> Harness:
+    database = DataSQL(SQLiteBackend(sqlite_path), ledger=ledger)
+    await database.connect()
+    async with database.backend.transaction() as tx: # 벤치마크용 설정, 물고기, 유저 생성
+        await tx.executemany("INSERT OR REPLACE INTO bot_setting (name, value) VALUES (%s, %s)", list(BENCH_BOT_SETTING.items()))
+        if (await tx.execute("SELECT COUNT(*) FROM fish_info", fetch=True))[0][0] == 0:
+            await tx.executemany(
+                "INSERT INTO fish_info (name, rating, min_length, max_length, default_price, const_value, description) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                list(BENCH_FISH)
+            )
+        await tx.executemany(
+            "INSERT OR REPLACE INTO user_info (id, money, check_time) VALUES (%s, %s, %s)",
+            [(USER_ID_BASE + i, random.randint(1_000, 1_000_000), 0) for i in range(users)]
+        )
+
+    bot._connection.user = FakeUser(BOT_ID, "project-d") # get_context에서 봇 자신을 확인할 때 사용
+    converter.CONVERTER_MAPPING[discord.Member] = BenchMemberConverter
+
+    await bot.setup_database(database)
+    for extension in BENCH_COGS:
+        await bot.load_extension(extension)
+
+    members = [FakeUser(USER_ID_BASE + i, f"user{i}") for i in range(users)]
+    channel = FakeChannel(FakeGuild(members, bot.user))
+    return Harness(bot, members, channel)
+
+
+async def bench_command(harness: Harness, name: str, ops: int, concurrency: int) -> dict[str, float]:
+    stats = harness.bot.database.query_stats
+    latencies: list[float] = []
+    queries_before = stats.total_queries
+    counter = iter(range(ops))
+
+    async def worker():
+        for _ in counter:
+            user = random.choice(harness.users)
+            start = time.perf_counter()
+            await harness.run_command(name, user)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "queries_per_op": (stats.total_queries - queries_before) / max(len(latencies), 1),
+    }
+
+
+async def main(args: argparse.Namespace):
+    random.seed(args.seed)
+    async with Bot() as bot:
+        harness = await setup_bot(bot, args.users, args.sqlite_path, args.ledger)
+        print(
+            f"users={args.users} concurrency={args.concurrency} ops={args.ops} backend=sqlite({args.sqlite_path})"
+            f" ledger={'on' if args.ledger else 'off'}"
+        )
+        print(f"{'command':<16}{'ops':>8}{'ops/s':>12}{'p50(ms)':>10}{'p99(ms)':>10}{'queries/op':>12}")
+        for name in args.commands:
+            result = await bench_command(harness, name, args.ops, args.concurrency)
+            print(
+                f"{name:<16}{result['ops']:>8}{result['ops_per_sec']:>12.1f}"
+                f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['queries_per_op']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Project-D 명령어 처리량 벤치마크")
+    parser.add_argument("--users", type=int, default=1000, help="등록된 유저 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시에 실행할 명령어 수")
+    parser.add_argument("--ops", type=int, default=2000, help="명령어별 실행 횟수")
+    parser.add_argument("--commands", nargs="+", default=list(BENCH_COMMANDS), choices=BENCH_COMMANDS)
+    parser.add_argument("--sqlite-path", default=":memory:", help="SQLite 파일 경로")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--ledger", action="store_true", help="돈 변경 장부 기록")
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main(parser.parse_args()))
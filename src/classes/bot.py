@@ -1,63 +1,358 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 import os
+import json
+import time
+import asyncio
+import hashlib
 import logging
+from contextlib import asynccontextmanager
 
-from src.classes.database import DataSQL
-from src.classes.errors import NotRegisteredUser
+from src.classes.database import DataSQL, Wallet
+from src.classes.database.backends import StorageBackend, MySQLBackend, SQLiteBackend
+from src.classes.database.session_registry import SQLiteSessionRegistry, MySQLSessionRegistry
+from src.classes.errors import NotRegisteredUser, DatabaseBusy, UserBusy, BalanceChanged, NoFishAvailable
+from src.classes.session import SessionRegistry, InProcessSessionRegistry
+from src.classes.edit_coalescer import MessageEditCoalescer
+from src.classes.command_trie import CommandTrie
+from src.utils.timer_wheel import TimerWheel
 
 
 class Bot(commands.Bot):
     """project-d의 기반이 되는 봇"""
 
-    def __init__(self):
+    def __init__(self, **options):
         self.logger = logging.getLogger("discord.classes.Bot") # 로깅 설정
         self.database = None
         self.bot_setting = None
+        self.sessions: SessionRegistry = InProcessSessionRegistry() # 유저 세션(낚시, 게임 등) 정보
+        self.timer_wheel = TimerWheel() # 낚시 등 많은 타이머를 한번에 처리하는 스케줄러
+        self.edit_coalescer = MessageEditCoalescer() # 같은 메시지의 수정을 합쳐서 보내는 큐
+
+        self.prefixes = (";",) # 봇 접두사 (멘션 제외)
+        self.dispatcher = CommandTrie() # 명령어가 아닌 메시지를 빠르게 거르는 trie
+        self._dispatcher_dirty = True # 명령어가 바뀌어 trie를 다시 만들어야 하는지 여부
+        self.dispatched_messages = 0 # 명령어 처리로 넘긴 메시지 수
+        self.rejected_messages = 0 # 명령어가 아니라서 무시한 메시지 수
+
+        self.tree_hash_path = os.getenv("TREE_HASH_PATH", "./data/tree_hash.json") # 마지막으로 동기화한 슬래시 명령어 해시
+        self.startup_timings: dict[str, float] = {} # 시작 단계별 걸린 시간 (초)
+        self.extension_timings: dict[str, float] = {} # 확장별 불러오는 데 걸린 시간 (초)
+        self.extension_hashes: dict[str, str] = {} # 확장별로 마지막으로 불러온 소스의 해시
 
         intents = discord.Intents.default()
         intents.message_content = True
         intents.members = True
 
         super().__init__(
-            command_prefix=commands.when_mentioned_or(";"), # 봇 접두사
+            command_prefix=commands.when_mentioned_or(*self.prefixes), # 봇 접두사
             intents=intents, # 봇 기능 설정
-            help_command=HelpCommand()
+            help_command=HelpCommand(),
+            **options
         )
 
+    @property
+    def is_primary(self) -> bool:
+        """슬래시 명령어 동기화처럼 한 프로세스에서만 해야 하는 작업을 맡는지 여부"""
+        shard_ids = getattr(self, "shard_ids", None)
+        return shard_ids is None or 0 in shard_ids
+
     async def setup_hook(self):
+        start = time.perf_counter()
+
         # 데이터베이스 관련 코드
-        self.database = DataSQL(
-            host=os.getenv("MYSQL_HOST"),
-            port=os.getenv("MYSQL_PORT"),
-            loop=self.loop
-        )
-        await self.database.auth(
-            user=os.getenv("MYSQL_USER"),
-            password=os.getenv("MYSQL_PASSWORD"),
-            database=os.getenv("MYSQL_DB_NAME"),
+        await self.setup_database(
+            DataSQL(
+                backend=self._create_backend(),
+                cache_size=int(os.getenv("USER_CACHE_SIZE", 4096)),
+                cache_ttl=float(os.getenv("USER_CACHE_TTL", 300)),
+                write_behind=os.getenv("MYSQL_WRITE_BEHIND", "0") == "1",
+                write_behind_interval=int(os.getenv("MYSQL_WRITE_BEHIND_INTERVAL_MS", 50)) / 1000,
+                slow_query_ms=float(os.getenv("MYSQL_SLOW_QUERY_MS", 200)),
+                ledger=os.getenv("MONEY_LEDGER", "0") == "1",
+                ledger_interval=int(os.getenv("MONEY_LEDGER_INTERVAL_MS", 1000)) / 1000,
+                ledger_retention_days=int(os.getenv("MONEY_LEDGER_RETENTION_DAYS", 30))
+            )
         )
-
-        if self.database.pool is not None:
-            self.bot_setting = await self.database.get_bot_setting()
+        self.startup_timings["database"] = time.perf_counter() - start
 
         # Cog 관련 코드
-        for filename in os.listdir("./src/cogs"):
+        phase = time.perf_counter()
+        await self.load_cogs()
+        self.startup_timings["extensions"] = time.perf_counter() - phase
+
+        phase = time.perf_counter()
+        GUILD_ID = discord.Object(id=os.getenv("DISCORD_GUILD_ID"))
+        self.tree.copy_global_to(guild=GUILD_ID)
+        if self.is_primary: # 여러 프로세스로 실행할 때는 첫번째 샤드가 있는 프로세스만 동기화
+            synced = await self.sync_tree(GUILD_ID, force=os.getenv("TREE_SYNC_FORCE", "0") == "1")
+        else:
+            synced = False
+        self.startup_timings["tree_sync"] = time.perf_counter() - phase
+        self.startup_timings["total"] = time.perf_counter() - start
+
+        self.logger.info(
+            "Startup finished in %.0fms (database %.0fms, extensions %.0fms, tree sync %.0fms%s)",
+            self.startup_timings["total"] * 1000,
+            self.startup_timings["database"] * 1000,
+            self.startup_timings["extensions"] * 1000,
+            self.startup_timings["tree_sync"] * 1000,
+            "" if synced else ", skipped"
+        )
+        for extension, elapsed in sorted(self.extension_timings.items(), key=lambda item: item[1], reverse=True):
+            self.logger.debug("  %s loaded in %.1fms", extension, elapsed * 1000)
+
+    async def setup_database(self, database: DataSQL):
+        """데이터베이스에 연결하고 봇 설정, 물고기 목록, 순위표 등을 불러옵니다.
+        서로 관련없는 작업이므로 동시에 불러옵니다.
+
+        Args:
+            database (DataSQL): 사용할 데이터베이스
+        """
+        self.database = database
+        if not self.database.connected:
+            await self.database.connect()
+
+        if self.database.connected:
+            self.sessions = self._create_session_registry()
+            self.bot_setting, *_ = await asyncio.gather(
+                self.database.get_bot_setting(),
+                self.sessions.setup(),
+                self.database.fish_info.update_catalog(), # 물고기 목록 불러오기
+                self.database.leaderboard.load(), # 자산 순위표 생성
+            )
+            self.reconcile_user_index.start() # 등록된 유저 인덱스 생성 및 주기적 갱신
+            self.reconcile_leaderboard.start() # 다른 프로세스나 DB에서 직접 바뀐 돈을 순위표에 반영
+            self.poll_bot_setting.start() # 봇 설정 변경 감지
+            if self.database.ledger is not None and self.is_primary: # 스냅샷은 한 프로세스에서만
+                self.compact_ledger.start() # 장부 스냅샷 및 정리
+
+    def find_extensions(self) -> list[str]:
+        """./src/cogs 폴더에서 불러올 확장 이름 목록을 찾습니다.
+
+        Returns:
+            list[str]: 확장 이름 목록 (예: src.cogs.fishing)
+        """
+        extensions = []
+        for filename in sorted(os.listdir("./src/cogs")):
             if filename.startswith("_"):
                 continue
 
             if os.path.isdir(f"./src/cogs/{filename}") and "__init__.py" in os.listdir(f"./src/cogs/{filename}"):
-                await self.load_extension(f"src.cogs.{filename}")
+                extensions.append(f"src.cogs.{filename}")
             elif filename.endswith(".py"):
-                await self.load_extension(f"src.cogs.{filename[:-3]}")
+                extensions.append(f"src.cogs.{filename[:-3]}")
+        return extensions
+
+    async def _timed_load_extension(self, extension: str):
+        start = time.perf_counter()
+        self.extension_hashes[extension] = self._extension_hash(extension)
+        await self.load_extension(extension)
+        self.extension_timings[extension] = time.perf_counter() - start
+
+    def _extension_hash(self, extension: str) -> str:
+        """확장 소스 파일의 해시를 계산합니다. 패키지는 안의 .py 파일을 모두 포함합니다."""
+        path = extension.replace(".", "/")
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(root, filename)
+                for root, dirs, filenames in os.walk(path)
+                for filename in filenames if filename.endswith(".py")
+            )
+        else:
+            files = [f"{path}.py"]
+
+        digest = hashlib.sha256()
+        for file in files:
+            digest.update(file.encode())
+            with open(file, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    async def reload_extensions(self, force: bool = False) -> dict[str, float]:
+        """|coro|
+        소스가 바뀐 확장만 다시 불러옵니다. 새로 생긴 확장은 불러옵니다.
+        다시 불러오는 Cog의 상태는 Cog.export_state로 꺼내서 새 Cog의 Cog.import_state로 넘겨줍니다.
+
+        Args:
+            force (bool, optional): 바뀌지 않은 확장도 다시 불러올지 여부. Defaults to False.
+
+        Returns:
+            dict[str, float]: 다시 불러온 확장 이름: 걸린 시간 (초)
+        """
+        timings = {}
+        for extension in self.find_extensions():
+            extension_hash = self._extension_hash(extension)
+            if not force and self.extension_hashes.get(extension) == extension_hash:
+                continue
 
-        GUILD_ID = discord.Object(id=os.getenv("DISCORD_GUILD_ID"))
-        self.tree.copy_global_to(guild=GUILD_ID)
-        await self.tree.sync(guild=GUILD_ID)
+            start = time.perf_counter()
+            if extension not in self.extensions:
+                await self.load_extension(extension)
+            else:
+                states = {
+                    name: cog.export_state() for name, cog in self.cogs.items()
+                    if isinstance(cog, Cog) and (cog.__module__ == extension or cog.__module__.startswith(f"{extension}."))
+                }
+                await self.reload_extension(extension)
+                for name, state in states.items():
+                    cog = self.get_cog(name)
+                    if isinstance(cog, Cog) and state:
+                        cog.import_state(state)
+            self.extension_hashes[extension] = extension_hash
+            timings[extension] = time.perf_counter() - start
+            self.logger.info("Reloaded %s in %.1fms", extension, timings[extension] * 1000)
+        return timings
+
+    async def load_cogs(self):
+        """./src/cogs 폴더의 Cog를 모두 동시에 불러옵니다."""
+        await asyncio.gather(*(self._timed_load_extension(extension) for extension in self.find_extensions()))
+
+    def _tree_hash(self, guild: discord.abc.Snowflake) -> str:
+        """길드에 동기화될 슬래시 명령어 목록의 해시를 계산합니다."""
+        payload = []
+        for command in self.tree.get_commands(guild=guild):
+            try:
+                payload.append(command.to_dict(self.tree))
+            except TypeError: # discord.py 2.3 이하는 tree 인자가 없음
+                payload.append(command.to_dict())
+        payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+    def _read_tree_hashes(self) -> dict[str, str]:
+        try:
+            with open(self.tree_hash_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    async def sync_tree(self, guild: discord.abc.Snowflake, force: bool = False) -> bool:
+        """|coro|
+        슬래시 명령어를 길드에 동기화합니다.
+        동기화 API는 rate limit이 있으므로, 마지막으로 동기화한 명령어 목록의 해시를 애플리케이션과 길드별로 파일에 저장해두고 같으면 건너뜁니다.
+        디스코드에서 명령어가 바뀌었다면 해시로 알 수 없으므로 force로 다시 동기화합니다.
+
+        Args:
+            guild (discord.abc.Snowflake): 동기화할 길드
+            force (bool, optional): 해시가 같아도 동기화할지 여부. Defaults to False.
+
+        Returns:
+            bool: 동기화 여부
+        """
+        tree_hash = self._tree_hash(guild)
+        key = f"{self.application_id}:{guild.id}" # 다른 봇 토큰으로 같은 파일을 사용해도 구분
+        hashes = self._read_tree_hashes()
+        if not force and hashes.get(key) == tree_hash:
+            self.logger.info("Command tree unchanged, skipping sync (%s)", tree_hash[:12])
+            return False
+
+        await self.tree.sync(guild=guild)
+        hashes[key] = tree_hash
+        try:
+            os.makedirs(os.path.dirname(self.tree_hash_path) or ".", exist_ok=True)
+            with open(self.tree_hash_path, "w", encoding="utf-8") as f:
+                json.dump(hashes, f)
+        except OSError as e: # 저장하지 못해도 다음 실행에서 다시 동기화할 뿐이므로 무시
+            self.logger.warning("Failed to save command tree hash: %s", e)
+        self.logger.info("Command tree synced (%s)", tree_hash[:12])
+        return True
+
+    def _create_backend(self) -> StorageBackend:
+        """환경변수 DATABASE_BACKEND에 맞는 저장소를 생성합니다. (mysql, sqlite)"""
+        match os.getenv("DATABASE_BACKEND", "mysql").lower():
+            case "sqlite":
+                return SQLiteBackend(path=os.getenv("SQLITE_PATH", "./data/project-d.db"))
+            case "mysql":
+                return MySQLBackend(
+                    host=os.getenv("MYSQL_HOST"),
+                    port=os.getenv("MYSQL_PORT"),
+                    user=os.getenv("MYSQL_USER"),
+                    password=os.getenv("MYSQL_PASSWORD"),
+                    database=os.getenv("MYSQL_DB_NAME"),
+                    loop=self.loop,
+                    minsize=int(os.getenv("MYSQL_POOL_MINSIZE", 1)),
+                    maxsize=int(os.getenv("MYSQL_POOL_MAXSIZE", 10)),
+                    pool_recycle=int(os.getenv("MYSQL_POOL_RECYCLE", 3600)), # 서버의 wait_timeout보다 짧아야 함
+                    acquire_timeout=float(os.getenv("MYSQL_POOL_ACQUIRE_TIMEOUT", 5)),
+                    max_waiters=int(os.getenv("MYSQL_POOL_MAX_WAITERS", 100)),
+                )
+        raise ValueError(f"지원하지 않는 DATABASE_BACKEND입니다: {os.getenv('DATABASE_BACKEND')}")
+
+    def _create_session_registry(self) -> SessionRegistry:
+        """환경변수 SESSION_BACKEND에 맞는 세션 저장소를 생성합니다. (memory, database)
+        database는 여러 프로세스가 세션을 공유하며, DATABASE_BACKEND에 따라 SQLite 또는 MySQL을 사용합니다.
+        """
+        ttl = float(os.getenv("SESSION_TTL", 600))
+        lock_timeout = float(os.getenv("ECONOMY_LOCK_TIMEOUT", 10))
+        match os.getenv("SESSION_BACKEND", "memory").lower():
+            case "memory":
+                return InProcessSessionRegistry(ttl, lock_timeout)
+            case "database" if self.database.backend.name == "sqlite":
+                return SQLiteSessionRegistry(self.database, ttl, lock_timeout)
+            case "database" if self.database.backend.name == "mysql":
+                return MySQLSessionRegistry(
+                    self.database,
+                    ttl,
+                    lock_timeout,
+                    lock_connections=int(os.getenv("ECONOMY_LOCK_CONNECTIONS", 4))
+                )
+        raise ValueError(f"지원하지 않는 SESSION_BACKEND입니다: {os.getenv('SESSION_BACKEND')}")
+
+    @asynccontextmanager
+    async def economy_lock(self, *user_ids: int):
+        """유저의 돈을 바꾸는 작업이 하나씩만 실행되도록 잠급니다.
+        세션 저장소를 다른 프로세스와 공유하면, 잠근 뒤 유저 캐시를 비워 최신 돈 정보를 읽도록 합니다.
+
+        Args:
+            *user_ids (int): 잠글 유저 아이디
+
+        Raises:
+            UserBusy: 잠금을 얻지 못했을 때
+        """
+        async with self.sessions.economy_lock(*user_ids):
+            if self.sessions.shared:
+                for user_id in user_ids:
+                    self.database.user_cache.invalidate(user_id)
+            yield
+
+    def get_wallet(self, ctx: commands.Context["Bot"]) -> Wallet:
+        """명령어 실행 하나에 묶인 작성자의 지갑을 반환합니다.
+        컨버터와 명령어가 같은 지갑을 사용하므로 유저 정보를 한번만 불러옵니다.
+
+        Args:
+            ctx (commands.Context[Bot]): 명령어 컨텍스트
+
+        Returns:
+            Wallet: 작성자의 지갑
+        """
+        wallet = getattr(ctx, "wallet", None)
+        if wallet is None:
+            wallet = ctx.wallet = self.database.get_wallet(ctx.author)
+        return wallet
+
+    def add_command(self, command: commands.Command):
+        super().add_command(command)
+        self._dispatcher_dirty = True
+
+    def remove_command(self, name: str) -> commands.Command | None:
+        command = super().remove_command(name)
+        self._dispatcher_dirty = True
+        return command
+
+    def _rebuild_dispatcher(self):
+        """현재 등록된 명령어와 별칭으로 dispatcher를 다시 만듭니다.
+        Cog를 불러오거나 리로드하면 add_command/remove_command가 호출되어 다음 메시지에서 다시 만들어집니다.
+        """
+        prefixes = list(self.prefixes)
+        if self.user is not None: # when_mentioned와 같은 형식
+            prefixes += [f"<@{self.user.id}> ", f"<@!{self.user.id}> "]
+        self.dispatcher.build(prefixes, self.all_commands.keys())
+        self._dispatcher_dirty = False
 
     async def on_ready(self):
-        self.logger.info(f"{self.user} 봇 준비 완료")
+        self.logger.info("%s 봇 준비 완료", self.user)
+        self._dispatcher_dirty = True # 멘션 접두사 추가
         await self.change_presence(
             status=discord.Status.online,
             activity=discord.Game(os.getenv("BOT_ACTIVITY")), # 봇 상태 메시지 설정
@@ -67,8 +362,62 @@ class Bot(commands.Bot):
         if message.guild is None: # DM은 무시
             return
 
+        if self._dispatcher_dirty:
+            self._rebuild_dispatcher()
+        if not self.dispatcher.match(message.content): # 명령어가 아니면 무시
+            self.rejected_messages += 1
+            return
+
+        self.dispatched_messages += 1
         await self.process_commands(message) # 명령어 처리
 
+    @tasks.loop(minutes=5)
+    async def reconcile_user_index(self):
+        """등록된 유저 인덱스를 DB와 주기적으로 맞춥니다."""
+        try:
+            await self.database.user_index.load()
+        except Exception: # 다음 주기에 다시 시도
+            self.logger.exception("Failed to reconcile registered user index")
+
+    @tasks.loop(minutes=5)
+    async def reconcile_leaderboard(self):
+        """자산 순위표를 DB와 주기적으로 맞춥니다."""
+        try:
+            await self.database.leaderboard.load()
+        except Exception: # 다음 주기에 다시 시도
+            self.logger.exception("Failed to reconcile leaderboard")
+
+    @reconcile_leaderboard.before_loop
+    async def before_reconcile_leaderboard(self):
+        await asyncio.sleep(self.reconcile_leaderboard.minutes * 60) # 시작할 때 이미 순위표를 불러옴
+
+    @tasks.loop(seconds=30)
+    async def poll_bot_setting(self):
+        """봇 설정이 바뀌었는지 주기적으로 확인합니다."""
+        try:
+            await self.bot_setting.update_if_changed()
+        except ValueError as e: # 잘못된 설정값은 무시하고 기존 설정 유지
+            self.logger.error(e)
+        except Exception: # 다음 주기에 다시 시도
+            self.logger.exception("Failed to poll bot setting")
+
+    @tasks.loop(hours=24)
+    async def compact_ledger(self):
+        """돈 스냅샷을 기록하고 스냅샷 이전의 오래된 장부를 정리합니다."""
+        try:
+            await self.database.ledger.snapshot()
+            await self.database.ledger.compact()
+        except Exception: # 다음 주기에 다시 시도
+            self.logger.exception("Failed to compact money ledger")
+
+    @compact_ledger.before_loop
+    async def before_compact_ledger(self):
+        await asyncio.sleep(60) # 시작 직후의 부하를 피함
+
+    @poll_bot_setting.before_loop
+    async def before_poll_bot_setting(self):
+        await asyncio.sleep(self.poll_bot_setting.seconds) # 시작할 때 이미 설정을 불러옴
+
     async def on_command_error(self, ctx: commands.Context["Bot"], error: commands.CommandError):
         if isinstance(error, commands.CommandNotFound): # 사용자가 잘못된 명령어를 입력했을 때
             return
@@ -77,6 +426,23 @@ class Bot(commands.Bot):
             await ctx.reply("사용자 등록을 먼저 해 주세요.")
             return
 
+        elif isinstance(error, DatabaseBusy) or isinstance(getattr(error, "original", None), DatabaseBusy):
+            await ctx.reply("요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+            self.logger.warning("Database busy: %s", self.database.pool_stats)
+            return
+
+        elif isinstance(error, UserBusy) or isinstance(getattr(error, "original", None), UserBusy):
+            await ctx.reply("이전 요청을 처리하고 있습니다. 잠시 후 다시 시도해 주세요.")
+            return
+
+        elif isinstance(error, BalanceChanged) or isinstance(getattr(error, "original", None), BalanceChanged):
+            await ctx.reply("처리하는 동안 자산이 바뀌었습니다. 다시 시도해 주세요.")
+            return
+
+        elif isinstance(error, NoFishAvailable) or isinstance(getattr(error, "original", None), NoFishAvailable):
+            await ctx.reply("잡을 수 있는 물고기가 없습니다.")
+            return
+
         elif isinstance(error, discord.DiscordServerError):
             await ctx.reply("오류가 발생했습니다.")
             self.logger.warning(error)
@@ -93,11 +459,40 @@ class Bot(commands.Bot):
             self.logger.error("Ignoring exception in command %s", ctx.command, exc_info=error)
 
     async def close(self) -> None:
+        self.reconcile_user_index.cancel()
+        self.reconcile_leaderboard.cancel()
+        self.poll_bot_setting.cancel()
+        self.compact_ledger.cancel()
+        await self.timer_wheel.close()
+        await self.edit_coalescer.close()
+        await self.sessions.close()
         if self.database is not None:
             await self.database.close()
         await super().close()
 
 
+class ShardedBot(Bot, commands.AutoShardedBot):
+    """여러 샤드를 한 프로세스에서 실행하는 봇
+
+    shard_ids를 지정하면 전체 샤드 중 일부만 실행하므로, 여러 프로세스에 샤드를 나눠 실행할 수 있습니다.
+    """
+
+    def __init__(self, shard_count: int | None = None, shard_ids: list[int] | None = None):
+        """샤드 봇
+
+        Args:
+            shard_count (int | None, optional): 전체 샤드 수, None이면 디스코드에서 권장하는 값 사용. Defaults to None.
+            shard_ids (list[int] | None, optional): 이 프로세스에서 실행할 샤드 번호 목록. Defaults to None.
+        """
+        super().__init__(shard_count=shard_count, shard_ids=shard_ids)
+
+    async def on_shard_ready(self, shard_id: int):
+        self.logger.info("Shard %s ready", shard_id)
+
+    async def on_shard_disconnect(self, shard_id: int):
+        self.logger.warning("Shard %s disconnected", shard_id)
+
+
 class Cog(commands.Cog):
     """project-d의 기반이 되는 코드 객체"""
 
@@ -107,11 +502,27 @@ class Cog(commands.Cog):
         self.bot_setting = bot.bot_setting
         self.logger = logging.getLogger(f"discord.cog.{self.__class__.__name__}")
 
-        self.bot.logger.debug(f"Cog {self.__class__.__name__} loaded")
+        self.bot.logger.debug("Cog %s loaded", self.__class__.__name__)
+
+    def export_state(self) -> dict:
+        """리로드할 때 새 Cog로 넘겨줄 상태를 반환합니다. 진행중인 게임 등 상태가 있는 Cog는 오버라이드합니다.
+
+        Returns:
+            dict: import_state로 넘겨줄 상태
+        """
+        return {}
+
+    def import_state(self, state: dict) -> None:
+        """리로드하기 전 Cog의 상태를 이어받습니다.
+
+        Args:
+            state (dict): 이전 Cog의 export_state 반환값
+        """
+        pass
 
     # 명령어가 실행되기 전 실행되는 함수
     async def cog_before_invoke(self, ctx: commands.Context[Bot]):
-        self.logger.info(f"{ctx.author}({ctx.author.id}) | {ctx.command} | {ctx.message.content}")
+        self.logger.info("%s(%s) | %s | %s", ctx.author, ctx.author.id, ctx.command, ctx.message.content)
 
 
 class HelpCommand(commands.HelpCommand):
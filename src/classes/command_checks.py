@@ -14,7 +14,7 @@ def is_registered():
         if ctx.invoked_with == "help": # help 명령어 실행시 체크 안함.
             return False
 
-        logger.debug(f"Checking if {ctx.author.id} is registered")
+        logger.debug("Checking if %s is registered", ctx.author.id)
         info = ctx.bot.database.get_user_info(ctx.author.id)
         if await info.is_valid_user():
             return True
@@ -0,0 +1,63 @@
+from itertools import islice
+from typing import Iterable
+
+_END = "" # 명령어 이름이 끝나는 노드 표시 (한 글자가 아니므로 다른 키와 겹치지 않음)
+
+
+class CommandTrie():
+    """접두사와 명령어 이름(별칭 포함)으로 만든 trie
+
+    메시지가 명령어인지 문자열 몇번만 비교해서 판단하므로,
+    명령어가 아닌 일반 채팅은 Context를 만들지 않고 바로 버릴 수 있습니다.
+    discord.py와 같이 접두사 바로 뒤부터 공백 전까지를 명령어 이름으로 봅니다.
+    """
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+        self._prefixes: tuple[str, ...] = ()
+        self._first_chars: frozenset[str] = frozenset()
+
+    def build(self, prefixes: Iterable[str], names: Iterable[str]) -> None:
+        """trie를 다시 만듭니다.
+
+        Args:
+            prefixes (Iterable[str]): 명령어 접두사 목록
+            names (Iterable[str]): 명령어 이름과 별칭 목록
+        """
+        root = {}
+        for name in names:
+            node = root
+            for char in name:
+                node = node.setdefault(char, {})
+            node[_END] = True
+
+        self._prefixes = tuple(sorted(set(prefixes), key=len, reverse=True))
+        self._first_chars = frozenset(prefix[0] for prefix in self._prefixes if prefix)
+        self._root = root
+
+    def _match_name(self, content: str, start: int) -> bool:
+        node = self._root
+        for char in islice(content, start, None):
+            if char.isspace():
+                break
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def match(self, content: str) -> bool:
+        """메시지가 명령어를 호출하는지 확인합니다.
+
+        Args:
+            content (str): 메시지 내용
+
+        Returns:
+            bool: 명령어 호출 여부
+        """
+        if not content or content[0] not in self._first_chars: # 대부분의 일반 채팅은 여기서 걸러짐
+            return False
+
+        for prefix in self._prefixes:
+            if content.startswith(prefix) and self._match_name(content, len(prefix)):
+                return True
+        return False
\ No newline at end of file
@@ -2,10 +2,12 @@ from .data_sql import DataSQL
 from .user_info import UserInfo
 from .fish_info import FishInfo
 from .bot_setting import BotSetting
+from .wallet import Wallet
 
 __all__ = [
     "DataSQL",
     "UserInfo",
     "FishInfo",
-    "BotSetting"
+    "BotSetting",
+    "Wallet"
 ]
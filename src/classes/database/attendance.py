@@ -0,0 +1,134 @@
+import time
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from src.classes.enums import UserInfoColumns, LedgerReason
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+
+logger = logging.getLogger("discord.bot.database.attendance")
+
+
+class AttendanceTracker():
+    """출석체크(돈받기) 시간을 메모리에 보관하는 쿨타임 관리자
+
+    마지막 출석체크 시간만 저장하고 쿨타임은 확인할 때마다 받으므로, attendance_cooldown 설정이 바뀌어도 바로 반영됩니다.
+    쿨타임 중인 유저는 DB를 조회하지 않고 남은 시간을 알려주며,
+    실제 출석체크는 쿨타임 확인, 돈 추가, 시간 기록을 조건부 UPDATE 하나로 처리하여 동시에 두번 받을 수 없습니다.
+    출석체크 시간은 늘어나기만 하므로, 다른 프로세스가 먼저 출석체크했다면 조건부 UPDATE가 실패하고 그때 시간을 다시 불러옵니다.
+    보관하는 유저 수는 LRU 방식으로 제한하며, 메모리에서 지워진 유저는 조건부 UPDATE로 확인합니다.
+    """
+
+    def __init__(self, database: "DataSQL", max_size: int = 65536) -> None:
+        """출석체크 쿨타임 관리자
+
+        Args:
+            database (DataSQL): 데이터베이스
+            max_size (int, optional): 출석체크 시간을 보관하는 최대 유저 수. Defaults to 65536.
+        """
+        self._database = database
+        self.max_size = max_size
+        self._check_times: OrderedDict[int, int] = OrderedDict() # 유저 아이디: 마지막 출석체크 시간 (유닉스 시간)
+
+        self.hits = 0 # DB 조회 없이 쿨타임을 확인한 횟수
+        self.claims = 0 # 출석체크 성공 횟수
+        self.conflicts = 0 # 조건부 UPDATE가 실패한 횟수
+
+    def __len__(self) -> int:
+        return len(self._check_times)
+
+    def _remember(self, user_id: int, check_time: int) -> None:
+        self._check_times[user_id] = check_time
+        self._check_times.move_to_end(user_id)
+        while len(self._check_times) > self.max_size: # 가장 오래 사용하지 않은 유저부터 제거
+            self._check_times.popitem(last=False)
+
+    def _get_check_time(self, user_id: int) -> int | None:
+        check_time = self._check_times.get(user_id)
+        if check_time is not None:
+            self._check_times.move_to_end(user_id)
+        else: # 유저 정보 캐시에 있으면 사용
+            row = self._database.user_cache.get(user_id, count=False)
+            if row is not None:
+                check_time = row[UserInfoColumns.CHECK_TIME.value]
+                self._remember(user_id, check_time)
+        return check_time
+
+    def remaining(self, user_id: int, cooldown: float) -> float | None:
+        """다음 출석체크까지 남은 시간을 메모리에서 확인합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            cooldown (float): 출석체크 쿨타임 (초)
+
+        Returns:
+            float | None: 남은 시간 (초), 0 이하면 출석체크 가능, 알 수 없으면 None
+        """
+        check_time = self._get_check_time(user_id)
+        if check_time is None:
+            return None
+
+        remaining = check_time + cooldown - time.time()
+        if remaining > 0:
+            self.hits += 1
+        return remaining
+
+    def next_time(self, user_id: int, cooldown: float) -> int | None:
+        """다음 출석체크가 가능한 시간을 반환합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            cooldown (float): 출석체크 쿨타임 (초)
+
+        Returns:
+            int | None: 다음 출석체크 시간 (유닉스 시간), 알 수 없으면 None
+        """
+        check_time = self._get_check_time(user_id)
+        return None if check_time is None else int(check_time + cooldown)
+
+    async def claim(self, user_id: int, money: int, cooldown: float) -> bool:
+        """|coro|
+        쿨타임이 지났다면 돈을 추가하고 출석체크 시간을 기록합니다. (UPDATE 하나)
+
+        Args:
+            user_id (int): 유저 아이디
+            money (int): 추가할 돈
+            cooldown (float): 출석체크 쿨타임 (초)
+
+        Returns:
+            bool: 출석체크 성공 여부, 실패하면 DB의 출석체크 시간을 다시 불러옴
+        """
+        now = int(time.time())
+        if await self._database._query(
+            "UPDATE user_info SET money=money+%s, check_time=%s WHERE id=%s AND check_time<=%s",
+            (money, now, user_id, now - cooldown)
+        ) > 0:
+            self.claims += 1
+            self._remember(user_id, now)
+            self._database.user_cache.add_money(user_id, money)
+            self._database.user_cache.update(user_id, UserInfoColumns.CHECK_TIME, now)
+            self._database.leaderboard.add(user_id, money)
+            self._database.record_money(user_id, money, LedgerReason.ATTENDANCE)
+            return True
+
+        self.conflicts += 1
+        result = await self._database._query("SELECT check_time FROM user_info WHERE id=%s", (user_id,), fetch=True)
+        if len(result) == 0: # 삭제된 유저
+            self._check_times.pop(user_id, None)
+            self._database.user_cache.invalidate(user_id)
+        else:
+            check_time = int(result[0][0])
+            self._remember(user_id, check_time)
+            self._database.user_cache.update(user_id, UserInfoColumns.CHECK_TIME, check_time)
+        logger.debug("Attendance claim of user %s rejected by database", user_id)
+        return False
+
+    def forget(self, user_id: int) -> None:
+        """유저의 출석체크 시간을 메모리에서 제거합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+        """
+        self._check_times.pop(user_id, None)
\ No newline at end of file
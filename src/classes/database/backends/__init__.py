@@ -0,0 +1,10 @@
+from .base import StorageBackend, BackendConnection
+from .mysql import MySQLBackend
+from .sqlite import SQLiteBackend
+
+__all__ = [
+    "StorageBackend",
+    "BackendConnection",
+    "MySQLBackend",
+    "SQLiteBackend"
+]
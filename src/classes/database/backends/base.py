@@ -0,0 +1,101 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Sequence
+
+
+class BackendConnection(ABC):
+    """저장소 커넥션 하나를 감싸는 클래스
+
+    쿼리는 MySQL 형식(%s 인자)으로 작성하며, 각 저장소가 알맞게 변환합니다.
+    """
+
+    @abstractmethod
+    async def execute(self, query: str, args: Sequence | None = None, fetch: bool = False) -> list | int:
+        """|coro|
+        쿼리를 실행합니다.
+
+        Args:
+            query (str): 쿼리문
+            args (Sequence | None, optional): 쿼리 인자. Defaults to None.
+            fetch (bool, optional): 결과를 조회할지 여부. Defaults to False.
+
+        Returns:
+            list | int: fetch가 True면 조회된 데이터, 아니면 변경된 행 수
+        """
+
+    @abstractmethod
+    async def executemany(self, query: str, args: list[Sequence]) -> int:
+        """|coro|
+        같은 쿼리를 여러 인자로 실행합니다.
+
+        Args:
+            query (str): 쿼리문
+            args (list[Sequence]): 쿼리 인자 목록
+
+        Returns:
+            int: 변경된 행 수
+        """
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """|coro|
+        트랜잭션을 되돌립니다. 되돌린 트랜잭션은 끝날 때 반영되지 않습니다.
+        """
+
+
+class StorageBackend(ABC):
+    """DataSQL이 사용하는 저장소의 기반 클래스"""
+
+    name: str = "storage"
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """저장소에 연결되어 있는지 여부를 반환합니다."""
+
+    @property
+    @abstractmethod
+    def stats(self) -> dict[str, int | float]:
+        """커넥션 사용 통계를 반환합니다.
+        in_use, maxsize, waiters, average_wait_ms 값을 포함합니다.
+        """
+
+    @abstractmethod
+    async def connect(self) -> bool:
+        """|coro|
+        저장소에 연결합니다.
+
+        Returns:
+            bool: 연결 성공 여부
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """|coro|
+        저장소 연결을 닫습니다.
+        """
+
+    @abstractmethod
+    def connection(self) -> AsyncContextManager[BackendConnection]:
+        """자동으로 반영되는 커넥션을 가져옵니다."""
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[BackendConnection]:
+        """트랜잭션을 시작합니다.
+        블록이 정상적으로 끝나면 반영하고, 예외가 발생하면 되돌립니다.
+        """
+
+    async def table_checksum(self, table: str) -> int | None:
+        """|coro|
+        테이블 내용의 체크섬을 반환합니다.
+        기본 구현은 테이블 전체를 조회하므로 작은 테이블에만 사용합니다.
+
+        Args:
+            table (str): 테이블 이름
+
+        Returns:
+            int | None: 체크섬
+        """
+        async with self.connection() as conn:
+            rows = await conn.execute(f"SELECT * FROM {table}", fetch=True)
+        return zlib.crc32(repr(sorted(map(tuple, rows))).encode())
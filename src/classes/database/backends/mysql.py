@@ -0,0 +1,194 @@
+import time
+import asyncio
+import aiomysql
+import logging
+from contextlib import asynccontextmanager
+from typing import Sequence
+
+from .base import StorageBackend, BackendConnection
+from ..pool_metrics import PoolMetrics
+from src.classes.errors import DatabaseBusy
+
+logger = logging.getLogger("discord.bot.database.mysql")
+
+
+class MySQLConnection(BackendConnection):
+    def __init__(self, conn: aiomysql.Connection, cur: aiomysql.Cursor) -> None:
+        self._conn = conn
+        self._cur = cur
+        self.rolled_back = False
+
+    async def execute(self, query: str, args: Sequence | None = None, fetch: bool = False) -> list | int:
+        rowcount = await self._cur.execute(query, args)
+        return await self._cur.fetchall() if fetch else rowcount
+
+    async def executemany(self, query: str, args: list[Sequence]) -> int:
+        return await self._cur.executemany(query, args)
+
+    async def rollback(self) -> None:
+        await self._conn.rollback()
+        self.rolled_back = True
+
+    async def ping(self) -> None:
+        """|coro|
+        커넥션이 살아있는지 확인합니다. 끊겼다면 다시 연결하지 않고 예외를 발생시킵니다.
+        """
+        await self._conn.ping(reconnect=False)
+
+
+class MySQLBackend(StorageBackend):
+    """aiomysql 커넥션 풀을 사용하는 저장소"""
+
+    name = "mysql"
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        database: str,
+        loop: asyncio.AbstractEventLoop = None,
+        minsize: int = 1,
+        maxsize: int = 10,
+        pool_recycle: int = 3600,
+        acquire_timeout: float | None = None,
+        max_waiters: int | None = None
+    ) -> None:
+        """MySQL 저장소
+
+        Args:
+            host (str): 호스트
+            port (int): 포트
+            user (str): user 이름
+            password (str): 접속 비밀번호
+            database (str): 접속할 데이터베이스 이름.
+            loop (asyncio.AbstractEventLoop, optional): 비동기 작업을 위한 eventloop Defaults to None.
+            minsize (int, optional): 시작할 때 미리 열어둘 커넥션 수. Defaults to 1.
+            maxsize (int, optional): 최대 커넥션 수. Defaults to 10.
+            pool_recycle (int, optional): 커넥션을 다시 여는 주기 (초), -1이면 다시 열지 않음. Defaults to 3600.
+            acquire_timeout (float | None, optional): 커넥션을 기다리는 최대 시간 (초). Defaults to None.
+            max_waiters (int | None, optional): 커넥션을 기다릴 수 있는 최대 작업 수. Defaults to None.
+        """
+        self.host = host
+        self.port = int(port)
+        self.user = user
+        self._password = password
+        self.database = database
+        self.loop = loop
+
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.pool_recycle = pool_recycle
+        self.acquire_timeout = acquire_timeout
+        self.max_waiters = max_waiters
+
+        self.pool: aiomysql.Pool | None = None
+        self.metrics = PoolMetrics() # 커넥션 풀 사용 현황
+
+    @property
+    def connected(self) -> bool:
+        return self.pool is not None
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        return self.metrics.snapshot(self.pool)
+
+    async def connect(self) -> bool:
+        try:
+            self.pool = await aiomysql.create_pool(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self._password,
+                db=self.database,
+                loop=self.loop,
+                autocommit=True,
+                minsize=self.minsize,
+                maxsize=self.maxsize,
+                pool_recycle=self.pool_recycle
+            )
+        except aiomysql.MySQLError as e:
+            self.pool = None
+            logger.error("Database connection failed: %s", e)
+            return False
+
+        logger.info("Database connection established (pool %s/%s)", self.pool.size, self.pool.maxsize)
+        return True
+
+    async def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+
+    @asynccontextmanager
+    async def _acquire(self):
+        """풀에서 커넥션을 가져옵니다.
+        기다리는 작업이 너무 많거나 시간이 초과되면 DatabaseBusy 예외를 발생시킵니다.
+        """
+        metrics = self.metrics
+        if self.max_waiters is not None and metrics.waiters >= self.max_waiters:
+            metrics.rejections += 1
+            raise DatabaseBusy("데이터베이스 커넥션 대기열이 가득 찼습니다.")
+
+        start = time.perf_counter()
+        metrics.enter_wait()
+        try:
+            async with asyncio.timeout(self.acquire_timeout): # wait_for는 시간 초과와 동시에 받은 커넥션을 반환하지 않을 수 있음
+                conn = await self.pool.acquire()
+        except TimeoutError:
+            metrics.timeouts += 1
+            raise DatabaseBusy("데이터베이스 커넥션을 기다리는 시간이 초과되었습니다.") from None
+        finally:
+            metrics.exit_wait()
+        metrics.record_acquire(time.perf_counter() - start)
+
+        try:
+            yield conn
+        finally:
+            self.pool.release(conn)
+
+    @asynccontextmanager
+    async def dedicated_connection(self):
+        """풀과 별도로 커넥션 하나를 엽니다.
+        GET_LOCK처럼 커넥션에 묶이는 상태를 오래 유지할 때 사용하며, 풀의 커넥션 수를 줄이지 않습니다.
+        """
+        conn = await aiomysql.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self._password,
+            db=self.database,
+            loop=self.loop,
+            autocommit=True
+        )
+        try:
+            async with conn.cursor() as cur:
+                yield MySQLConnection(conn, cur)
+        finally:
+            conn.close()
+
+    @asynccontextmanager
+    async def connection(self):
+        async with self._acquire() as conn: # poll에 접속
+            async with conn.cursor() as cur:
+                yield MySQLConnection(conn, cur)
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with self._acquire() as conn:
+            async with conn.cursor() as cur:
+                await conn.begin()
+                tx = MySQLConnection(conn, cur)
+                try:
+                    yield tx
+                except BaseException:
+                    await conn.rollback()
+                    raise
+                if not tx.rolled_back:
+                    await conn.commit()
+
+    async def table_checksum(self, table: str) -> int | None:
+        async with self.connection() as conn:
+            return (await conn.execute(f"CHECKSUM TABLE {table}", fetch=True))[0][1]
@@ -0,0 +1,169 @@
+import os
+import time
+import asyncio
+import sqlite3
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Sequence
+
+from .base import StorageBackend, BackendConnection
+from ..pool_metrics import PoolMetrics
+
+logger = logging.getLogger("discord.bot.database.sqlite")
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS user_info (
+        id INTEGER PRIMARY KEY,
+        money INTEGER NOT NULL DEFAULT 0,
+        check_time INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS fish_info (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        rating INTEGER NOT NULL,
+        min_length INTEGER NOT NULL,
+        max_length INTEGER NOT NULL,
+        default_price INTEGER NOT NULL,
+        const_value REAL NOT NULL,
+        description TEXT NOT NULL DEFAULT ''
+    )""",
+    """CREATE TABLE IF NOT EXISTS bot_setting (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )""",
+)
+
+class SQLiteConnection(BackendConnection):
+    def __init__(self, backend: "SQLiteBackend") -> None:
+        self._backend = backend
+        self.rolled_back = False
+
+    async def execute(self, query: str, args: Sequence | None = None, fetch: bool = False) -> list | int:
+        return await self._backend._run(self._backend._execute, query, args, fetch)
+
+    async def executemany(self, query: str, args: list[Sequence]) -> int:
+        return await self._backend._run(self._backend._executemany, query, args)
+
+    async def rollback(self) -> None:
+        await self._backend._run(self._backend._conn.execute, "ROLLBACK")
+        self.rolled_back = True
+
+
+class SQLiteBackend(StorageBackend):
+    """내장 SQLite를 사용하는 저장소
+
+    MySQL 서버 없이 실행할 수 있으며, 처음 연결할 때 테이블을 직접 만듭니다.
+    하나의 커넥션을 전용 스레드에서 사용하고, 쿼리는 순서대로 실행됩니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """SQLite 저장소
+
+        Args:
+            path (str, optional): 데이터베이스 파일 경로, :memory:면 메모리에만 저장. Defaults to ":memory:".
+        """
+        self.path = path
+
+        self._conn: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = asyncio.Lock()
+        self._queries: dict[str, str] = {} # MySQL 형식 쿼리: SQLite 형식 쿼리
+        self.metrics = PoolMetrics() # 커넥션 사용 현황
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        result = self.metrics.snapshot()
+        result["in_use"] = int(self._lock.locked())
+        result["maxsize"] = 1
+        return result
+
+    def _translate(self, query: str) -> str:
+        translated = self._queries.get(query)
+        if translated is None:
+            translated = self._queries[query] = query.replace("%s", "?")
+        return translated
+
+    def _execute(self, query: str, args: Sequence | None, fetch: bool) -> list | int:
+        cur = self._conn.execute(self._translate(query), tuple(args) if args is not None else ())
+        return cur.fetchall() if fetch else cur.rowcount
+
+    def _executemany(self, query: str, args: list[Sequence]) -> int:
+        return self._conn.executemany(self._translate(query), args).rowcount
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open(self) -> None:
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        if self.path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+        for statement in SCHEMA:
+            conn.execute(statement)
+        self._conn = conn
+
+    async def connect(self) -> bool:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        try:
+            await self._run(self._open)
+        except sqlite3.Error as e:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            logger.error("Database connection failed: %s", e)
+            return False
+
+        logger.info("Database connection established (sqlite: %s)", self.path)
+        return True
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            async with self._lock:
+                await self._run(self._conn.close)
+                self._conn = None
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @asynccontextmanager
+    async def _acquire(self):
+        start = time.perf_counter()
+        self.metrics.enter_wait()
+        try:
+            await self._lock.acquire()
+        finally:
+            self.metrics.exit_wait()
+        self.metrics.record_acquire(time.perf_counter() - start)
+
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        async with self._acquire():
+            yield SQLiteConnection(self)
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with self._acquire():
+            await self._run(self._conn.execute, "BEGIN IMMEDIATE")
+            tx = SQLiteConnection(self)
+            try:
+                yield tx
+            except BaseException:
+                if not tx.rolled_back:
+                    await self._run(self._conn.execute, "ROLLBACK")
+                raise
+            if not tx.rolled_back:
+                await self._run(self._conn.execute, "COMMIT")
@@ -27,17 +27,69 @@ class BotSetting():
     def __init__(self, database: "DataSQL") -> None:
         self._database = database
         self._settings: BotSettingColumns = {}
+        self._checksum: int | None = None
+        self.version = 0 # 설정이 바뀔 때마다 증가
 
-    async def update_setting(self):
+    def _parse_settings(self, rows: list[tuple]) -> BotSettingColumns:
+        """조회한 (name, value) 목록을 BotSettingColumns의 타입에 맞게 변환합니다.
+
+        Args:
+            rows (list[tuple]): (name, value) 목록
+
+        Raises:
+            ValueError: 설정이 없거나 타입에 맞지 않을 때
+
+        Returns:
+            BotSettingColumns: 변환된 설정
+        """
+        values = dict(rows)
+        settings: BotSettingColumns = {}
+        for _name, _type in BotSettingColumns.__annotations__.items():
+            if _name not in values:
+                raise ValueError(f"bot_setting에 {_name} 설정이 없습니다.")
+            try:
+                settings[_name] = _type(values[_name])
+            except (TypeError, ValueError):
+                raise ValueError(f"bot_setting의 {_name} 설정값 {values[_name]!r}은(는) {_type.__name__} 타입이 아닙니다.") from None
+        return settings
+
+    async def _get_checksum(self) -> int | None:
+        return await self._database.backend.table_checksum("bot_setting")
+
+    async def update_setting(self) -> bool:
         """|coro|
-        봇 설정을 업데이트합니다.
+        봇 설정을 한번에 조회하여 업데이트합니다.
+        설정값이 올바르지 않으면 기존 설정을 유지합니다.
+
+        Raises:
+            ValueError: 설정이 없거나 타입에 맞지 않을 때
+
+        Returns:
+            bool: 설정이 바뀌었는지 여부
         """
-        async def get_setting(name: str): 
-            return (await self._database.select(table="bot_setting", columns=["value"], condition={"name": name}))[0][0]
         logger.debug("Updating bot setting")
+        checksum = await self._get_checksum()
+        rows = await self._database._query("SELECT name, value FROM bot_setting", fetch=True)
+        settings = self._parse_settings(rows)
+
+        changed = [name for name, value in settings.items() if self._settings.get(name) != value]
+        self._settings = settings
+        self._checksum = checksum
+        if changed:
+            self.version += 1
+            logger.info("Bot setting updated (version %s): %s", self.version, ', '.join(changed))
+        return len(changed) > 0
+
+    async def update_if_changed(self) -> bool:
+        """|coro|
+        테이블의 체크섬이 바뀌었을 때만 봇 설정을 업데이트합니다.
 
-        for _name, _type in BotSettingColumns.__annotations__.items():
-            self._settings[_name] = _type(await get_setting(_name))
+        Returns:
+            bool: 설정이 바뀌었는지 여부
+        """
+        if self._checksum is not None and await self._get_checksum() == self._checksum:
+            return False
+        return await self.update_setting()
 
     @property
     def attendance_cooldown(self) -> int:
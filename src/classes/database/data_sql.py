@@ -1,83 +1,144 @@
 import discord
 
-import asyncio
-import aiomysql
+import time
 import logging
 
 from .user_info import UserInfo
 from .fish_info import FishInfo
 from .bot_setting import BotSetting
+from .wallet import Wallet
+from .user_cache import UserCache
+from .user_index import RegisteredUserIndex
+from .leaderboard import Leaderboard
+from .attendance import AttendanceTracker
+from .write_behind import MoneyWriteBehind
+from .ledger import MoneyLedger
+from .statement_cache import StatementCache
+from .query_stats import QueryStats
+from .backends import StorageBackend, BackendConnection
+from src.classes.enums import UserInfoColumns, LedgerReason
 
 logger = logging.getLogger("discord.bot.database")
+query_logger = logging.getLogger("discord.bot.database.query") # 쿼리 디버그 로그 (샘플링 대상)
 
 
 class DataSQL():
     """데이터베이스 클래스"""
 
-    def __init__(self, host: str, port: int, loop: asyncio.AbstractEventLoop = None):
+    def __init__(
+        self,
+        backend: StorageBackend,
+        cache_size: int = 4096,
+        cache_ttl: float = 300,
+        write_behind: bool = False,
+        write_behind_interval: float = 0.05,
+        slow_query_ms: float = 200,
+        ledger: bool = False,
+        ledger_interval: float = 1.0,
+        ledger_retention_days: int = 30
+    ):
         """데이터베이스
 
         Args:
-            host (str): 호스트
-            port (int): 포트
-            loop (asyncio.AbstractEventLoop, optional): 비동기 작업을 위한 eventloop Defaults to None.
+            backend (StorageBackend): 사용할 저장소 (MySQLBackend, SQLiteBackend)
+            cache_size (int, optional): 유저 정보 캐시의 최대 크기. Defaults to 4096.
+            cache_ttl (float, optional): 유저 정보 캐시의 유지 시간 (초). Defaults to 300.
+            write_behind (bool, optional): 돈 추가를 모아서 반영할지 여부. Defaults to False.
+            write_behind_interval (float, optional): 모아둔 돈 추가를 반영하는 주기 (초). Defaults to 0.05.
+            slow_query_ms (float, optional): 느린 쿼리로 기록할 실행 시간 (ms). Defaults to 200.
+            ledger (bool, optional): 돈 변경 내역을 장부에 기록할지 여부. Defaults to False.
+            ledger_interval (float, optional): 모아둔 장부 내역을 DB에 추가하는 주기 (초). Defaults to 1.0.
+            ledger_retention_days (int, optional): 스냅샷 이전의 장부를 보관하는 기간 (일). Defaults to 30.
         """
-        self.host = host
-        self.port = int(port)
-        self.loop = loop
+        self.backend = backend
+
+        self.statements = StatementCache() # 쿼리문 캐시
+        self.query_stats = QueryStats(slow_query_ms) # 쿼리 실행 통계
+        self.user_cache = UserCache(max_size=cache_size, ttl=cache_ttl) # 유저 정보 캐시
+        self.user_index = RegisteredUserIndex(self) # 등록된 유저 인덱스
+        self.fish_info = FishInfo(self) # 물고기 정보
+        self.leaderboard = Leaderboard(self) # 자산 순위표
+        self.attendance = AttendanceTracker(self) # 출석체크 쿨타임
+        self.write_behind = MoneyWriteBehind(self, write_behind_interval) if write_behind else None # 돈 추가 쓰기 지연 큐
+        self.ledger = MoneyLedger(self, ledger_interval, ledger_retention_days) if ledger else None # 돈 변경 장부
+
+    @property
+    def connected(self) -> bool:
+        """저장소에 연결되어 있는지 여부를 반환합니다.
 
-        self.pool = None
-
-    async def auth(self, user: str, password: str, database: str, autocommit: bool = True) -> bool:
-        """mysql서버에 접속합니다.
+        Returns:
+            bool: 연결 여부
+        """
+        return self.backend.connected
 
-        Args:
-            user (str): user 이름
-            password (str): 접속 비밀번호
-            database (str): 접속할 데이터베이스 이름.
-            autocommit (bool, optional): 변경내용 자동반영. Defaults to True.
+    async def connect(self) -> bool:
+        """|coro|
+        저장소에 연결합니다.
 
         Return:
             bool: 접속 성공 여부.
         """
-
-        try:
-            self.pool: aiomysql.Pool = await aiomysql.create_pool(
-                host=self.host,
-                port=self.port,
-                user=user,
-                password=password,
-                db=database,
-                loop=self.loop,
-                autocommit=autocommit
-            )
-        except aiomysql.MySQLError as e:
-            self.pool = None
-            logger.error(f"Database connection failed: {e}")
+        if not await self.backend.connect():
             return False
-        else:
-            logger.info("Database connection established")
-            return True
+
+        if self.write_behind is not None:
+            self.write_behind.start()
+        if self.ledger is not None:
+            await self.ledger.setup()
+        return True
 
     async def close(self) -> bool:
-        if self.pool is not None:
-            self.pool.close()
-            await self.pool.wait_closed()
+        if self.connected:
+            if self.write_behind is not None:
+                await self.write_behind.close() # 남은 변경 내용 반영
+            if self.ledger is not None:
+                await self.ledger.close() # 남은 장부 내역 추가
+            await self.backend.close()
 
             logger.info("Database connection closed")
             return True
         return False
 
-    async def _query(self, query: str, args: tuple = None, fetch: bool = False) -> list | None:
-        logger.debug(f"Query: {query}, Args: {args}")
+    @property
+    def pool_stats(self) -> dict[str, int | float]:
+        """커넥션 풀 통계를 반환합니다.
+
+        Returns:
+            dict[str, int | float]: 통계
+        """
+        return self.backend.stats
+
+    def record_money(self, user_id: int, amount: int, reason: LedgerReason) -> None:
+        """돈 변경 내역을 장부에 기록합니다. 장부를 사용하지 않으면 아무것도 하지 않습니다.
+        DB에 반영한 뒤에 호출하며, 캐시된 유저라면 바뀐 뒤의 돈도 같이 기록합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            amount (int): 바뀐 돈 (음수면 차감)
+            reason (LedgerReason): 바뀐 이유
+        """
+        if self.ledger is None or amount == 0:
+            return
+        row = self.user_cache.get(user_id, count=False)
+        self.ledger.record(user_id, amount, reason, None if row is None else row[UserInfoColumns.MONEY.value])
+
+    async def _execute(self, conn: BackendConnection, query: str, args: tuple = None, fetch: bool = False) -> list | int:
+        """|coro|
+        커넥션으로 쿼리를 실행하고 실행 시간을 기록합니다.
+
+        Returns:
+            list | int: fetch가 True면 조회된 데이터, 아니면 변경된 행 수
+        """
+        start = time.perf_counter()
+        result = await conn.execute(query, args, fetch)
+        self.query_stats.record(query, args, time.perf_counter() - start, len(result) if fetch else result)
+        return result
 
-        async with self.pool.acquire() as conn: # poll에 접속
-            async with conn.cursor() as cur:
-                await cur.execute(query, args)
-                if fetch:
-                    return await cur.fetchall()
-                else:
-                    return None
+    async def _query(self, query: str, args: tuple = None, fetch: bool = False) -> list | int:
+        query_logger.debug("Query: %s, Args: %s", query, args)
+
+        async with self.backend.connection() as conn:
+            return await self._execute(conn, query, args, fetch) # fetch가 False면 변경된 행 수
 
     async def select(self, table: str, columns: list[str] = None, condition: dict = None) -> list:
         """|coro|
@@ -91,14 +152,11 @@ class DataSQL():
         Returns:
             list: 조회된 데이터
         """
-        if columns is None:
-            columns = "*"
-        query = f"SELECT {','.join(columns)} FROM {table}"
-        if condition is not None:
-            query += f" WHERE {' AND '.join([f'{k}=%s' for k in condition.keys()])}"
-        return await self._query(query, tuple(condition.values()), fetch=True)
+        condition = condition or {}
+        query = self.statements.get("select", table, ("*",) if columns is None else tuple(columns), tuple(condition))
+        return await self._query(query, tuple(condition.values()) or None, fetch=True)
 
-    async def update(self, table: str, data: dict, condition: dict = None) -> None:
+    async def update(self, table: str, data: dict, condition: dict = None, all_rows: bool = False) -> None:
         """|coro|
         테이블의 데이터를 업데이트합니다.
 
@@ -106,26 +164,35 @@ class DataSQL():
             table (str): 테이블 이름
             data (dict): 업데이트할 데이터
             condition (dict, optional): 조건. Defaults to None.
+            all_rows (bool, optional): 조건 없이 모든 행을 업데이트할지 여부. Defaults to False.
+
+        Raises:
+            ValueError: all_rows 없이 조건이 비어있을 때
         """
-        query = f"UPDATE {table} SET {','.join([f'{k}=%s' for k in data.keys()])}"
-        if condition is not None:
-            query += f" WHERE {' AND '.join([f'{k}=%s' for k in condition.keys()])}"
+        if not condition and not all_rows:
+            raise ValueError("조건 없이 모든 행을 업데이트하려면 all_rows=True를 지정해야 합니다.")
+        condition = condition or {}
+        query = self.statements.get("update", table, tuple(data), tuple(condition))
         args = tuple(data.values()) + tuple(condition.values())
         return await self._query(query, args)
 
-    async def delete(self, table: str, condition: dict = None) -> None:
+    async def delete(self, table: str, condition: dict = None, all_rows: bool = False) -> None:
         """|coro|
         테이블의 데이터를 삭제합니다.
 
         Args:
             table (str): 테이블 이름
             condition (dict, optional): 조건. Defaults to None.
+            all_rows (bool, optional): 조건 없이 모든 행을 삭제할지 여부. Defaults to False.
+
+        Raises:
+            ValueError: all_rows 없이 조건이 비어있을 때
         """
-        query = f"DELETE FROM {table}"
-        if condition is not None:
-            query += f" WHERE {' AND '.join([f'{k}=%s' for k in condition.keys()])}"
-        args = tuple(condition.values()) if condition is not None else None
-        return await self._query(query, args)
+        if not condition and not all_rows:
+            raise ValueError("조건 없이 모든 행을 삭제하려면 all_rows=True를 지정해야 합니다.")
+        condition = condition or {}
+        query = self.statements.get("delete", table, keys=tuple(condition))
+        return await self._query(query, tuple(condition.values()) or None)
 
     async def insert(self, table: str, data: dict) -> None:
         """|coro|
@@ -135,9 +202,8 @@ class DataSQL():
             table (str): 테이블 이름
             data (dict): 추가할 데이터
         """
-        query = f"INSERT INTO {table} ({','.join(data.keys())}) VALUES ({','.join(['%s'] * len(data))})"
-        args = tuple(data.values())
-        return await self._query(query, args)
+        query = self.statements.get("insert", table, tuple(data))
+        return await self._query(query, tuple(data.values()))
 
     async def count(self, table: str, condition: dict = None) -> int:
         """|coro|
@@ -150,11 +216,55 @@ class DataSQL():
         Returns:
             int: 데이터 개수
         """
-        query = f"SELECT COUNT(*) FROM {table}"
-        if condition is not None:
-            query += f" WHERE {' AND '.join([f'{k}=%s' for k in condition.keys()])}"
-        args = tuple(condition.values()) if condition is not None else None
-        return (await self._query(query, args, fetch=True))[0][0]
+        condition = condition or {}
+        query = self.statements.get("count", table, keys=tuple(condition))
+        return (await self._query(query, tuple(condition.values()) or None, fetch=True))[0][0]
+
+    async def transfer(self, from_id: int, to_id: int, amount: int) -> tuple[int, int] | None:
+        """|coro|
+        한 유저의 돈을 다른 유저에게 보냅니다.
+        하나의 트랜잭션에서 잔액이 충분할 때만 차감하므로, 동시에 송금해도 잔액이 음수가 되지 않습니다.
+
+        Args:
+            from_id (int): 보내는 유저 아이디
+            to_id (int): 받는 유저 아이디
+            amount (int): 보낼 돈
+
+        Raises:
+            ValueError: 보낼 돈이 0원 이하일 때
+
+        Returns:
+            tuple[int, int] | None: (보낸 유저의 돈, 받은 유저의 돈), 잔액이 부족하거나 받는 유저가 없으면 None
+        """
+        if amount <= 0: # 음수면 받는 유저의 돈을 가져오게 됨
+            raise ValueError(f"송금 금액은 1원 이상이어야 합니다. (amount={amount})")
+        logger.debug("Transfer: %s -> %s, Amount: %s", from_id, to_id, amount)
+        if self.write_behind is not None:
+            await self.write_behind.flush_user(from_id, to_id) # 잔액 확인 전에 두 유저의 모아둔 변경 내용 반영
+
+        async with self.backend.transaction() as tx:
+            if await self._execute(
+                tx,
+                "UPDATE user_info SET money=money-%s WHERE id=%s AND money>=%s",
+                (amount, from_id, amount)
+            ) == 0: # 잔액 부족
+                await tx.rollback()
+                return None
+
+            if await self._execute(tx, "UPDATE user_info SET money=money+%s WHERE id=%s", (amount, to_id)) == 0:
+                await tx.rollback() # 받는 유저가 없음
+                return None
+
+            result = await self._execute(tx, "SELECT id, money FROM user_info WHERE id IN (%s, %s)", (from_id, to_id), fetch=True)
+            balances = {int(id): int(money) for id, money in result}
+
+        self.user_cache.update(from_id, UserInfoColumns.MONEY, balances[from_id])
+        self.user_cache.update(to_id, UserInfoColumns.MONEY, balances[to_id])
+        self.leaderboard.set(from_id, balances[from_id])
+        self.leaderboard.set(to_id, balances[to_id])
+        self.record_money(from_id, -amount, LedgerReason.TRANSFER)
+        self.record_money(to_id, amount, LedgerReason.TRANSFER)
+        return balances[from_id], balances[to_id]
 
     def get_user_info(self, user: int | discord.User | discord.Member) -> "UserInfo":
         """유저 정보를 생성합니다.
@@ -167,13 +277,24 @@ class DataSQL():
         """
         return UserInfo(self, user)
 
+    def get_wallet(self, user: int | discord.User | discord.Member) -> "Wallet":
+        """유저의 돈을 다루는 작업 단위를 생성합니다.
+
+        Args:
+            user (int | discord.User | discord.Member): 유저 아이디
+
+        Returns:
+            Wallet: 지갑
+        """
+        return Wallet(self, user if isinstance(user, int) else user.id)
+
     def get_fish_info(self) -> "FishInfo":
-        """물고기 정보를 생성합니다.
+        """미리 불러온 물고기 정보를 반환합니다.
 
         Returns:
             FishInfo: 물고기 정보
         """
-        return FishInfo(self)
+        return self.fish_info
 
     async def get_bot_setting(self) -> "BotSetting":
         """|coro|
@@ -1,8 +1,12 @@
+import numpy as np
+
 import random
 import logging
 from typing import TYPE_CHECKING
 
-from src.classes.enums import FishRating, fish_kor_name
+from src.classes.enums import FishRating, FishInfoColumns, fish_kor_name
+from src.classes.errors import NoFishAvailable
+from src.utils.random_utils import AliasTable
 
 if TYPE_CHECKING:
     from .data_sql import DataSQL
@@ -20,7 +24,9 @@ class Fish():
         max_length: int, # 최대길이
         default_price: int, # 기본가격
         const_value: float, # 기본가격에 곱할 상수
-        description: str # 물고기 설명
+        description: str, # 물고기 설명
+        length: int | None = None, # 물고기 길이, None이면 랜덤으로 정함
+        price: int | None = None # 물고기 가격, None이면 길이로 계산함
 ) -> None:
         self._id = id
         self._name = name
@@ -31,8 +37,8 @@ class Fish():
         self._const_value = const_value
         self._description = description
 
-        self._length = random.randint(self._min_length, self._max_length)
-        self._price = round((self._default_price * self._length) * self._const_value)
+        self._length = random.randint(self._min_length, self._max_length) if length is None else length
+        self._price = round((self._default_price * self._length) * self._const_value) if price is None else price
 
     @property
     def id(self) -> int:
@@ -114,42 +120,175 @@ class Fish():
         return self._description
 
 
+class FishBatchTable():
+    """물고기 목록을 NumPy 배열로 바꿔 많은 물고기를 한번에 뽑는 테이블
+
+    등급, 종류, 길이, 가격을 배열 연산 한번으로 계산하며, 확률과 가격은 Fish와 같은 규칙을 따릅니다.
+    """
+
+    def __init__(self, catalog: dict[FishRating, list[tuple]], grade_prob: dict[FishRating, float]) -> None:
+        """물고기 일괄 선택 테이블
+
+        Args:
+            catalog (dict[FishRating, list[tuple]]): 등급별 물고기 행 목록
+            grade_prob (dict[FishRating, float]): 등급별 확률 (%)
+
+        Raises:
+            ValueError: 잡을 수 있는 물고기가 없을 때
+        """
+        grades = [grade for grade in grade_prob if catalog.get(grade) and grade_prob[grade] > 0]
+        if not grades:
+            raise ValueError("잡을 수 있는 물고기가 없습니다.")
+
+        self.rows = [row for grade in grades for row in catalog[grade]] # 등급 순서대로 이어붙인 물고기 목록
+        counts = np.array([len(catalog[grade]) for grade in grades])
+        weights = np.array([grade_prob[grade] for grade in grades], dtype=np.float64)
+        self._grade_cumulative = np.cumsum(weights / weights.sum())
+        self._grade_cumulative[-1] = 1.0
+        self._grade_offset = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        self._grade_count = counts
+
+        columns = list(zip(*self.rows))
+        self._min_length = np.array(columns[FishInfoColumns.MIN_LENGTH.value], dtype=np.int64)
+        self._max_length = np.array(columns[FishInfoColumns.MAX_LENGTH.value], dtype=np.int64)
+        self._default_price = np.array(columns[FishInfoColumns.DEFAULT_PRICE.value], dtype=np.int64)
+        self._const_value = np.array(columns[FishInfoColumns.CONST_VALUE.value], dtype=np.float64)
+
+    def sample(self, rng: np.random.Generator, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """물고기 n마리를 한번에 뽑습니다.
+
+        Args:
+            rng (np.random.Generator): 난수 생성기
+            n (int): 물고기 수
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: (rows의 인덱스, 길이, 가격) 배열
+        """
+        grade = np.searchsorted(self._grade_cumulative, rng.random(n), side="right") # 등급 선택
+        index = self._grade_offset[grade] + (rng.random(n) * self._grade_count[grade]).astype(np.int64) # 등급 안에서 종류 선택
+        length = rng.integers(self._min_length[index], self._max_length[index] + 1)
+        price = np.round((self._default_price[index] * length) * self._const_value[index]).astype(np.int64)
+        return index, length, price
+
+
 class FishInfo():
+    grade_prob = { # 물고기 등급 확률
+        FishRating.COMMON: 62.825,
+        FishRating.UNCOMMON: 30,
+        FishRating.RARE: 5,
+        FishRating.EPIC: 2,
+        FishRating.LEGENDARY: 0.1,
+        FishRating.MYTHIC: 0.025,
+    }
+
     def __init__(self, database: "DataSQL") -> None:
         self._database = database
 
-    def _return_value(self, result: list[tuple]) -> list[Fish]:
-        return [Fish(
-            id=int(row[0]),
-            name=row[1],
-            rating=int(row[2]),
-            min_length=int(row[3]),
-            max_length=int(row[4]),
-            default_price=int(row[5]),
-            const_value=float(row[6]),
-            description=row[7]
-        ) for row in result]
+        self._catalog: dict[FishRating, list[tuple]] = {} # 등급별 물고기 목록
+        self._grades: list[FishRating] = []
+        self._grade_table: AliasTable | None = None # 등급 선택 테이블, 잡을 수 있는 물고기가 없으면 None
+        self._batch_table: FishBatchTable | None = None # 여러 마리를 한번에 뽑는 테이블
+        self._loaded = False
+        self._rng = np.random.default_rng()
 
-    def _choose_grade(self) -> FishRating:
-        grade_prob = { # 물고기 등급 확률
-            FishRating.COMMON: 62.825,
-            FishRating.UNCOMMON: 30,
-            FishRating.RARE: 5,
-            FishRating.EPIC: 2,
-            FishRating.LEGENDARY: 0.1,
-            FishRating.MYTHIC: 0.025,
-        }
-        return random.choices(list(grade_prob.keys()), weights=grade_prob.values())[0]
+    def _parse_row(self, row: tuple) -> tuple:
+        return (
+            int(row[0]), # id
+            row[1], # name
+            int(row[2]), # rating
+            int(row[3]), # min_length
+            int(row[4]), # max_length
+            int(row[5]), # default_price
+            float(row[6]), # const_value
+            row[7] # description
+        )
+
+    @property
+    def loaded(self) -> bool:
+        """물고기 목록을 불러왔는지 여부를 반환합니다.
 
+        Returns:
+            bool: 불러왔는지 여부
+        """
+        return self._loaded
+
+    async def update_catalog(self) -> None:
+        """|coro|
+        fish_info 테이블 전체를 불러와 등급별 물고기 목록과 선택 테이블을 만듭니다.
+        잡을 수 있는 물고기가 없으면 선택 테이블을 만들지 않으며, 물고기를 조회할 때 NoFishAvailable이 발생합니다.
+        """
+        logger.debug("Updating fish catalog")
+        result = await self._database._query("SELECT * FROM fish_info", fetch=True)
+
+        catalog: dict[FishRating, list[tuple]] = {}
+        for row in map(self._parse_row, result):
+            catalog.setdefault(FishRating(row[FishInfoColumns.RATING.value]), []).append(row)
+
+        for grade in self.grade_prob.keys() - catalog.keys():
+            logger.warning("No fish of grade %s, it will never be caught", grade)
+
+        # 물고기가 있는 등급만 선택되도록 테이블 생성
+        grades = [grade for grade in self.grade_prob if grade in catalog]
+        self._catalog = catalog
+        self._grades = grades
+        self._loaded = True
+        if not grades:
+            self._grade_table = None
+            self._batch_table = None
+            logger.warning("Fish catalog is empty, no fish can be caught")
+            return
+
+        self._grade_table = AliasTable(self.grade_prob[grade] for grade in grades)
+        self._batch_table = FishBatchTable(catalog, self.grade_prob)
+        logger.info("Fish catalog loaded (%s fish)", len(result))
+
+    def _choose_grade(self) -> FishRating:
+        return self._grades[self._grade_table.sample()]
 
     async def get_random_fish(self) -> Fish:
         """|coro|
         물고기를 랜덤으로 조회합니다.
 
+        Raises:
+            NoFishAvailable: 잡을 수 있는 물고기가 없을 때
+
         Returns:
             Fish: 물고기
         """
+        if not self.loaded:
+            await self.update_catalog()
+        if self._grade_table is None:
+            raise NoFishAvailable()
+
         grade = self._choose_grade() # 물고기 등급 선택
-        logger.debug(f"Getting random fish of grade {grade}")
-        result = await self._database._query("SELECT * FROM fish_info WHERE rating=%s ORDER BY RAND() LIMIT 1", (grade.value,), fetch=True)
-        return self._return_value(result)[0]
+        logger.debug("Getting random fish of grade %s", grade)
+        rows = self._catalog[grade]
+        return Fish(*rows[random.randrange(len(rows))]) # 같은 등급 안에서는 균등하게 선택
+
+
+    async def get_random_fishes(self, n: int) -> list[Fish]:
+        """|coro|
+        물고기 n마리를 랜덤으로 한번에 조회합니다.
+        등급, 종류, 길이, 가격을 배열 연산 한번으로 계산하므로 많은 물고기를 뽑을 때 사용합니다.
+
+        Args:
+            n (int): 물고기 수
+
+        Raises:
+            NoFishAvailable: 잡을 수 있는 물고기가 없을 때
+
+        Returns:
+            list[Fish]: 물고기 목록
+        """
+        if not self.loaded:
+            await self.update_catalog()
+        if self._batch_table is None:
+            raise NoFishAvailable()
+
+        table = self._batch_table
+        index, length, price = table.sample(self._rng, n)
+        logger.debug("Getting %s random fish", n)
+        return [
+            Fish(*table.rows[i], length=l, price=p)
+            for i, l, p in zip(index.tolist(), length.tolist(), price.tolist())
+        ]
\ No newline at end of file
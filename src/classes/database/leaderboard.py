@@ -0,0 +1,258 @@
+import random
+import logging
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+
+logger = logging.getLogger("discord.bot.database.leaderboard")
+
+MAX_LEVEL = 24 # 약 1600만명까지 O(log n) 유지
+
+
+class _Node():
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: tuple[int, int] | None, level: int) -> None:
+        self.key = key # (-money, user_id)
+        self.next: list[_Node | None] = [None] * level
+        self.width = [1] * level # 다음 노드까지의 거리
+
+
+class _SkipList():
+    """순위(인덱스) 조회가 가능한 skip list"""
+
+    def __init__(self) -> None:
+        self._head = _Node(None, MAX_LEVEL)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def insert(self, key: tuple[int, int]) -> None:
+        chain: list[_Node] = [None] * MAX_LEVEL
+        steps_at_level = [0] * MAX_LEVEL
+        node = self._head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        new_level = self._random_level()
+        new_node = _Node(key, new_level)
+        steps = 0
+        for level in range(new_level):
+            prev = chain[level]
+            new_node.next[level] = prev.next[level]
+            prev.next[level] = new_node
+            new_node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(new_level, MAX_LEVEL):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key: tuple[int, int]) -> None:
+        chain: list[_Node] = [None] * MAX_LEVEL
+        node = self._head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+
+        for level in range(len(target.next)):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(len(target.next), MAX_LEVEL):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def index(self, key: tuple[int, int]) -> int:
+        position = 0
+        node = self._head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+
+        if node.next[0] is None or node.next[0].key != key:
+            raise KeyError(key)
+        return position
+
+    def iter_from(self, index: int) -> Iterator[tuple[int, int]]:
+        if index >= self._size:
+            return
+
+        remaining = index + 1
+        node = self._head
+        for level in reversed(range(MAX_LEVEL)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+
+class Leaderboard():
+    """유저를 돈 순서로 정렬해 보관하는 순위표
+
+    돈이 바뀔 때마다 O(log n)으로 갱신되며, 상위 K명과 특정 유저의 순위를 DB 조회 없이 계산합니다.
+    """
+
+    def __init__(self, database: "DataSQL") -> None:
+        self._database = database
+        self._money: dict[int, int] = {}
+        self._list = _SkipList()
+
+        self._dirty: set[int] | None = None # 불러오는 도중 바뀐 유저 아이디
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._money)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._money
+
+    async def load(self) -> None:
+        """|coro|
+        user_info 테이블의 돈 정보를 한번에 불러와 순위표를 다시 만듭니다.
+        주기적으로 실행하여 다른 프로세스나 DB에서 직접 바뀐 돈을 반영합니다.
+        """
+        self._dirty = set()
+        try:
+            result = await self._database._query("SELECT id, money FROM user_info", fetch=True)
+        except BaseException:
+            self._dirty = None
+            raise
+
+        old_money, dirty = self._money, self._dirty
+        self._money, self._list, self._dirty = {}, _SkipList(), None
+        for user_id, money in result:
+            self.set(int(user_id), int(money))
+
+        for user_id in dirty: # 조회하는 동안 바뀐 값은 기존 순위표의 값을 따름
+            if user_id in old_money:
+                self.set(user_id, old_money[user_id])
+            else:
+                self.remove(user_id)
+
+        if self.loaded:
+            changed = sum(1 for user_id, money in self._money.items() if old_money.get(user_id) != money)
+            changed += sum(1 for user_id in old_money if user_id not in self._money)
+            if changed:
+                logger.info("Leaderboard reconciled (%s users changed)", changed)
+        else:
+            logger.info("Leaderboard loaded (%s users)", len(self._money))
+        self.loaded = True
+
+    def set(self, user_id: int, money: int) -> None:
+        """유저의 돈을 설정합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            money (int): 돈
+        """
+        if self._dirty is not None:
+            self._dirty.add(user_id)
+
+        old = self._money.get(user_id)
+        if old == money:
+            return
+        if old is not None:
+            self._list.remove((-old, user_id))
+        self._list.insert((-money, user_id))
+        self._money[user_id] = money
+
+    def add(self, user_id: int, money: int) -> None:
+        """유저의 돈을 추가합니다.
+        순위표에 없는 유저라면 아무것도 하지 않습니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            money (int): 추가할 돈
+        """
+        if user_id in self._money:
+            self.set(user_id, self._money[user_id] + money)
+        elif self._dirty is not None:
+            self._dirty.add(user_id)
+
+    def remove(self, user_id: int) -> None:
+        """유저를 순위표에서 제거합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+        """
+        if self._dirty is not None:
+            self._dirty.add(user_id)
+
+        money = self._money.pop(user_id, None)
+        if money is not None:
+            self._list.remove((-money, user_id))
+
+    def get_money(self, user_id: int) -> int | None:
+        """순위표에 저장된 유저의 돈을 반환합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            int | None: 돈, 순위표에 없으면 None
+        """
+        return self._money.get(user_id)
+
+    def rank(self, user_id: int) -> int | None:
+        """유저의 순위를 반환합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            int | None: 1부터 시작하는 순위, 순위표에 없으면 None
+        """
+        money = self._money.get(user_id)
+        if money is None:
+            return None
+        return self._list.index((-money, user_id)) + 1
+
+    def iter_top(self, start: int = 0) -> Iterator[tuple[int, int]]:
+        """돈이 많은 순서대로 유저를 반환합니다.
+
+        Args:
+            start (int, optional): 시작할 순위 (0부터 시작). Defaults to 0.
+
+        Yields:
+            tuple[int, int]: (유저 아이디, 돈)
+        """
+        for money, user_id in self._list.iter_from(start):
+            yield user_id, -money
+
+    def top(self, k: int, start: int = 0) -> list[tuple[int, int]]:
+        """상위 k명의 유저를 반환합니다.
+
+        Args:
+            k (int): 반환할 유저 수
+            start (int, optional): 시작할 순위 (0부터 시작). Defaults to 0.
+
+        Returns:
+            list[tuple[int, int]]: (유저 아이디, 돈) 목록
+        """
+        result = []
+        for entry in self.iter_top(start):
+            if len(result) >= k:
+                break
+            result.append(entry)
+        return result
@@ -0,0 +1,371 @@
+import time
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import TYPE_CHECKING
+
+from src.classes.enums import LedgerReason
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+
+logger = logging.getLogger("discord.bot.database.ledger")
+
+LedgerEntry = tuple[int, int, str, int | None, float] # (user_id, amount, reason, balance, created_at)
+
+PARTITION_PREFIX = "money_ledger_" # 날짜별 장부 테이블 이름 (money_ledger_YYYYMMDD)
+FLUSH_HORIZON = 86400 # 다른 프로세스가 늦게 추가할 수 있는 내역을 위해 보관 기간과 관계없이 남겨두는 시간 (초)
+
+CREATE_PARTITION = {
+    "sqlite": (
+        """CREATE TABLE IF NOT EXISTS {table} (
+            user_id INTEGER NOT NULL,
+            amount INTEGER NOT NULL,
+            reason TEXT NOT NULL,
+            balance INTEGER,
+            created_at REAL NOT NULL,
+            snapshot_id INTEGER
+        )""",
+        "CREATE INDEX IF NOT EXISTS {table}_user ON {table} (user_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS {table}_snapshot ON {table} (snapshot_id)",
+    ),
+    "mysql": (
+        """CREATE TABLE IF NOT EXISTS {table} (
+            user_id BIGINT NOT NULL,
+            amount BIGINT NOT NULL,
+            reason VARCHAR(32) NOT NULL,
+            balance BIGINT NULL,
+            created_at DOUBLE NOT NULL,
+            snapshot_id BIGINT NULL,
+            INDEX (user_id, created_at),
+            INDEX (snapshot_id)
+        )""",
+    ),
+}
+CREATE_SNAPSHOT = {
+    "sqlite": (
+        """CREATE TABLE IF NOT EXISTS money_snapshot (
+            user_id INTEGER PRIMARY KEY,
+            money INTEGER NOT NULL,
+            snapshot_id INTEGER NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS money_snapshot_info (
+            id INTEGER PRIMARY KEY,
+            taken_at REAL NOT NULL
+        )""",
+    ),
+    "mysql": (
+        """CREATE TABLE IF NOT EXISTS money_snapshot (
+            user_id BIGINT PRIMARY KEY,
+            money BIGINT NOT NULL,
+            snapshot_id BIGINT NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS money_snapshot_info (
+            id BIGINT PRIMARY KEY,
+            taken_at DOUBLE NOT NULL
+        )""",
+    ),
+}
+SEED_SNAPSHOT = { # 첫 스냅샷: user_info의 돈으로 시작
+    "sqlite": (
+        "INSERT INTO money_snapshot (user_id, money, snapshot_id) SELECT id, money, %s FROM user_info WHERE true "
+        "ON CONFLICT (user_id) DO UPDATE SET money=excluded.money, snapshot_id=excluded.snapshot_id"
+    ),
+    "mysql": (
+        "INSERT INTO money_snapshot (user_id, money, snapshot_id) SELECT id, money, %s FROM user_info "
+        "ON DUPLICATE KEY UPDATE money=VALUES(money), snapshot_id=VALUES(snapshot_id)"
+    ),
+}
+FOLD_SNAPSHOT = { # 이후 스냅샷: 새로 반영한 내역의 합을 더함
+    "sqlite": (
+        "INSERT INTO money_snapshot (user_id, money, snapshot_id) VALUES (%s, %s, %s) "
+        "ON CONFLICT (user_id) DO UPDATE SET money=money+excluded.money, snapshot_id=excluded.snapshot_id"
+    ),
+    "mysql": (
+        "INSERT INTO money_snapshot (user_id, money, snapshot_id) VALUES (%s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE money=money+VALUES(money), snapshot_id=VALUES(snapshot_id)"
+    ),
+}
+LIST_PARTITIONS = {
+    "sqlite": "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'money\\_ledger\\_%' ESCAPE '\\'",
+    "mysql": (
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_schema=DATABASE() AND table_name LIKE 'money\\\\_ledger\\\\_%'"
+    ),
+}
+
+
+class MoneyLedger():
+    """유저의 돈 변경 내역을 기록하는 추가 전용(append-only) 장부
+
+    변경 내역은 메모리에 모아두었다가 일정시간마다 날짜별 테이블에 executemany로 한번에 추가합니다.
+    스냅샷은 아직 반영되지 않은 내역에 스냅샷 번호를 표시하고 그 합을 money_snapshot 테이블의 유저별 돈에 더합니다.
+    경계를 시간이 아닌 표시 여부로 정하므로, 다른 프로세스가 늦게 추가한 내역도 다음 스냅샷에 정확히 한번 반영됩니다.
+    유저의 돈은 마지막 스냅샷과 표시되지 않은 장부만으로 다시 계산할 수 있으므로 모두 반영된 오래된 날짜의 테이블은 삭제(compact)합니다.
+    """
+
+    BATCH_SIZE = 1000 # executemany 하나에 들어가는 최대 내역 수
+
+    def __init__(self, database: "DataSQL", interval: float = 1.0, retention_days: int = 30) -> None:
+        """돈 장부
+
+        Args:
+            database (DataSQL): 데이터베이스
+            interval (float, optional): DB에 추가하는 주기 (초). Defaults to 1.0.
+            retention_days (int, optional): 스냅샷 이전의 장부를 보관하는 기간 (일). Defaults to 30.
+        """
+        self._database = database
+        self.interval = interval
+        self.retention_days = retention_days
+
+        self._pending: list[LedgerEntry] = []
+        self._partitions: set[str] = set() # 만들어진 날짜별 테이블
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.recorded = 0 # 기록된 내역 수
+        self.written = 0 # DB에 추가된 내역 수
+        self.flushes = 0 # DB에 추가한 횟수
+        self.compacted = 0 # 삭제한 날짜별 테이블 수
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def _dialect(self) -> str:
+        return self._database.backend.name
+
+    @staticmethod
+    def partition_name(timestamp: float) -> str:
+        """시간에 해당하는 날짜별 테이블 이름을 반환합니다. (UTC 기준)
+
+        Args:
+            timestamp (float): 유닉스 시간
+
+        Returns:
+            str: 테이블 이름
+        """
+        return PARTITION_PREFIX + datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y%m%d")
+
+    async def setup(self) -> None:
+        """|coro|
+        스냅샷 테이블을 만들고 이미 있는 날짜별 테이블을 불러옵니다.
+        """
+        for statement in CREATE_SNAPSHOT[self._dialect]:
+            await self._database._query(statement)
+        self._partitions = set(await self.list_partitions())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """|coro|
+        주기적인 작업을 멈추고 남은 내역을 모두 DB에 추가합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def record(self, user_id: int, amount: int, reason: LedgerReason, balance: int | None = None) -> None:
+        """돈 변경 내역을 기록합니다. DB에는 flush할 때 추가됩니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            amount (int): 바뀐 돈 (음수면 차감)
+            reason (LedgerReason): 바뀐 이유
+            balance (int | None, optional): 바뀐 뒤의 돈, 모르면 None. Defaults to None.
+        """
+        self._pending.append((user_id, amount, reason.value, balance, time.time()))
+        self.recorded += 1
+
+    async def _create_partition(self, table: str) -> None:
+        if table in self._partitions:
+            return
+        for statement in CREATE_PARTITION[self._dialect]:
+            await self._database._query(statement.format(table=table))
+        self._partitions.add(table)
+
+    async def flush(self) -> None:
+        """|coro|
+        모아둔 내역을 날짜별 테이블에 추가합니다.
+        실패하면 추가하지 못한 내역을 다시 큐에 넣고 예외를 발생시킵니다.
+        """
+        async with self._lock:
+            if not self._pending:
+                return
+
+            batch, self._pending = self._pending, []
+            partitions: dict[str, list[LedgerEntry]] = {}
+            for entry in batch:
+                partitions.setdefault(self.partition_name(entry[4]), []).append(entry)
+
+            try:
+                for table, entries in sorted(partitions.items()):
+                    await self._create_partition(table)
+                    query = f"INSERT INTO {table} (user_id, amount, reason, balance, created_at) VALUES (%s, %s, %s, %s, %s)"
+                    while entries:
+                        chunk = entries[:self.BATCH_SIZE]
+                        async with self._database.backend.connection() as conn:
+                            await conn.executemany(query, chunk)
+                        del entries[:self.BATCH_SIZE] # 추가된 내역은 복구 대상에서 제외
+                        self.written += len(chunk)
+            except BaseException:
+                self._pending[:0] = [entry for entries in partitions.values() for entry in entries] # 추가하지 못한 내역 복구
+                self._partitions.difference_update(partitions) # 다른 프로세스가 테이블을 삭제했을 수 있으므로 다시 만들도록 함
+                raise
+            self.flushes += 1
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush money ledger")
+
+    async def list_partitions(self) -> list[str]:
+        """|coro|
+        DB에 있는 날짜별 테이블 이름을 날짜순으로 반환합니다.
+
+        Returns:
+            list[str]: 테이블 이름 목록
+        """
+        rows = await self._database._query(LIST_PARTITIONS[self._dialect], fetch=True)
+        return sorted(name for name, in rows if name[len(PARTITION_PREFIX):].isdigit())
+
+    async def snapshot(self) -> int:
+        """|coro|
+        아직 스냅샷에 반영되지 않은 장부를 새 스냅샷으로 반영합니다.
+        쓰기 지연 큐와 장부를 먼저 추가한 뒤, 하나의 트랜잭션에서 반영되지 않은 내역에 스냅샷 번호를 표시하고 유저별 합을 더합니다.
+        첫 스냅샷은 장부를 켜기 전의 돈을 알 수 없으므로 user_info의 돈으로 시작하며, 이때만 기록 도중 바뀐 돈이 어긋날 수 있습니다.
+
+        Returns:
+            int: 스냅샷 번호
+        """
+        if self._database.write_behind is not None:
+            await self._database.write_behind.flush()
+        await self.flush()
+
+        partitions = await self.list_partitions()
+        taken_at = time.time()
+        async with self._database.backend.transaction() as tx:
+            result = await self._database._execute(tx, "SELECT MAX(id) FROM money_snapshot_info", fetch=True)
+            snapshot_id = int(result[0][0] or 0) + 1
+            await self._database._execute(
+                tx,
+                "INSERT INTO money_snapshot_info (id, taken_at) VALUES (%s, %s)",
+                (snapshot_id, taken_at)
+            )
+
+            deltas: dict[int, int] = {} # 유저 아이디: 새로 반영한 돈
+            for table in partitions:
+                # 표시한 순간까지 추가된 내역만 이번 스냅샷에 포함되고, 이후에 추가된 내역은 다음 스냅샷에 포함됨
+                await self._database._execute(tx, f"UPDATE {table} SET snapshot_id=%s WHERE snapshot_id IS NULL", (snapshot_id,))
+                for user_id, amount in await self._database._execute(
+                    tx,
+                    f"SELECT user_id, SUM(amount) FROM {table} WHERE snapshot_id=%s GROUP BY user_id",
+                    (snapshot_id,),
+                    fetch=True
+                ):
+                    deltas[int(user_id)] = deltas.get(int(user_id), 0) + int(amount)
+
+            if snapshot_id == 1: # 이전 내역은 user_info의 돈에 이미 포함됨
+                await self._database._execute(tx, SEED_SNAPSHOT[self._dialect], (snapshot_id,))
+            elif deltas:
+                await tx.executemany(FOLD_SNAPSHOT[self._dialect], [(user_id, amount, snapshot_id) for user_id, amount in deltas.items()])
+            await self._database._execute( # 삭제된 유저는 삭제할 때 남은 돈을 차감하므로 0원이 됨
+                tx,
+                "DELETE FROM money_snapshot WHERE money=0 AND user_id NOT IN (SELECT id FROM user_info)"
+            )
+        logger.info("Money snapshot %s taken (%s users changed)", snapshot_id, len(deltas))
+        return snapshot_id
+
+    async def compact(self) -> list[str]:
+        """|coro|
+        모든 내역이 스냅샷에 반영되었고 보관 기간이 지난 날짜별 테이블을 삭제합니다.
+        다른 프로세스가 늦게 추가할 수 있도록, 하루가 지나지 않은 테이블은 보관 기간과 관계없이 남겨둡니다.
+
+        Returns:
+            list[str]: 삭제한 테이블 이름 목록
+        """
+        horizon = max(timedelta(days=self.retention_days).total_seconds(), FLUSH_HORIZON)
+        retention_partition = self.partition_name(time.time() - horizon)
+        dropped = []
+        for table in await self.list_partitions():
+            if table >= retention_partition:
+                continue
+            result = await self._database._query(f"SELECT COUNT(*) FROM {table} WHERE snapshot_id IS NULL", fetch=True)
+            if result[0][0]: # 아직 스냅샷에 반영되지 않은 내역이 있음
+                continue
+            await self._database._query(f"DROP TABLE IF EXISTS {table}")
+            self._partitions.discard(table)
+            dropped.append(table)
+
+        if dropped:
+            self.compacted += len(dropped)
+            logger.info("Compacted money ledger: %s", ", ".join(dropped))
+        return dropped
+
+    async def history(self, user_id: int, since: float = 0, limit: int = 100) -> list[LedgerEntry]:
+        """|coro|
+        유저의 돈 변경 내역을 최근 순으로 조회합니다. 아직 DB에 추가되지 않은 내역도 포함합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            since (float, optional): 이 시간 이후의 내역만 조회 (유닉스 시간). Defaults to 0.
+            limit (int, optional): 최대 개수. Defaults to 100.
+
+        Returns:
+            list[LedgerEntry]: (user_id, amount, reason, balance, created_at) 목록
+        """
+        entries = [entry for entry in self._pending if entry[0] == user_id and entry[4] > since]
+        since_partition = self.partition_name(since)
+        for table in reversed(await self.list_partitions()):
+            if len(entries) >= limit or table < since_partition:
+                break
+            entries += [
+                (int(row[0]), int(row[1]), row[2], None if row[3] is None else int(row[3]), float(row[4]))
+                for row in await self._database._query(
+                    f"SELECT user_id, amount, reason, balance, created_at FROM {table} "
+                    "WHERE user_id=%s AND created_at>%s ORDER BY created_at DESC LIMIT %s",
+                    (user_id, since, limit - len(entries)),
+                    fetch=True
+                )
+            ]
+        entries.sort(key=lambda entry: entry[4], reverse=True)
+        return entries[:limit]
+
+    async def replay(self, user_id: int) -> int | None:
+        """|coro|
+        마지막 스냅샷과 아직 반영되지 않은 장부로 유저의 돈을 다시 계산합니다.
+        스냅샷과 장부를 하나의 트랜잭션에서 조회하므로, 도중에 스냅샷이 기록되어도 같은 내역을 두번 더하지 않습니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            int | None: 계산한 돈, 스냅샷이 없으면 None
+        """
+        await self.flush()
+        partitions = await self.list_partitions()
+        async with self._database.backend.transaction() as tx:
+            result = await self._database._execute(tx, "SELECT MAX(id) FROM money_snapshot_info", fetch=True)
+            if result[0][0] is None:
+                return None
+
+            result = await self._database._execute(
+                tx,
+                "SELECT money FROM money_snapshot WHERE user_id=%s",
+                (user_id,),
+                fetch=True
+            )
+            money = int(result[0][0]) if result else 0 # 스냅샷 이후에 등록한 유저는 0원에서 시작
+            for table in partitions:
+                total = await self._database._execute(
+                    tx,
+                    f"SELECT SUM(amount) FROM {table} WHERE user_id=%s AND snapshot_id IS NULL",
+                    (user_id,),
+                    fetch=True
+                )
+                money += int(total[0][0] or 0)
+        return money
\ No newline at end of file
@@ -0,0 +1,69 @@
+import logging
+
+logger = logging.getLogger("discord.bot.database.pool_metrics")
+
+
+class PoolMetrics():
+    """커넥션 풀 사용 현황을 기록하는 클래스"""
+
+    def __init__(self) -> None:
+        self.acquires = 0 # 커넥션을 가져온 횟수
+        self.timeouts = 0 # 기다리다 시간이 초과된 횟수
+        self.rejections = 0 # 대기열이 가득 차 거절된 횟수
+        self.waiters = 0 # 현재 커넥션을 기다리는 작업 수
+        self.max_waiters_seen = 0 # 동시에 기다린 작업 수의 최대값
+        self.total_wait = 0.0 # 커넥션을 기다린 총 시간 (초)
+        self.max_wait = 0.0 # 커넥션을 기다린 최대 시간 (초)
+
+    def record_acquire(self, wait: float) -> None:
+        """커넥션을 가져온 기록을 추가합니다.
+
+        Args:
+            wait (float): 기다린 시간 (초)
+        """
+        self.acquires += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def enter_wait(self) -> None:
+        self.waiters += 1
+        if self.waiters > self.max_waiters_seen:
+            self.max_waiters_seen = self.waiters
+
+    def exit_wait(self) -> None:
+        self.waiters -= 1
+
+    @property
+    def average_wait(self) -> float:
+        """커넥션을 기다린 평균 시간을 반환합니다.
+
+        Returns:
+            float: 평균 시간 (초)
+        """
+        return self.total_wait / self.acquires if self.acquires else 0.0
+
+    def snapshot(self, pool=None) -> dict[str, int | float]:
+        """현재 통계를 반환합니다.
+
+        Args:
+            pool (aiomysql.Pool, optional): 사용중인 커넥션 수를 함께 기록할 풀. Defaults to None.
+
+        Returns:
+            dict[str, int | float]: 통계
+        """
+        result = {
+            "acquires": self.acquires,
+            "timeouts": self.timeouts,
+            "rejections": self.rejections,
+            "waiters": self.waiters,
+            "max_waiters": self.max_waiters_seen,
+            "average_wait_ms": self.average_wait * 1000,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+        if pool is not None:
+            result["size"] = pool.size
+            result["in_use"] = pool.size - pool.freesize
+            result["free"] = pool.freesize
+            result["maxsize"] = pool.maxsize
+        return result
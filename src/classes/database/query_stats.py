@@ -0,0 +1,126 @@
+import re
+import math
+import logging
+
+logger = logging.getLogger("discord.bot.database.query_stats")
+slow_query_logger = logging.getLogger("discord.bot.database.slow_query")
+
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf) # 히스토그램 구간 (ms)
+
+_PLACEHOLDER_LIST = re.compile(r"%s(?:\s*,\s*%s)+") # IN (%s,%s,...)
+_CASE_LIST = re.compile(r"(?:WHEN %s THEN %s\s*)+") # CASE id WHEN %s THEN %s ...
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """인자 개수만 다른 쿼리를 같은 형태로 묶을 수 있도록 정리합니다.
+
+    Args:
+        query (str): 쿼리문
+
+    Returns:
+        str: 정리된 쿼리문
+    """
+    query = _WHITESPACE.sub(" ", query.strip())
+    query = _CASE_LIST.sub("WHEN %s THEN %s ... ", query)
+    return _PLACEHOLDER_LIST.sub("%s, ...", query)
+
+
+class StatementStats():
+    """쿼리 형태 하나의 실행 통계"""
+
+    __slots__ = ("count", "total", "max", "rows", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0 # 총 실행 시간 (초)
+        self.max = 0.0 # 최대 실행 시간 (초)
+        self.rows = 0 # 조회/변경된 총 행 수
+        self.histogram = [0] * len(BUCKETS_MS)
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """히스토그램으로 백분위 실행 시간을 추정합니다.
+
+        Args:
+            p (float): 0 ~ 1 사이의 백분위
+
+        Returns:
+            float: 해당 구간의 상한값 (ms)
+        """
+        target = self.count * p
+        seen = 0
+        for bucket, n in zip(BUCKETS_MS, self.histogram):
+            seen += n
+            if seen >= target and n:
+                return bucket if bucket != math.inf else self.max * 1000
+        return 0.0
+
+
+class QueryStats():
+    """쿼리 형태별 실행 시간 히스토그램과 느린 쿼리 기록"""
+
+    def __init__(self, slow_threshold_ms: float = 200) -> None:
+        """쿼리 통계
+
+        Args:
+            slow_threshold_ms (float, optional): 느린 쿼리로 기록할 실행 시간 (ms). Defaults to 200.
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self._statements: dict[str, StatementStats] = {}
+        self.total_queries = 0
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def record(self, query: str, args: tuple | list | None, elapsed: float, rows: int) -> None:
+        """쿼리 실행 기록을 추가합니다.
+
+        Args:
+            query (str): 쿼리문
+            args (tuple | list | None): 쿼리 인자
+            elapsed (float): 실행 시간 (초)
+            rows (int): 조회/변경된 행 수
+        """
+        normalized = normalize_query(query)
+        stats = self._statements.get(normalized)
+        if stats is None:
+            stats = self._statements[normalized] = StatementStats()
+
+        elapsed_ms = elapsed * 1000
+        stats.count += 1
+        stats.total += elapsed
+        stats.rows += max(rows, 0)
+        if elapsed > stats.max:
+            stats.max = elapsed
+        for i, bucket in enumerate(BUCKETS_MS):
+            if elapsed_ms <= bucket:
+                stats.histogram[i] += 1
+                break
+        self.total_queries += 1
+
+        if elapsed_ms >= self.slow_threshold_ms:
+            slow_query_logger.warning(
+                "%.1fms | rows=%d | %s | args=<%d redacted>",
+                elapsed_ms, rows, normalized, 0 if args is None else len(args)
+            )
+
+    def top(self, n: int = 10, key: str = "total") -> list[tuple[str, StatementStats]]:
+        """많은 시간을 사용한 쿼리 형태를 반환합니다.
+
+        Args:
+            n (int, optional): 반환할 개수. Defaults to 10.
+            key (str, optional): 정렬 기준 (total, count, max, rows). Defaults to "total".
+
+        Returns:
+            list[tuple[str, StatementStats]]: (쿼리 형태, 통계) 목록
+        """
+        return sorted(self._statements.items(), key=lambda item: getattr(item[1], key), reverse=True)[:n]
+
+    def reset(self) -> None:
+        """통계를 초기화합니다."""
+        self._statements.clear()
+        self.total_queries = 0
@@ -0,0 +1,249 @@
+import os
+import time
+import uuid
+import socket
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING
+
+from src.classes.session import SessionRegistry, SessionKind
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+    from .backends.base import BackendConnection
+    from .backends.mysql import MySQLBackend, MySQLConnection
+
+logger = logging.getLogger("discord.bot.database.session")
+
+LOCK_POLL_MIN = 0.01 # 다른 프로세스의 잠금이 풀리기를 기다리는 간격 (초)
+LOCK_POLL_MAX = 0.2
+LOCK_CONN_PING_INTERVAL = 30 # 이 시간 동안 쓰지 않은 잠금 전용 커넥션은 사용하기 전에 확인 (초)
+
+
+class SQLSessionRegistry(SessionRegistry):
+    """user_session 테이블에 세션을 기록하는 저장소
+
+    같은 데이터베이스를 사용하는 모든 프로세스가 세션을 공유합니다.
+    세션마다 만료 시간(유닉스 시간)과 소유자를 기록하며, 만료된 세션은 다른 프로세스가 가져갈 수 있습니다.
+    """
+
+    shared = True
+    CREATE_TABLE: str = None
+    ACQUIRE_QUERY: str = None # (kind, user_id, owner, expires_at, now * NOW_ARGS)
+    NOW_ARGS = 1
+
+    def __init__(self, database: "DataSQL", default_ttl: float = 600, lock_timeout: float = 10) -> None:
+        """데이터베이스 세션 저장소
+
+        Args:
+            database (DataSQL): 데이터베이스
+            default_ttl (float, optional): 세션이 자동으로 만료되는 시간 (초). Defaults to 600.
+            lock_timeout (float, optional): economy_lock을 기다리는 최대 시간 (초). Defaults to 10.
+        """
+        super().__init__(default_ttl, lock_timeout)
+        self._database = database
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}" # 이 프로세스를 구분하는 값
+
+    async def setup(self) -> None:
+        await self._database._query(self.CREATE_TABLE)
+        logger.info("Session registry ready (%s, owner %s)", self.__class__.__name__, self.owner)
+
+    async def _acquire_lease(self, kind: str, user_id: int, ttl: float) -> bool:
+        now = time.time()
+        return await self._database._query(
+            self.ACQUIRE_QUERY,
+            (kind, user_id, self.owner, now + ttl) + (now,) * self.NOW_ARGS
+        ) > 0
+
+    async def _release_lease(self, kind: str, user_id: int) -> bool:
+        return await self._database._query(
+            "DELETE FROM user_session WHERE kind=%s AND user_id=%s AND owner=%s",
+            (kind, user_id, self.owner)
+        ) > 0
+
+    async def acquire(self, kind: SessionKind, user_id: int, ttl: float | None = None) -> bool:
+        return await self._acquire_lease(kind.value, user_id, self.default_ttl if ttl is None else ttl)
+
+    async def release(self, kind: SessionKind, user_id: int) -> bool:
+        return await self._release_lease(kind.value, user_id)
+
+    async def is_active(self, kind: SessionKind, user_id: int) -> bool:
+        result = await self._database._query(
+            "SELECT 1 FROM user_session WHERE kind=%s AND user_id=%s AND expires_at>%s",
+            (kind.value, user_id, time.time()),
+            fetch=True
+        )
+        return len(result) > 0
+
+    async def count(self, kind: SessionKind) -> int:
+        result = await self._database._query(
+            "SELECT COUNT(*) FROM user_session WHERE kind=%s AND expires_at>%s",
+            (kind.value, time.time()),
+            fetch=True
+        )
+        return result[0][0]
+
+
+class SQLiteSessionRegistry(SQLSessionRegistry):
+    """SQLite 파일을 공유하는 프로세스끼리 세션을 공유하는 저장소
+
+    economy_lock은 user_session 테이블의 economy 임대(lease)로 구현하며, 잠금이 풀릴 때까지 짧은 간격으로 다시 시도합니다.
+    """
+
+    CREATE_TABLE = """CREATE TABLE IF NOT EXISTS user_session (
+        kind TEXT NOT NULL,
+        user_id INTEGER NOT NULL,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (kind, user_id)
+    )"""
+    ACQUIRE_QUERY = (
+        "INSERT INTO user_session (kind, user_id, owner, expires_at) VALUES (%s, %s, %s, %s) "
+        "ON CONFLICT (kind, user_id) DO UPDATE SET owner=excluded.owner, expires_at=excluded.expires_at "
+        "WHERE user_session.expires_at<=%s"
+    )
+    LOCK_KIND = "economy"
+    LOCK_TTL = 30 # 잠금을 가진 프로세스가 종료되어도 이 시간이 지나면 풀림 (초)
+
+    async def _lock_shared(self, user_id: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        delay = LOCK_POLL_MIN
+        while not await self._acquire_lease(self.LOCK_KIND, user_id, self.LOCK_TTL):
+            if time.monotonic() + delay > deadline:
+                return False
+            self.lock_waits += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LOCK_POLL_MAX)
+        return True
+
+    async def _unlock_shared(self, user_id: int) -> None:
+        await self._release_lease(self.LOCK_KIND, user_id)
+
+
+class _LockConnection():
+    """GET_LOCK 전용 커넥션 하나와 이 커넥션으로 얻은 잠금 목록"""
+
+    def __init__(self, backend: "MySQLBackend") -> None:
+        self._backend = backend
+        self._stack: AsyncExitStack | None = None
+        self._conn: "MySQLConnection | None" = None
+        self.lock = asyncio.Lock() # 커넥션 하나는 한번에 하나의 쿼리만 실행
+        self.held: set[int] = set() # 이 커넥션으로 얻은 잠금의 유저 아이디
+        self.last_used = 0.0
+
+    async def get(self) -> "MySQLConnection":
+        """커넥션을 반환합니다. 없으면 새로 열고, 오래 쓰지 않았다면 끊기지 않았는지 확인합니다."""
+        if self._conn is None:
+            self._stack = AsyncExitStack()
+            self._conn = await self._stack.enter_async_context(self._backend.dedicated_connection())
+        elif time.monotonic() - self.last_used > LOCK_CONN_PING_INTERVAL:
+            await self._conn.ping()
+        return self._conn
+
+    async def reset(self) -> set[int]:
+        """커넥션을 닫고, 커넥션과 함께 풀린 잠금의 유저 아이디를 반환합니다."""
+        lost, self.held = self.held, set()
+        if self._stack is not None:
+            stack, self._stack, self._conn = self._stack, None, None
+            try:
+                await stack.aclose()
+            except Exception: # 이미 끊긴 커넥션
+                pass
+        return lost
+
+
+class MySQLSessionRegistry(SQLSessionRegistry):
+    """MySQL을 사용하는 프로세스끼리 세션을 공유하는 저장소
+
+    economy_lock은 MySQL의 GET_LOCK으로 구현합니다.
+    GET_LOCK은 커넥션에 묶이므로 풀과 별도인 잠금 전용 커넥션 몇 개를 열어두고 유저 아이디로 나눠 사용하며,
+    이 커넥션이 끊기면 MySQL이 잠금을 모두 풀어주므로 프로세스가 종료되어도 잠금이 남지 않습니다.
+    커넥션이 끊기면 그 커넥션으로 얻은 잠금은 더 이상 가진 것으로 보지 않고, 새 커넥션으로 한번 다시 시도합니다.
+    """
+
+    CREATE_TABLE = """CREATE TABLE IF NOT EXISTS user_session (
+        kind VARCHAR(32) NOT NULL,
+        user_id BIGINT NOT NULL,
+        owner VARCHAR(128) NOT NULL,
+        expires_at DOUBLE NOT NULL,
+        PRIMARY KEY (kind, user_id)
+    )"""
+    ACQUIRE_QUERY = ( # owner를 먼저 바꾸므로 두 IF 모두 기존 expires_at과 비교함
+        "INSERT INTO user_session (kind, user_id, owner, expires_at) VALUES (%s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE "
+        "owner=IF(expires_at<=%s, VALUES(owner), owner), "
+        "expires_at=IF(expires_at<=%s, VALUES(expires_at), expires_at)"
+    )
+    NOW_ARGS = 2
+
+    def __init__(
+        self,
+        database: "DataSQL",
+        default_ttl: float = 600,
+        lock_timeout: float = 10,
+        lock_connections: int = 4
+    ) -> None:
+        """MySQL 세션 저장소
+
+        Args:
+            database (DataSQL): 데이터베이스
+            default_ttl (float, optional): 세션이 자동으로 만료되는 시간 (초). Defaults to 600.
+            lock_timeout (float, optional): economy_lock을 기다리는 최대 시간 (초). Defaults to 10.
+            lock_connections (int, optional): 잠금 전용 커넥션 수. Defaults to 4.
+        """
+        super().__init__(database, default_ttl, lock_timeout)
+        self._lock_conns = [_LockConnection(database.backend) for _ in range(max(lock_connections, 1))]
+        self.lost_locks = 0 # 커넥션이 끊겨 풀린 잠금 수
+
+    def _lock_name(self, user_id: int) -> str:
+        return f"project-d:economy:{user_id}"
+
+    def _lock_conn(self, user_id: int) -> _LockConnection:
+        return self._lock_conns[user_id % len(self._lock_conns)]
+
+    async def _lock_query(self, lock_conn: _LockConnection, query: str, args: tuple, retry: bool = True) -> int | None:
+        async with lock_conn.lock:
+            for attempt in range(2 if retry else 1):
+                try:
+                    conn = await lock_conn.get()
+                    result = (await self._database._execute(conn, query, args, fetch=True))[0][0]
+                    lock_conn.last_used = time.monotonic()
+                    return result
+                except Exception:
+                    lost = await lock_conn.reset()
+                    if lost:
+                        self.lost_locks += len(lost)
+                        logger.warning("Lock connection lost, economy locks of users %s are no longer held", sorted(lost))
+                    if attempt == 1 or not retry:
+                        raise
+                    logger.info("Lock connection lost, retrying on a new connection")
+
+    def _holds_shared(self, user_id: int) -> bool:
+        return user_id in self._lock_conn(user_id).held
+
+    async def _lock_shared(self, user_id: int, timeout: float) -> bool:
+        # 커넥션 하나를 여러 잠금이 같이 쓰므로 서버에서 기다리지 않고(timeout 0) 직접 다시 시도
+        lock_conn = self._lock_conn(user_id)
+        deadline = time.monotonic() + timeout
+        delay = LOCK_POLL_MIN
+        while await self._lock_query(lock_conn, "SELECT GET_LOCK(%s, 0)", (self._lock_name(user_id),)) != 1:
+            if time.monotonic() + delay > deadline:
+                return False
+            self.lock_waits += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LOCK_POLL_MAX)
+        lock_conn.held.add(user_id)
+        return True
+
+    async def _unlock_shared(self, user_id: int) -> None:
+        lock_conn = self._lock_conn(user_id)
+        if user_id not in lock_conn.held: # 커넥션이 끊겨 이미 풀린 잠금
+            return
+        lock_conn.held.discard(user_id)
+        await self._lock_query(lock_conn, "SELECT RELEASE_LOCK(%s)", (self._lock_name(user_id),), retry=False)
+
+    async def close(self) -> None:
+        for lock_conn in self._lock_conns:
+            async with lock_conn.lock:
+                await lock_conn.reset()
\ No newline at end of file
@@ -0,0 +1,101 @@
+import logging
+from collections import Counter, OrderedDict
+
+logger = logging.getLogger("discord.bot.database.statement_cache")
+
+StatementKey = tuple[str, str, tuple[str, ...], tuple[str, ...]] # (operation, table, columns, condition keys)
+
+
+class StatementCache():
+    """DataSQL의 select/update/insert/delete/count가 만드는 쿼리문을 재사용하는 캐시
+
+    같은 형태의 쿼리는 한번만 만들고, 형태별 실행 횟수를 함께 기록합니다.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """쿼리문 캐시
+
+        Args:
+            max_size (int, optional): 최대 저장 개수. Defaults to 256.
+        """
+        self.max_size = max_size
+
+        self._statements: OrderedDict[StatementKey, str] = OrderedDict()
+        self.executions: Counter[StatementKey] = Counter() # 쿼리 형태별 실행 횟수
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    @staticmethod
+    def _where(keys: tuple[str, ...]) -> str:
+        return f" WHERE {' AND '.join([f'{k}=%s' for k in keys])}" if keys else ""
+
+    @classmethod
+    def build(cls, operation: str, table: str, columns: tuple[str, ...], keys: tuple[str, ...]) -> str:
+        """쿼리문을 만듭니다.
+
+        Args:
+            operation (str): select, update, insert, delete, count 중 하나
+            table (str): 테이블 이름
+            columns (tuple[str, ...]): 조회/변경/추가할 컬럼
+            keys (tuple[str, ...]): 조건 컬럼
+
+        Raises:
+            ValueError: 지원하지 않는 operation일 때
+
+        Returns:
+            str: 쿼리문
+        """
+        match operation:
+            case "select":
+                return f"SELECT {','.join(columns)} FROM {table}" + cls._where(keys)
+            case "update":
+                return f"UPDATE {table} SET {','.join([f'{k}=%s' for k in columns])}" + cls._where(keys)
+            case "insert":
+                return f"INSERT INTO {table} ({','.join(columns)}) VALUES ({','.join(['%s'] * len(columns))})"
+            case "delete":
+                return f"DELETE FROM {table}" + cls._where(keys)
+            case "count":
+                return f"SELECT COUNT(*) FROM {table}" + cls._where(keys)
+        raise ValueError(f"지원하지 않는 operation입니다: {operation}")
+
+    def get(self, operation: str, table: str, columns: tuple[str, ...] = (), keys: tuple[str, ...] = ()) -> str:
+        """쿼리문을 캐시에서 가져오고, 없으면 만들어서 저장합니다.
+        가져올 때마다 실행 횟수가 1 증가합니다.
+
+        Args:
+            operation (str): select, update, insert, delete, count 중 하나
+            table (str): 테이블 이름
+            columns (tuple[str, ...], optional): 조회/변경/추가할 컬럼. Defaults to ().
+            keys (tuple[str, ...], optional): 조건 컬럼. Defaults to ().
+
+        Returns:
+            str: 쿼리문
+        """
+        key = (operation, table, columns, keys)
+        self.executions[key] += 1
+
+        query = self._statements.get(key)
+        if query is not None:
+            self.hits += 1
+            self._statements.move_to_end(key)
+            return query
+
+        self.misses += 1
+        query = self._statements[key] = self.build(operation, table, columns, keys)
+        if len(self._statements) > self.max_size:
+            self._statements.popitem(last=False)
+        return query
+
+    def most_common(self, n: int = 10) -> list[tuple[str, int]]:
+        """가장 많이 실행된 쿼리문을 반환합니다.
+
+        Args:
+            n (int, optional): 반환할 개수. Defaults to 10.
+
+        Returns:
+            list[tuple[str, int]]: (쿼리문, 실행 횟수) 목록
+        """
+        return [(self.build(*key), count) for key, count in self.executions.most_common(n)]
@@ -0,0 +1,139 @@
+import time
+import logging
+from collections import OrderedDict
+
+from src.classes.enums import UserInfoColumns
+
+logger = logging.getLogger("discord.bot.database.user_cache")
+
+UserRow = tuple[int, int, int] # (id, money, check_time)
+
+
+class UserCache():
+    """유저 정보를 메모리에 보관하는 캐시
+
+    크기가 제한된 LRU 방식으로 동작하며, 일정시간(TTL)이 지난 정보는 다시 조회합니다.
+    """
+
+    def __init__(self, max_size: int = 4096, ttl: float = 300) -> None:
+        """유저 정보 캐시
+
+        Args:
+            max_size (int, optional): 최대 저장 개수. Defaults to 4096.
+            ttl (float, optional): 정보 유지 시간 (초). Defaults to 300.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._rows: OrderedDict[int, tuple[float, UserRow]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, user_id: int) -> bool:
+        return self.get(user_id, count=False) is not None
+
+    @property
+    def hit_ratio(self) -> float:
+        """캐시 적중률을 반환합니다.
+
+        Returns:
+            float: 0 ~ 1 사이의 적중률
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """캐시 통계를 반환합니다.
+
+        Returns:
+            dict[str, int | float]: 크기, 적중, 실패, 적중률
+        """
+        return {
+            "size": len(self._rows),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+        }
+
+    def get(self, user_id: int, count: bool = True) -> UserRow | None:
+        """캐시된 유저 정보를 반환합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            count (bool, optional): 적중/실패 횟수에 반영할지 여부. Defaults to True.
+
+        Returns:
+            UserRow | None: 유저 정보, 없거나 만료되었으면 None
+        """
+        entry = self._rows.get(user_id)
+        if entry is not None:
+            expires_at, row = entry
+            if expires_at > time.monotonic():
+                self._rows.move_to_end(user_id)
+                if count:
+                    self.hits += 1
+                return row
+            del self._rows[user_id] # 만료된 정보 삭제
+
+        if count:
+            self.misses += 1
+        return None
+
+    def put(self, row: UserRow) -> None:
+        """유저 정보를 캐시에 저장합니다.
+
+        Args:
+            row (UserRow): (id, money, check_time)
+        """
+        user_id = row[UserInfoColumns.ID.value]
+        self._rows[user_id] = (time.monotonic() + self.ttl, row)
+        self._rows.move_to_end(user_id)
+
+        while len(self._rows) > self.max_size: # 가장 오래 사용되지 않은 정보부터 제거
+            self._rows.popitem(last=False)
+
+    def update(self, user_id: int, column: UserInfoColumns, value: int) -> None:
+        """캐시된 유저 정보의 값을 변경합니다.
+        캐시에 없는 유저라면 아무것도 하지 않습니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            column (UserInfoColumns): 변경할 컬럼
+            value (int): 변경할 값
+        """
+        row = self.get(user_id, count=False)
+        if row is None:
+            return
+
+        row = list(row)
+        row[column.value] = value
+        self.put(tuple(row))
+
+    def add_money(self, user_id: int, money: int) -> None:
+        """캐시된 유저의 돈을 추가합니다.
+        캐시에 없는 유저라면 아무것도 하지 않습니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            money (int): 추가할 돈
+        """
+        row = self.get(user_id, count=False)
+        if row is not None:
+            self.update(user_id, UserInfoColumns.MONEY, row[UserInfoColumns.MONEY.value] + money)
+
+    def invalidate(self, user_id: int) -> None:
+        """유저 정보를 캐시에서 제거합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+        """
+        self._rows.pop(user_id, None)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        self._rows.clear()
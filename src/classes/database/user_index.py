@@ -0,0 +1,104 @@
+import time
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+
+logger = logging.getLogger("discord.bot.database.user_index")
+
+
+class RegisteredUserIndex():
+    """등록된 유저 아이디를 메모리에 보관하는 인덱스
+
+    등록되지 않은 아이디는 일정시간 동안 따로 기억하여(negative cache) 반복 조회를 막습니다.
+    """
+
+    def __init__(self, database: "DataSQL", negative_ttl: float = 60) -> None:
+        """등록 유저 인덱스
+
+        Args:
+            database (DataSQL): 데이터베이스
+            negative_ttl (float, optional): 등록되지 않은 유저 정보를 기억하는 시간 (초). Defaults to 60.
+        """
+        self._database = database
+        self.negative_ttl = negative_ttl
+
+        self._ids: set[int] = set()
+        self._unknown: dict[int, float] = {} # 등록되지 않은 유저 아이디: 만료 시간
+        self._changes: list[tuple[int, bool]] | None = None # 다시 만드는 동안 바뀐 유저 (아이디, 등록 여부)
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def load(self) -> None:
+        """|coro|
+        user_info 테이블을 한번에 조회하여 인덱스를 다시 만듭니다.
+        주기적으로 실행하여 외부에서 변경된 내용을 반영합니다.
+        조회하는 동안 add, discard로 바뀐 유저는 조회 결과보다 새로운 정보이므로 새 인덱스에 다시 적용합니다.
+        """
+        self._changes = []
+        try:
+            result = await self._database._query("SELECT id FROM user_info", fetch=True)
+            ids = {int(row[0]) for row in result}
+            changes = self._changes
+        finally:
+            self._changes = None
+
+        if self.loaded:
+            added, removed = len(ids - self._ids), len(self._ids - ids)
+            if added or removed:
+                logger.info("Registered user index reconciled (+%s, -%s)", added, removed)
+        else:
+            logger.info("Registered user index loaded (%s users)", len(ids))
+
+        self._ids = ids
+        self._unknown.clear()
+        for user_id, registered in changes:
+            if registered:
+                self.add(user_id)
+            else:
+                self.discard(user_id)
+        self.loaded = True
+
+    def lookup(self, user_id: int) -> bool | None:
+        """인덱스에서 유저의 등록 여부를 확인합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            bool | None: 등록 여부, 인덱스만으로 알 수 없으면 None
+        """
+        if user_id in self._ids:
+            return True
+
+        expires_at = self._unknown.get(user_id)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                return False
+            del self._unknown[user_id]
+        return None
+
+    def add(self, user_id: int) -> None:
+        """유저를 등록된 유저로 기록합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+        """
+        self._ids.add(user_id)
+        self._unknown.pop(user_id, None)
+        if self._changes is not None:
+            self._changes.append((user_id, True))
+
+    def discard(self, user_id: int) -> None:
+        """유저를 등록되지 않은 유저로 기록합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+        """
+        self._ids.discard(user_id)
+        self._unknown[user_id] = time.monotonic() + self.negative_ttl
+        if self._changes is not None:
+            self._changes.append((user_id, False))
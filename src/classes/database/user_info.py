@@ -3,6 +3,8 @@ import discord
 import logging
 from typing import TYPE_CHECKING
 
+from src.classes.enums import UserInfoColumns, LedgerReason
+
 if TYPE_CHECKING:
     from .data_sql import DataSQL
 
@@ -13,12 +15,12 @@ class UserInfo():
     def __init__(self, database: "DataSQL", user: int | discord.User | discord.Member) -> None:
         self._database = database
 
-        if isinstance(user, (discord.User, discord.Member)):
-            self._user = user
-            self._user_id = user.id
-        else:
+        if isinstance(user, int):
             self._user = None
             self._user_id = user
+        else: # discord.User, discord.Member 등 id를 가진 객체
+            self._user = user
+            self._user_id = user.id
 
     @property
     def id(self) -> int:
@@ -29,6 +31,32 @@ class UserInfo():
         """
         return self._user_id
 
+    async def _get_row(self) -> tuple[int, int, int] | None:
+        """|coro|
+        유저 정보를 캐시에서 가져오고, 없으면 DB에서 조회하여 캐시에 저장합니다.
+
+        Returns:
+            tuple[int, int, int] | None: (id, money, check_time), 등록되지 않은 유저라면 None
+        """
+        row = self._database.user_cache.get(self._user_id)
+        if row is not None:
+            return row
+
+        logger.debug("Loading user %s", self._user_id)
+        if self._database.write_behind is not None:
+            await self._database.write_behind.flush_user(self._user_id) # 모아둔 변경 내용 반영 후 조회
+        result = await self._database.select(
+            table="user_info",
+            columns=["id", "money", "check_time"],
+            condition={"id": self._user_id}
+        )
+        if len(result) == 0:
+            return None
+
+        row = tuple(map(int, result[0]))
+        self._database.user_cache.put(row)
+        return row
+
 
     async def is_valid_user(self) -> bool:
         """|coro|
@@ -41,7 +69,16 @@ class UserInfo():
             bool: 유효 여부
         """
         # logger.debug(f"Checking if user {self._user_id} is valid")
-        return await self._database.count("user_info", {"id": self._user_id}) > 0
+        registered = self._database.user_index.lookup(self._user_id)
+        if registered is not None: # 인덱스에서 확인 가능한 경우
+            return registered
+
+        registered = await self._get_row() is not None
+        if registered:
+            self._database.user_index.add(self._user_id)
+        else:
+            self._database.user_index.discard(self._user_id)
+        return registered
 
     async def add_user(self) -> None:
         """|coro|
@@ -50,7 +87,7 @@ class UserInfo():
         Args:
             user_id (int): 유저 아이디
         """
-        logger.debug(f"Adding user {self._user_id}")
+        logger.debug("Adding user %s", self._user_id)
         await self._database.insert(
             table="user_info",
             data={
@@ -58,6 +95,8 @@ class UserInfo():
                 "money": 0
             }
         )
+        self._database.user_index.add(self._user_id)
+        self._database.leaderboard.set(self._user_id, 0)
 
     async def delete_user(self) -> None:
         """|coro|
@@ -66,8 +105,19 @@ class UserInfo():
         Args:
             user_id (int): 유저 아이디
         """
-        logger.debug(f"Deleting user {self._user_id}")
+        logger.debug("Deleting user %s", self._user_id)
+        previous = 0
+        if self._database.ledger is not None: # 장부에 남은 돈을 차감하여 기록하기 위해 조회
+            if self._database.write_behind is not None:
+                await self._database.write_behind.flush_user(self._user_id)
+            result = await self._database.select(table="user_info", columns=["money"], condition={"id": self._user_id})
+            previous = int(result[0][0]) if result else 0
         await self._database.delete(table="user_info", condition={"id": self._user_id})
+        self._database.user_cache.invalidate(self._user_id)
+        self._database.user_index.discard(self._user_id)
+        self._database.attendance.forget(self._user_id)
+        self._database.leaderboard.remove(self._user_id)
+        self._database.record_money(self._user_id, -previous, LedgerReason.UNREGISTER)
 
     async def get_money(self) -> int:
         """|coro|
@@ -76,29 +126,50 @@ class UserInfo():
         Returns:
             int: 돈
         """
-        logger.debug(f"Getting money of user {self._user_id}")
-        result = await self._database.select(table="user_info", columns=["money"], condition={"id": self._user_id})
-        return int(result[0][0])
+        logger.debug("Getting money of user %s", self._user_id)
+        return (await self._get_row())[UserInfoColumns.MONEY.value]
 
-    async def set_money(self, money: int) -> None:
+    async def set_money(self, money: int, reason: LedgerReason = LedgerReason.ADJUSTMENT) -> None:
         """|coro|
         유저의 돈을 설정합니다.
+        등록되지 않은 유저라면 아무것도 하지 않습니다.
 
         Args:
             money (int): 돈
+            reason (LedgerReason, optional): 장부에 기록할 이유. Defaults to LedgerReason.ADJUSTMENT.
         """
-        logger.debug(f"Setting money of user {self._user_id}")
+        logger.debug("Setting money of user %s", self._user_id)
+        previous = money
+        if self._database.ledger is not None: # 장부에 바뀐 돈을 기록하기 위해 조회
+            row = await self._get_row()
+            if row is None: # 등록되지 않은 유저
+                return
+            previous = row[UserInfoColumns.MONEY.value]
+        elif not await self.is_valid_user(): # 등록되지 않은 유저를 순위표에 추가하지 않도록 확인
+            return
+        if self._database.write_behind is not None:
+            await self._database.write_behind.flush_user(self._user_id) # 모아둔 변경 내용이 덮어쓴 값에 더해지지 않도록 먼저 반영
         await self._database.update(table="user_info", data={"money": money}, condition={"id": self._user_id})
+        self._database.user_cache.update(self._user_id, UserInfoColumns.MONEY, money)
+        self._database.leaderboard.set(self._user_id, money)
+        self._database.record_money(self._user_id, money - previous, reason)
 
-    async def add_money(self, money: int) -> None:
+    async def add_money(self, money: int, reason: LedgerReason = LedgerReason.ADJUSTMENT) -> None:
         """|coro|
         유저의 돈을 추가합니다.
 
         Args:
             money (int): 돈
+            reason (LedgerReason, optional): 장부에 기록할 이유. Defaults to LedgerReason.ADJUSTMENT.
         """
-        logger.debug(f"Adding money of user {self._user_id}")
-        await self._database._query("UPDATE user_info SET money=money+%s WHERE id=%s", (money, self._user_id))
+        logger.debug("Adding money of user %s", self._user_id)
+        if self._database.write_behind is not None:
+            self._database.write_behind.add(self._user_id, money) # 모아서 반영
+        else:
+            await self._database._query("UPDATE user_info SET money=money+%s WHERE id=%s", (money, self._user_id))
+        self._database.user_cache.add_money(self._user_id, money)
+        self._database.leaderboard.add(self._user_id, money)
+        self._database.record_money(self._user_id, money, reason)
 
     async def get_check_time(self) -> int:
         """|coro|
@@ -107,9 +178,8 @@ class UserInfo():
         Returns:
             int: 최근 출석체크 시간
         """
-        logger.debug(f"Getting check time of user {self._user_id}")
-        result = await self._database.select(table="user_info", columns=["check_time"], condition={"id": self._user_id})
-        return int(result[0][0])
+        logger.debug("Getting check time of user %s", self._user_id)
+        return (await self._get_row())[UserInfoColumns.CHECK_TIME.value]
 
     async def set_check_time(self, check_time: int) -> None:
         """|coro|
@@ -118,5 +188,7 @@ class UserInfo():
         Args:
             check_time (int): 최근 출석체크 시간
         """
-        logger.debug(f"Setting check time of user {self._user_id}")
+        logger.debug("Setting check time of user %s", self._user_id)
         await self._database.update(table="user_info", data={"check_time": check_time}, condition={"id": self._user_id})
+        self._database.user_cache.update(self._user_id, UserInfoColumns.CHECK_TIME, check_time)
+        self._database.attendance.forget(self._user_id) # 다음 확인 때 다시 불러옴
@@ -0,0 +1,113 @@
+import logging
+from typing import TYPE_CHECKING
+
+from src.classes.enums import UserInfoColumns, LedgerReason
+from src.classes.errors import BalanceChanged, NotRegisteredUser
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+
+logger = logging.getLogger("discord.bot.database.wallet")
+
+
+class Wallet():
+    """명령어 한번 동안 유저의 돈을 다루는 작업 단위 (unit of work)
+
+    유저 정보를 한번만 불러와서 모든 조회에 사용하고, 변경 내용은 모아두었다가 commit에서 한번에 반영합니다.
+    반영할 때는 불러온 돈과 DB의 돈이 같을 때만 바꾸는 조건부 UPDATE 하나를 실행하므로,
+    그 사이에 다른 곳에서 돈이 바뀌었다면 덮어쓰지 않고 BalanceChanged를 발생시킵니다.
+    """
+
+    def __init__(self, database: "DataSQL", user_id: int) -> None:
+        """지갑
+
+        Args:
+            database (DataSQL): 데이터베이스
+            user_id (int): 유저 아이디
+        """
+        self._database = database
+        self.user_id = user_id
+        self._loaded: int | None = None # 불러온 돈
+        self._delta = 0 # 반영하지 않은 변경 내용
+
+    @property
+    def loaded(self) -> bool:
+        """유저 정보를 불러왔는지 여부"""
+        return self._loaded is not None
+
+    @property
+    def balance(self) -> int:
+        """변경 내용을 포함한 현재 돈, load를 먼저 호출해야 합니다."""
+        if self._loaded is None:
+            raise RuntimeError("Wallet is not loaded")
+        return self._loaded + self._delta
+
+    @property
+    def pending(self) -> int:
+        """반영하지 않은 변경 내용"""
+        return self._delta
+
+    async def load(self) -> int:
+        """|coro|
+        유저의 돈을 불러옵니다. 이미 불러왔다면 다시 조회하지 않습니다.
+
+        Raises:
+            NotRegisteredUser: 등록되지 않은 유저일 때
+
+        Returns:
+            int: 현재 돈
+        """
+        if self._loaded is None:
+            row = await self._database.get_user_info(self.user_id)._get_row()
+            if row is None:
+                raise NotRegisteredUser()
+            self._loaded = row[UserInfoColumns.MONEY.value]
+        return self.balance
+
+    def add(self, money: int) -> None:
+        """돈 변경 내용을 추가합니다. commit을 호출해야 DB에 반영됩니다.
+
+        Args:
+            money (int): 추가할 돈 (음수면 차감)
+        """
+        self._delta += money
+
+    async def commit(self, reason: LedgerReason = LedgerReason.ADJUSTMENT) -> int:
+        """|coro|
+        변경 내용을 조건부 UPDATE 하나로 반영합니다.
+
+        Args:
+            reason (LedgerReason, optional): 장부에 기록할 이유. Defaults to LedgerReason.ADJUSTMENT.
+
+        Raises:
+            BalanceChanged: 불러온 뒤에 다른 곳에서 돈이 바뀌었을 때
+
+        Returns:
+            int: 반영된 돈
+        """
+        if self._loaded is None or self._delta == 0:
+            return self.balance
+
+        if self._database.write_behind is not None:
+            await self._database.write_behind.flush_user(self.user_id) # 모아둔 변경 내용을 반영해야 DB의 돈과 비교할 수 있음
+
+        money = self._loaded + self._delta
+        logger.debug("Committing money of user %s (%s -> %s)", self.user_id, self._loaded, money)
+        if await self._database._query(
+            "UPDATE user_info SET money=%s WHERE id=%s AND money=%s",
+            (money, self.user_id, self._loaded)
+        ) == 0:
+            self._database.user_cache.invalidate(self.user_id) # 캐시가 오래된 값이므로 다시 조회하도록 함
+            self.rollback()
+            self._loaded = None
+            raise BalanceChanged()
+
+        self._database.user_cache.update(self.user_id, UserInfoColumns.MONEY, money)
+        self._database.leaderboard.set(self.user_id, money)
+        self._database.record_money(self.user_id, self._delta, reason)
+        self._loaded, self._delta = money, 0
+        return money
+
+    def rollback(self) -> None:
+        """반영하지 않은 변경 내용을 버립니다."""
+        self._delta = 0
\ No newline at end of file
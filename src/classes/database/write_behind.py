@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data_sql import DataSQL
+
+logger = logging.getLogger("discord.bot.database.write_behind")
+
+
+class MoneyWriteBehind():
+    """돈 변경 내용을 모아두었다가 한번에 DB에 반영하는 쓰기 지연 큐
+
+    같은 유저의 변경 내용은 하나로 합쳐지며, 일정시간마다 하나의 UPDATE 문으로 반영됩니다.
+    """
+
+    BATCH_SIZE = 500 # UPDATE 문 하나에 들어가는 최대 유저 수
+
+    def __init__(self, database: "DataSQL", interval: float = 0.05) -> None:
+        """쓰기 지연 큐
+
+        Args:
+            database (DataSQL): 데이터베이스
+            interval (float, optional): DB에 반영하는 주기 (초). Defaults to 0.05.
+        """
+        self._database = database
+        self.interval = interval
+
+        self._pending: dict[int, int] = {} # 유저 아이디: 반영되지 않은 돈
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.enqueued = 0 # 추가된 변경 횟수
+        self.written = 0 # DB에 반영된 유저 수
+        self.flushes = 0 # DB에 반영한 횟수
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def start(self) -> None:
+        """주기적으로 DB에 반영하는 작업을 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """|coro|
+        주기적인 작업을 멈추고 남은 변경 내용을 모두 DB에 반영합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def add(self, user_id: int, money: int) -> None:
+        """유저의 돈 변경 내용을 추가합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+            money (int): 추가할 돈
+        """
+        self._pending[user_id] = self._pending.get(user_id, 0) + money
+        self.enqueued += 1
+
+    def pending(self, user_id: int) -> int:
+        """아직 DB에 반영되지 않은 유저의 돈을 반환합니다.
+
+        Args:
+            user_id (int): 유저 아이디
+
+        Returns:
+            int: 반영되지 않은 돈
+        """
+        return self._pending.get(user_id, 0)
+
+    async def _write(self, batch: dict[int, int]) -> None:
+        # lock을 잡은 상태에서 호출, 실패하면 반영되지 않은 내용을 다시 큐에 넣음
+        items = list(batch.items())
+        try:
+            for i in range(0, len(items), self.BATCH_SIZE):
+                chunk = items[i:i + self.BATCH_SIZE]
+                query = (
+                    f"UPDATE user_info SET money=money+CASE id {' '.join(['WHEN %s THEN %s'] * len(chunk))} END "
+                    f"WHERE id IN ({','.join(['%s'] * len(chunk))})"
+                )
+                args = tuple(value for item in chunk for value in item) + tuple(user_id for user_id, _ in chunk)
+                await self._database._query(query, args)
+                for user_id, _ in chunk: # 반영된 내용은 복구 대상에서 제외
+                    batch.pop(user_id)
+                self.written += len(chunk)
+        except BaseException:
+            for user_id, money in batch.items(): # 반영되지 않은 내용 복구
+                self._pending[user_id] = self._pending.get(user_id, 0) + money
+            raise
+        self.flushes += 1
+
+    async def flush(self) -> None:
+        """|coro|
+        모아둔 변경 내용을 DB에 반영합니다.
+        실패하면 변경 내용을 다시 큐에 넣고 예외를 발생시킵니다.
+        """
+        async with self._lock:
+            if not self._pending:
+                return
+
+            batch = {user_id: money for user_id, money in self._pending.items() if money != 0}
+            self._pending = {}
+            if batch:
+                await self._write(batch)
+
+    async def flush_user(self, *user_ids: int) -> None:
+        """|coro|
+        일부 유저의 모아둔 변경 내용만 DB에 반영합니다.
+        DB의 값을 조회하거나 비교하기 전에 사용하며, 다른 유저의 변경 내용은 계속 모아둡니다.
+
+        Args:
+            *user_ids (int): 유저 아이디
+        """
+        async with self._lock: # 반영하는 중인 변경 내용이 있다면 끝날 때까지 기다림
+            batch = {}
+            for user_id in user_ids:
+                money = self._pending.pop(user_id, 0)
+                if money != 0:
+                    batch[user_id] = money
+            if batch:
+                await self._write(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush pending money changes")
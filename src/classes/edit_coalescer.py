@@ -0,0 +1,185 @@
+import discord
+
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger("discord.classes.edit_coalescer")
+
+
+class _PendingEdit():
+    __slots__ = ("message", "kwargs", "waiters")
+
+    def __init__(self, message: discord.Message, kwargs: dict[str, Any]) -> None:
+        self.message = message
+        self.kwargs = kwargs
+        self.waiters: list[asyncio.Future] = []
+
+
+class _ChannelQueue():
+    __slots__ = ("edits", "tokens", "updated", "task")
+
+    def __init__(self, tokens: float) -> None:
+        self.edits: OrderedDict[int, _PendingEdit] = OrderedDict() # 메시지 아이디: 보내지 않은 수정 (먼저 들어온 순서)
+        self.tokens = tokens
+        self.updated = time.monotonic()
+        self.task: asyncio.Task | None = None
+
+
+class MessageEditCoalescer():
+    """메시지 수정을 메시지마다 합쳐서 보내는 큐
+
+    아직 보내지 않은 수정이 있는 메시지를 다시 수정하면 두 수정을 하나로 합치므로,
+    오래된 상태가 최신 상태 앞에서 기다리지 않습니다.
+    채널마다 token bucket으로 수정 속도를 제한하여 디스코드의 rate limit에 걸리지 않도록 합니다.
+    상호작용 응답(interaction.response)은 이 큐를 거치지 않고 바로 보내야 합니다.
+    """
+
+    def __init__(self, rate: int = 5, per: float = 5.0, max_pending: int = 1000) -> None:
+        """메시지 수정 큐
+
+        Args:
+            rate (int, optional): 채널마다 per초 동안 보낼 수 있는 수정 수. Defaults to 5.
+            per (float, optional): rate의 기준 시간 (초). Defaults to 5.0.
+            max_pending (int, optional): 채널마다 보내지 않고 쌓아둘 수 있는 최대 메시지 수. Defaults to 1000.
+        """
+        self.rate = rate
+        self.per = per
+        self.max_pending = max_pending
+        self._channels: dict[int, _ChannelQueue] = {}
+
+        self.submitted = 0 # 요청된 수정 수
+        self.sent = 0 # 실제로 보낸 수정 수
+        self.superseded = 0 # 최신 수정에 합쳐져 따로 보내지 않은 수정 수
+        self.dropped = 0 # 큐가 가득 차거나 메시지가 없어 버려진 수정 수
+        self.failed = 0 # 보내다가 오류가 발생한 수정 수
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """메시지 수정 통계"""
+        return {
+            "pending": sum(len(queue.edits) for queue in self._channels.values()),
+            "channels": len(self._channels),
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "superseded": self.superseded,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def edit(self, message: discord.Message, **kwargs: Any) -> asyncio.Future:
+        """메시지 수정을 예약합니다.
+        같은 메시지에 보내지 않은 수정이 있다면 이번 수정의 값으로 덮어써서 한번만 보냅니다.
+
+        Args:
+            message (discord.Message): 수정할 메시지
+            **kwargs (Any): message.edit에 넘길 인자
+
+        Returns:
+            asyncio.Future: 수정을 보내면 True, 보내지 못하면 False가 되는 Future (기다리지 않아도 됨)
+        """
+        self.submitted += 1
+        future = asyncio.get_running_loop().create_future()
+
+        queue = self._channels.get(message.channel.id)
+        if queue is None:
+            queue = self._channels[message.channel.id] = _ChannelQueue(self.rate)
+
+        pending = queue.edits.get(message.id)
+        if pending is not None:
+            self.superseded += 1
+            pending.message = message
+            pending.kwargs.update(kwargs)
+        elif len(queue.edits) >= self.max_pending:
+            self.dropped += 1
+            logger.warning("Edit queue of channel %s is full, dropping edit of message %s", message.channel.id, message.id)
+            future.set_result(False)
+            return future
+        else:
+            pending = queue.edits[message.id] = _PendingEdit(message, kwargs)
+        pending.waiters.append(future)
+
+        if queue.task is None:
+            queue.task = asyncio.create_task(self._drain(message.channel.id, queue))
+        return future
+
+    def discard(self, message: discord.Message) -> bool:
+        """보내지 않은 메시지 수정을 취소합니다.
+        상호작용 응답으로 메시지를 직접 수정하기 전에 호출하여, 오래된 수정이 나중에 덮어쓰지 않도록 합니다.
+
+        Args:
+            message (discord.Message): 메시지
+
+        Returns:
+            bool: 취소한 수정이 있었는지 여부
+        """
+        queue = self._channels.get(message.channel.id)
+        pending = queue.edits.pop(message.id, None) if queue is not None else None
+        if pending is None:
+            return False
+
+        self.superseded += len(pending.waiters)
+        self._resolve(pending, False)
+        return True
+
+    def _resolve(self, pending: _PendingEdit, result: bool) -> None:
+        for future in pending.waiters:
+            if not future.done():
+                future.set_result(result)
+
+    async def _take_token(self, queue: _ChannelQueue) -> None:
+        while True:
+            now = time.monotonic()
+            queue.tokens = min(self.rate, queue.tokens + (now - queue.updated) * self.rate / self.per)
+            queue.updated = now
+            if queue.tokens >= 1:
+                queue.tokens -= 1
+                return
+            await asyncio.sleep((1 - queue.tokens) * self.per / self.rate)
+
+    async def _drain(self, channel_id: int, queue: _ChannelQueue) -> None:
+        try:
+            while queue.edits:
+                await self._take_token(queue)
+                if not queue.edits: # 기다리는 동안 모두 취소됨
+                    break
+
+                _, pending = queue.edits.popitem(last=False)
+                try:
+                    await pending.message.edit(**pending.kwargs)
+                except discord.NotFound:
+                    self.dropped += 1
+                    self._resolve(pending, False)
+                except discord.HTTPException as e:
+                    self.failed += 1
+                    logger.warning("Failed to edit message %s: %s", pending.message.id, e)
+                    self._resolve(pending, False)
+                except Exception:
+                    self.failed += 1
+                    logger.exception("Failed to edit message %s", pending.message.id)
+                    self._resolve(pending, False)
+                else:
+                    self.sent += 1
+                    self._resolve(pending, True)
+        finally:
+            queue.task = None
+            if queue.edits: # 작업이 취소되었다면 남은 수정은 보내지 않음
+                for pending in queue.edits.values():
+                    self._resolve(pending, False)
+                queue.edits.clear()
+            if self._channels.get(channel_id) is queue and queue.tokens >= self.rate - 1:
+                del self._channels[channel_id] # 사용량이 적은 채널은 정리
+
+    async def close(self) -> None:
+        """|coro|
+        보내지 않은 수정을 모두 취소합니다.
+        """
+        for queue in list(self._channels.values()):
+            for pending in queue.edits.values():
+                self._resolve(pending, False)
+            queue.edits.clear()
+            if queue.task is not None:
+                queue.task.cancel()
+        self._channels.clear()
\ No newline at end of file
@@ -8,6 +8,15 @@ class UserInfoColumns(Enum):
     CHECK_TIME = 2
 
 
+class LedgerReason(Enum):
+    ATTENDANCE = "attendance" # 돈받기
+    FISH_SALE = "fish_sale" # 물고기 판매
+    COIN_FLIP = "coin_flip" # 동전던지기
+    TRANSFER = "transfer" # 송금
+    UNREGISTER = "unregister" # 유저 삭제
+    ADJUSTMENT = "adjustment" # 관리자 변경 등 기타
+
+
 class FishInfoColumns(Enum):
     ID = 0
     NAME = 1
@@ -1,4 +1,16 @@
 from discord.ext import commands
 
 # DB에 없는 유저
-class NotRegisteredUser(commands.CheckFailure): ...
\ No newline at end of file
+class NotRegisteredUser(commands.CheckFailure): ...
+
+# DB 커넥션을 가져올 수 없음 (커넥션 풀 포화)
+class DatabaseBusy(commands.CommandError): ...
+
+# 다른 작업이 유저를 잠그고 있어 처리할 수 없음
+class UserBusy(commands.CommandError): ...
+
+# 돈을 불러온 뒤에 다른 작업이 돈을 바꿔서 반영하지 못함
+class BalanceChanged(commands.CommandError): ...
+
+# 잡을 수 있는 물고기가 없음 (fish_info 테이블이 비어있음)
+class NoFishAvailable(commands.CommandError): ...
\ No newline at end of file
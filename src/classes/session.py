@@ -0,0 +1,225 @@
+import time
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from enum import Enum
+
+from src.classes.errors import UserBusy
+
+
+class SessionKind(Enum):
+    FISHING = "fishing" # 낚시중
+    TIC_TAC_TOE = "tic_tac_toe" # 틱택토 게임중
+
+
+class SessionRegistry(ABC):
+    """유저가 진행중인 세션(낚시, 게임 등)을 기록하는 저장소
+
+    여러 샤드나 프로세스에서 같은 유저가 동시에 세션을 시작하지 못하도록 막는 데 사용합니다.
+    세션은 ttl이 지나면 자동으로 만료되어, 프로세스가 종료되어도 영원히 남지 않습니다.
+    모든 메서드는 같은 유저에 대해 원자적으로 동작해야 합니다.
+
+    돈을 바꾸는 작업은 economy_lock으로 유저마다 하나씩만 실행되도록 합니다.
+    """
+
+    shared = False # 다른 프로세스와 공유되는 저장소인지 여부
+
+    def __init__(self, default_ttl: float = 600, lock_timeout: float = 10) -> None:
+        """세션 저장소
+
+        Args:
+            default_ttl (float, optional): 세션이 자동으로 만료되는 시간 (초). Defaults to 600.
+            lock_timeout (float, optional): economy_lock을 기다리는 최대 시간 (초). Defaults to 10.
+        """
+        self.default_ttl = default_ttl
+        self.lock_timeout = lock_timeout
+
+        self._locks: dict[int, list[asyncio.Lock | int]] = {} # 유저 아이디: [프로세스 안의 잠금, 사용중인 작업 수]
+        self.lock_waits = 0 # 다른 작업이 끝나기를 기다린 횟수
+        self.lock_timeouts = 0 # 잠금을 얻지 못한 횟수
+
+    async def setup(self) -> None:
+        """|coro|
+        저장소를 사용할 준비를 합니다. (테이블 생성 등)
+        """
+
+    async def close(self) -> None:
+        """|coro|
+        저장소를 정리합니다.
+        """
+
+    @abstractmethod
+    async def acquire(self, kind: SessionKind, user_id: int, ttl: float | None = None) -> bool:
+        """|coro|
+        유저의 세션을 시작합니다.
+
+        Args:
+            kind (SessionKind): 세션 종류
+            user_id (int): 유저 아이디
+            ttl (float | None, optional): 세션이 자동으로 만료되는 시간 (초), None이면 default_ttl. Defaults to None.
+
+        Returns:
+            bool: 세션 시작 여부, 이미 진행중인 세션이 있으면 False
+        """
+
+    @abstractmethod
+    async def release(self, kind: SessionKind, user_id: int) -> bool:
+        """|coro|
+        유저의 세션을 종료합니다.
+
+        Args:
+            kind (SessionKind): 세션 종류
+            user_id (int): 유저 아이디
+
+        Returns:
+            bool: 종료 여부, 진행중인 세션이 없었으면 False
+        """
+
+    @abstractmethod
+    async def is_active(self, kind: SessionKind, user_id: int) -> bool:
+        """|coro|
+        유저가 세션을 진행중인지 확인합니다.
+
+        Args:
+            kind (SessionKind): 세션 종류
+            user_id (int): 유저 아이디
+
+        Returns:
+            bool: 진행중 여부
+        """
+
+    @abstractmethod
+    async def count(self, kind: SessionKind) -> int:
+        """|coro|
+        진행중인 세션 수를 반환합니다.
+
+        Args:
+            kind (SessionKind): 세션 종류
+
+        Returns:
+            int: 세션 수
+        """
+
+    async def _lock_shared(self, user_id: int, timeout: float) -> bool:
+        """|coro|
+        다른 프로세스와 공유되는 유저 잠금을 얻습니다.
+        프로세스 안의 잠금을 얻은 뒤에 호출됩니다.
+
+        Returns:
+            bool: 잠금 성공 여부
+        """
+        return True
+
+    async def _unlock_shared(self, user_id: int) -> None:
+        """|coro|
+        다른 프로세스와 공유되는 유저 잠금을 해제합니다.
+        """
+
+    def _holds_shared(self, user_id: int) -> bool:
+        """다른 프로세스와 공유되는 유저 잠금을 아직 가지고 있는지 여부를 반환합니다.
+        잠금이 커넥션에 묶이는 저장소는 커넥션이 끊기면 잠금을 잃을 수 있습니다.
+
+        Returns:
+            bool: 잠금을 가지고 있는지 여부
+        """
+        return True
+
+    async def _lock(self, user_id: int, deadline: float) -> bool:
+        entry = self._locks.get(user_id)
+        if entry is None:
+            entry = self._locks[user_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+
+        lock: asyncio.Lock = entry[0]
+        try:
+            if lock.locked():
+                self.lock_waits += 1
+            async with asyncio.timeout(max(deadline - time.monotonic(), 0)): # wait_for는 잠금을 얻고도 시간 초과를 발생시킬 수 있음
+                await lock.acquire()
+        except TimeoutError:
+            self._drop_lock(user_id)
+            return False
+
+        try:
+            locked = await self._lock_shared(user_id, max(deadline - time.monotonic(), 0))
+        except BaseException:
+            locked = False
+            raise
+        finally:
+            if not locked:
+                lock.release()
+                self._drop_lock(user_id)
+        return locked
+
+    async def _unlock(self, user_id: int) -> None:
+        try:
+            await self._unlock_shared(user_id)
+        finally:
+            self._locks[user_id][0].release()
+            self._drop_lock(user_id)
+
+    def _drop_lock(self, user_id: int) -> None:
+        entry = self._locks[user_id]
+        entry[1] -= 1
+        if entry[1] == 0: # 기다리는 작업이 없으면 잠금 정리
+            del self._locks[user_id]
+
+    @asynccontextmanager
+    async def economy_lock(self, *user_ids: int):
+        """유저의 돈을 바꾸는 작업이 하나씩만 실행되도록 잠급니다.
+        여러 유저를 잠글 때는 교착 상태를 막기 위해 아이디 순서대로 잠급니다.
+
+        Args:
+            *user_ids (int): 잠글 유저 아이디
+
+        Raises:
+            UserBusy: lock_timeout 안에 잠금을 얻지 못했을 때
+        """
+        deadline = time.monotonic() + self.lock_timeout
+        locked: list[int] = []
+        try:
+            for user_id in sorted(set(user_ids)):
+                if not await self._lock(user_id, deadline):
+                    self.lock_timeouts += 1
+                    raise UserBusy("다른 작업을 처리하는 중입니다.")
+                locked.append(user_id)
+            if not all(map(self._holds_shared, locked)): # 다른 유저를 잠그는 도중 앞서 얻은 잠금을 잃음
+                self.lock_timeouts += 1
+                raise UserBusy("다른 작업을 처리하는 중입니다.")
+            yield
+        finally:
+            for user_id in reversed(locked):
+                await self._unlock(user_id)
+
+
+class InProcessSessionRegistry(SessionRegistry):
+    """현재 프로세스의 메모리에 세션을 기록하는 저장소
+
+    한 프로세스 안의 여러 샤드끼리는 공유되지만, 다른 프로세스와는 공유되지 않습니다.
+    """
+
+    def __init__(self, default_ttl: float = 600, lock_timeout: float = 10) -> None:
+        super().__init__(default_ttl, lock_timeout)
+        self._sessions: dict[SessionKind, dict[int, float]] = {kind: {} for kind in SessionKind} # 유저 아이디: 만료 시간
+
+    async def acquire(self, kind: SessionKind, user_id: int, ttl: float | None = None) -> bool:
+        sessions = self._sessions[kind]
+        now = time.monotonic()
+        if sessions.get(user_id, 0) > now:
+            return False
+        sessions[user_id] = now + (self.default_ttl if ttl is None else ttl)
+        return True
+
+    async def release(self, kind: SessionKind, user_id: int) -> bool:
+        expires_at = self._sessions[kind].pop(user_id, None)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    async def is_active(self, kind: SessionKind, user_id: int) -> bool:
+        return self._sessions[kind].get(user_id, 0) > time.monotonic()
+
+    async def count(self, kind: SessionKind) -> int:
+        sessions = self._sessions[kind]
+        now = time.monotonic()
+        for user_id in [user_id for user_id, expires_at in sessions.items() if expires_at <= now]:
+            del sessions[user_id] # 만료된 세션 정리
+        return len(sessions)
\ No newline at end of file
@@ -0,0 +1,183 @@
+import discord
+from discord.ext import commands
+
+from src.classes.bot import Bot, Cog
+from src.classes.session import SessionKind
+
+
+class Admin(Cog):
+    async def cog_check(self, ctx: commands.Context[Bot]) -> bool:
+        if not await self.bot.is_owner(ctx.author): # 관리자만 사용 가능
+            raise commands.NotOwner()
+        return True
+
+    async def cog_command_error(self, ctx: commands.Context[Bot], error: commands.CommandError):
+        if isinstance(error, commands.NotOwner):
+            await ctx.reply("이 명령어는 관리자만 사용할 수 있습니다.")
+            ctx.command_failed = False
+
+
+    @commands.command(
+        name="쿼리통계",
+        aliases=["ㅋㄹㅌㄱ", "qstat"],
+        description="실행 시간이 긴 쿼리 순위를 확인합니다.",
+        usage="쿼리통계 [개수]"
+    )
+    async def query_stats(self, ctx: commands.Context[Bot], count: int = 10):
+        query_stats = self.database.query_stats
+        embed = discord.Embed(
+            title="쿼리통계",
+            description=f"총 {query_stats.total_queries:,}회 실행, 느린 쿼리 기준 {query_stats.slow_threshold_ms:g}ms",
+            color=discord.Color.random()
+        )
+        for n, (query, stats) in enumerate(query_stats.top(min(max(count, 1), 25))):
+            embed.add_field(
+                name=f"{n+1}. 총 {stats.total*1000:,.1f}ms ({stats.count:,}회)",
+                value=(
+                    f"```sql\n{query[:900]}```"
+                    f"평균 {stats.average*1000:.2f}ms | p99 ≤{stats.percentile(0.99):g}ms | "
+                    f"최대 {stats.max*1000:.1f}ms | {stats.rows:,}행"
+                ),
+                inline=False
+            )
+
+        pool = self.database.pool_stats
+        embed.set_footer(
+            text=f"커넥션 {pool.get('in_use', 0)}/{pool.get('maxsize', 0)} 사용중 | "
+                 f"대기 {pool['waiters']} | 평균 대기 {pool['average_wait_ms']:.2f}ms"
+        )
+        await ctx.reply(embed=embed)
+
+
+    @commands.command(
+        name="샤드",
+        aliases=["ㅅㄷ", "shard"],
+        description="샤드별 상태와 처리한 메시지 수를 확인합니다.",
+        usage="샤드"
+    )
+    async def shard_stats(self, ctx: commands.Context[Bot]):
+        guild_counts: dict[int, int] = {}
+        member_counts: dict[int, int] = {}
+        for guild in self.bot.guilds:
+            guild_counts[guild.shard_id] = guild_counts.get(guild.shard_id, 0) + 1
+            member_counts[guild.shard_id] = member_counts.get(guild.shard_id, 0) + (guild.member_count or 0)
+
+        shards = getattr(self.bot, "shards", None) # 샤드 모드가 아니면 None
+        if shards:
+            latencies = {shard_id: shard.latency for shard_id, shard in shards.items()}
+            closed = {shard_id for shard_id, shard in shards.items() if shard.is_closed()}
+        else:
+            latencies = {ctx.guild.shard_id: self.bot.latency}
+            closed = set()
+
+        embed = discord.Embed(
+            title="샤드",
+            description=f"전체 샤드 {self.bot.shard_count or 1}개 중 {len(latencies)}개 실행중",
+            color=discord.Color.random()
+        )
+        for shard_id, latency in sorted(latencies.items()):
+            embed.add_field(
+                name=f"{'🔴' if shard_id in closed else '🟢'} 샤드 {shard_id}",
+                value=(
+                    f"지연시간 {latency*1000:.0f}ms\n"
+                    f"서버 {guild_counts.get(shard_id, 0):,}개 | 멤버 {member_counts.get(shard_id, 0):,}명"
+                )
+            )
+
+        embed.add_field(
+            name="메시지",
+            value=f"명령어 처리 {self.bot.dispatched_messages:,} | 무시 {self.bot.rejected_messages:,}",
+            inline=False
+        )
+
+        sessions = self.bot.sessions
+        embed.set_footer(
+            text=f"현재 샤드 {ctx.guild.shard_id} | "
+                 f"낚시중 {await sessions.count(SessionKind.FISHING)}명 | "
+                 f"틱택토 {await sessions.count(SessionKind.TIC_TAC_TOE)}명"
+        )
+        await ctx.reply(embed=embed)
+
+
+    @commands.command(
+        name="타이머",
+        aliases=["ㅌㅇㅁ", "timer"],
+        description="타이머 스케줄러, 메시지 수정 큐와 진행중인 낚시 상태를 확인합니다.",
+        usage="타이머"
+    )
+    async def timer_stats(self, ctx: commands.Context[Bot]):
+        stats = self.bot.timer_wheel.stats
+        embed = discord.Embed(
+            title="타이머",
+            description=f"예약된 타이머 {stats['active']:,}개 | 실행중인 콜백 {stats['running_callbacks']:,}개",
+            color=discord.Color.random()
+        )
+        embed.add_field(
+            name="스케줄러",
+            value=(
+                f"예약 {stats['scheduled']:,} | 실행 {stats['fired']:,} | 취소 {stats['cancelled']:,}\n"
+                f"오류 {stats['errors']:,} | 최대 지연 {stats['max_lag_ms']:.1f}ms"
+            ),
+            inline=False
+        )
+
+        edits = self.bot.edit_coalescer.stats
+        embed.add_field(
+            name="메시지 수정",
+            value=(
+                f"대기 {edits['pending']:,}개 ({edits['channels']:,}채널) | 요청 {edits['submitted']:,} | 전송 {edits['sent']:,}\n"
+                f"합쳐짐 {edits['superseded']:,} | 버려짐 {edits['dropped']:,} | 실패 {edits['failed']:,}"
+            ),
+            inline=False
+        )
+
+        fishing = self.bot.get_cog("Fishing")
+        if fishing is not None:
+            embed.add_field(
+                name="낚시",
+                value=(
+                    f"진행중 {len(fishing.active_views):,}/{fishing.max_sessions:,}명 | 거절 {fishing.stats['rejected']:,}\n"
+                    f"시작 {fishing.stats['started']:,} | 잡음 {fishing.stats['caught']:,} | "
+                    f"일찍 들어올림 {fishing.stats['early']:,} | 놓침 {fishing.stats['escaped']:,}"
+                ),
+                inline=False
+            )
+        await ctx.reply(embed=embed)
+
+
+    @commands.command(
+        name="장부",
+        aliases=["ㅈㅂ", "ledger"],
+        description="유저의 돈 변경 내역을 확인합니다.",
+        usage="장부 <유저명> [개수]"
+    )
+    async def ledger(self, ctx: commands.Context[Bot], user: discord.Member, count: int = 10):
+        ledger = self.database.ledger
+        if ledger is None:
+            await ctx.reply("장부를 사용하지 않고 있습니다.")
+            return
+
+        entries = await ledger.history(user.id, limit=min(max(count, 1), 25))
+        replayed = await ledger.replay(user.id)
+        user_info = self.database.get_user_info(user.id)
+        money = await user_info.get_money() if await user_info.is_valid_user() else None # 탈퇴한 유저도 장부는 남아있음
+        embed = discord.Embed(
+            title=f"{user.display_name}님의 장부",
+            description=(
+                f"현재 자산 {'미등록' if money is None else f'{money:,}원'} | "
+                f"스냅샷 기준 계산 {'없음' if replayed is None else f'{replayed:,}원'}"
+            ),
+            color=discord.Color.random()
+        )
+        for user_id, amount, reason, balance, created_at in entries:
+            embed.add_field(
+                name=f"{amount:+,}원 ({reason})",
+                value=f"<t:{int(created_at)}:f>" + ("" if balance is None else f" | 잔액 {balance:,}원"),
+                inline=False
+            )
+        embed.set_footer(text=f"기록 {ledger.recorded:,} | 추가 {ledger.written:,} | 대기 {len(ledger):,} | 정리한 테이블 {ledger.compacted:,}")
+        await ctx.reply(embed=embed)
+
+
+async def setup(bot: Bot): # setup 함수로 명령어 추가
+    await bot.add_cog(Admin(bot))
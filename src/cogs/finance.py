@@ -1,8 +1,8 @@
 import discord
 from discord.ext import commands
 
+import heapq
 import random
-from datetime import datetime, timedelta
 
 from src.classes import command_checks
 from src.classes.bot import Bot, Cog
@@ -47,25 +47,32 @@ class Finance(Cog):
         usage="랭킹"
     )
     async def ranking(self, ctx: commands.Context[Bot]):
-        info = tuple( # db에서 유저정보 가져오기
-            map(
-                lambda x: tuple(map(int, x)),
-                await self.database._query(
-                    f"SELECT id, money FROM user_info WHERE id IN ({','.join(['%s'] * len(ctx.guild.members))});",
-                    [member.id for member in ctx.guild.members],
-                    fetch=True
-                )
+        leaderboard = self.database.leaderboard
+        info: list[tuple[discord.Member, int]] = []
+        if len(ctx.guild.members) <= len(leaderboard): # 서버 멤버가 더 적으면 멤버의 돈만 확인하여 상위 10명 선택
+            ranked = (
+                (member, money) for member in ctx.guild.members
+                if (money := leaderboard.get_money(member.id)) is not None
             )
-        )
-        info = sorted(info, key=lambda x: x[1], reverse=True)[:10] # 돈 순으로 정렬
+            info = heapq.nsmallest(10, ranked, key=lambda item: (-item[1], item[0].id)) # 순위표와 같은 순서
+        else:
+            for id, money in leaderboard.iter_top(): # 돈 순으로 서버 멤버만 가져오기
+                user = ctx.guild.get_member(id)
+                if user is None:
+                    continue
+                info.append((user, money))
+                if len(info) >= 10:
+                    break
 
         embed = discord.Embed(
             title="자산랭킹",
             color=discord.Color.random()
         )
-        embed.set_footer(text="랭킹은 최대 10명으로 제한됩니다.")
-        for n, (id, money) in enumerate(info):
-            user = ctx.guild.get_member(id)
+        footer = "랭킹은 최대 10명으로 제한됩니다."
+        if (rank := leaderboard.rank(ctx.author.id)) is not None:
+            footer += f" (내 순위: 전체 {rank:,}위)"
+        embed.set_footer(text=footer)
+        for n, (user, money) in enumerate(info):
             embed.add_field(name=f"{n+1}위", value=f"{user.display_name} ({money:,}원)", inline=False)
 
         await ctx.reply(embed=embed)
@@ -79,31 +86,42 @@ class Finance(Cog):
     )
     @command_checks.is_registered() # 사용자 등록 여부 확인
     async def attendance(self, ctx: commands.Context[Bot]):
-        user_info = self.database.get_user_info(ctx.author.id)
+        attendance = self.database.attendance
+        cooldown = self.bot_setting.attendance_cooldown * 3600
+        remaining = attendance.remaining(ctx.author.id, cooldown)
+        if remaining is not None and remaining > 0: # 쿨타임 중이면 DB 조회 없이 안내
+            await self._reply_attendance_cooldown(ctx, remaining, attendance.next_time(ctx.author.id, cooldown))
+            return
 
-        cooldown = timedelta(hours=self.bot_setting.attendance_cooldown)
-        check_time = datetime.utcfromtimestamp(await user_info.get_check_time()) # 출석체크 시간 가져오기
-        if (check_time + cooldown) <= datetime.utcnow(): # 시간 비교
-            if random.random() < self.bot_setting.attendance_bonus_money_prob:
-                money = self.bot_setting.attendance_bonus_money
-                message = f"축하합니다!🎉 {self.bot_setting.attendance_bonus_money_prob*100}% 확률을 뚫고 {money:,}원을 받았습니다."
-            else:
-                money = random.randint(
-                    self.bot_setting.attendance_random_money_min,
-                    self.bot_setting.attendance_random_money_max
-                ) * self.bot_setting.attendance_multiple # 돈 추출
-                message = f"{money:,}원을 받았습니다."
-            message += f"\n다음 돈받기 시간은 <t:{int((datetime.now() + cooldown).timestamp())}:T> 입니다."
-
-            await user_info.add_money(money) # 돈 추가
-            await user_info.set_check_time(int(datetime.now().timestamp())) # 출석체크 시간 업데이트
-            await ctx.reply(message)
+        if random.random() < self.bot_setting.attendance_bonus_money_prob:
+            money = self.bot_setting.attendance_bonus_money
+            message = f"축하합니다!🎉 {self.bot_setting.attendance_bonus_money_prob*100}% 확률을 뚫고 {money:,}원을 받았습니다."
+        else:
+            money = random.randint(
+                self.bot_setting.attendance_random_money_min,
+                self.bot_setting.attendance_random_money_max
+            ) * self.bot_setting.attendance_multiple # 돈 추출
+            message = f"{money:,}원을 받았습니다."
+
+        async with self.bot.economy_lock(ctx.author.id): # 다른 작업이 돈을 바꾸는 중이면 기다림
+            claimed = await attendance.claim(ctx.author.id, money, cooldown) # 쿨타임 확인, 돈 추가, 시간 기록을 한번에
 
+        if claimed:
+            message += f"\n다음 돈받기 시간은 <t:{attendance.next_time(ctx.author.id, cooldown)}:T> 입니다."
+            await ctx.reply(message)
+        elif attendance.next_time(ctx.author.id, cooldown) is None: # 출석체크 도중 유저 정보가 삭제됨
+            await ctx.reply("사용자 등록을 먼저 해 주세요.")
         else:
-            remaining_time = (check_time + cooldown) - datetime.utcnow() # 남은 시간 계산
-            hours, remainder = map(int, divmod(remaining_time.total_seconds(), 3600))
-            minutes, seconds = map(int, divmod(remainder, 60))
-            await ctx.reply(f"돈받기를 하려면 {hours}시간 {minutes}분 {seconds}초를 더 기다려야 합니다.\n다음 돈받기 시간은 <t:{int((check_time + cooldown).timestamp())}:T> 입니다.")
+            await self._reply_attendance_cooldown(
+                ctx,
+                attendance.remaining(ctx.author.id, cooldown) or 0,
+                attendance.next_time(ctx.author.id, cooldown)
+            )
+
+    async def _reply_attendance_cooldown(self, ctx: commands.Context[Bot], remaining: float, next_time: int):
+        hours, remainder = map(int, divmod(max(remaining, 0), 3600))
+        minutes, seconds = map(int, divmod(remainder, 60))
+        await ctx.reply(f"돈받기를 하려면 {hours}시간 {minutes}분 {seconds}초를 더 기다려야 합니다.\n다음 돈받기 시간은 <t:{next_time}:T> 입니다.")
 
 
     @commands.command(
@@ -127,14 +145,13 @@ class Finance(Cog):
             await ctx.reply("송금 금액은 1원 이상이어야 합니다.")
             return
 
-        user_money = await user_info.get_money() # 돈 정보를 가져옴
-        if money > user_money: # 송금이 불가능하면
+        async with self.bot.economy_lock(user_info.id, other_user_info.id):
+            balances = await self.database.transfer(user_info.id, other_user_info.id, money) # 잔액 확인 및 송금
+        if balances is None: # 송금이 불가능하면
             await ctx.reply("돈이 부족합니다.")
             return
 
-        await user_info.set_money(user_money - money)
-        await other_user_info.add_money(money)
-        await ctx.reply(f"{other_user.display_name}님에게 {money:,}원을 송금했습니다.")
+        await ctx.reply(f"{other_user.display_name}님에게 {money:,}원을 송금했습니다. (현재 자산: {balances[0]:,}원)")
 
     @send_money.error
     async def send_money_error(self, ctx: commands.Context[Bot], error: commands.CommandError):
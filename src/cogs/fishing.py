@@ -1,12 +1,18 @@
 import discord
 from discord.ext import commands
 
-import asyncio
+import os
 import random
 
 from src.classes import command_checks
 from src.classes.bot import Bot, Cog
-from src.classes.enums import fish_embed_color
+from src.classes.enums import fish_embed_color, fish_kor_name, LedgerReason
+from src.classes.errors import NoFishAvailable, UserBusy
+from src.classes.session import SessionKind
+from src.utils.timer_wheel import TimerHandle
+
+NET_SIZE = 10 # 그물낚시 한번에 잡는 물고기 수 기본값
+NET_COOLDOWN = float(os.getenv("FISHING_NET_COOLDOWN", 600)) # 그물낚시 쿨타임 (초)
 
 
 class FishingButton(discord.ui.Button["FishingView"]):
@@ -21,25 +27,25 @@ class FishingButton(discord.ui.Button["FishingView"]):
         if view.ctx.author != interaction.user: # 본인이 맞는지 확인
             return
 
-        if interaction.user not in view.fishing_users: # 다른 플랫폼에서 동시에 누르는걸 방지
+        if not await view.sessions.release(SessionKind.FISHING, interaction.user.id): # 다른 플랫폼에서 동시에 누르는걸 방지
             return
 
-        view.logic_task.cancel()
-        view.fishing_users.remove(interaction.user)
-        view.stop()
+        view.finish()
 
         embed = None
         match self.style:
             case discord.ButtonStyle.gray:
                 content = "낚싯대를 너무 일찍 들어버렸다..."
+                view.cog.stats["early"] += 1
 
             case discord.ButtonStyle.green:
                 content = "물고기를 잡았다!"
+                view.cog.stats["caught"] += 1
                 user_info = view.ctx.bot.database.get_user_info(interaction.user)
                 fish_info = view.ctx.bot.database.get_fish_info()
 
                 fish = await fish_info.get_random_fish()
-                await user_info.add_money(fish.price)
+                await user_info.add_money(fish.price, LedgerReason.FISH_SALE)
                 embed = discord.Embed(
                     title=f"{fish.name}",
                     description=f"{fish.description}",
@@ -54,48 +60,79 @@ class FishingButton(discord.ui.Button["FishingView"]):
         self.disabled = True
         assert self.disabled
         # interaction.response.edit_message를 사용하면 멘션이 풀리므로 아래와 같이 해결
-        await interaction.message.edit(content=content, embed=embed, view=None if embed else view)
+        # 아직 보내지 않은 수정(물고기가 걸림)이 있다면 이 수정으로 덮어씀
+        view.cog.bot.edit_coalescer.edit(interaction.message, content=content, embed=embed, view=None if embed else view)
         assert self.disabled
         await interaction.response.defer()
 
 
 class FishingView(discord.ui.View):
+    """낚시 한번의 상태
+
+    물고기가 걸리는 시점과 놓치는 시점은 봇의 timer_wheel로 예약하므로, 낚시마다 작업을 따로 만들지 않습니다.
+    """
+
     def __init__(self, cog: "Fishing", context: commands.Context["Fishing"]):
-        super().__init__(timeout=180)
+        super().__init__(timeout=None) # 시간 제한은 timer_wheel에서 처리
         self.cog = cog
         self.ctx = context
-        self.fishing_users = cog.fishing_users
-        self.logic_task: asyncio.Task = None
+        self.sessions = cog.bot.sessions
+        self.message: discord.Message = None
+        self.timer: TimerHandle = None # 다음 상태로 넘어가는 타이머
 
         self.add_item(FishingButton())
 
     def start_logic(self, message: discord.Message):
-        self.logic_task = asyncio.create_task(self.fishing_logic(message))
+        self.message = message
+        self.cog.active_views.add(self)
+        self.timer = self.cog.bot.timer_wheel.schedule( # 물고기가 걸리기까지의 시간
+            random.uniform(self.cog.bot_setting.fishing_random_min, self.cog.bot_setting.fishing_random_max),
+            self.on_bite
+        )
+
+    def finish(self):
+        """낚시를 끝내고 예약된 타이머를 취소합니다."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.cog.active_views.discard(self)
+        self.stop()
 
-    async def fishing_logic(self, message: discord.Message):
-        # 물고기가 걸리기끼지의 시간
-        await asyncio.sleep(random.uniform(self.cog.bot_setting.fishing_random_min, self.cog.bot_setting.fishing_random_max))
+    async def on_bite(self):
+        """물고기가 걸렸을 때"""
+        if self.is_finished():
+            return
 
-        # 물고기가 걸렸을 때
         button: FishingButton = self.children[0]
         button.style = discord.ButtonStyle.green # 버튼 색상 변경
-        await message.edit(content="무언가가 걸린것 같다!", view=self)
+        await self.cog.bot.edit_coalescer.edit(self.message, content="무언가가 걸린것 같다!", view=self)
 
-        # 물고기를 잡을 때
-        await asyncio.sleep(self.cog.bot_setting.fishing_timeout) # 물고기가 걸려있는 시간
+        if not self.is_finished(): # 메시지를 수정하는 동안 버튼을 누르지 않았다면
+            self.timer = self.cog.bot.timer_wheel.schedule(self.cog.bot_setting.fishing_timeout, self.on_escape) # 물고기가 걸려있는 시간
 
-        # 물고기를 놓쳤을 때
-        self.stop()
+    async def on_escape(self):
+        """물고기를 놓쳤을 때"""
+        if self.is_finished():
+            return
+
+        self.finish()
+        if not await self.sessions.release(SessionKind.FISHING, self.ctx.author.id): # 낚시 종료 처리
+            return
+        self.cog.stats["escaped"] += 1
+
+        button: FishingButton = self.children[0]
         button.style = discord.ButtonStyle.red
         button.disabled = True
-        await message.edit(content="물고기를 놓쳐버렸다...", view=self)
-        if self.ctx.author in self.fishing_users:
-            self.fishing_users.remove(self.ctx.author) # 낚시 종료 처리
+        self.cog.bot.edit_coalescer.edit(self.message, content="물고기를 놓쳐버렸다...", view=self)
 
     async def on_error(self, interaction: discord.Interaction[discord.Client], error: Exception, item: FishingButton) -> None:
-        if interaction.user in self.fishing_users:
-            self.fishing_users.remove(interaction.user)
+        self.finish()
+        await self.sessions.release(SessionKind.FISHING, interaction.user.id)
         item.disabled = True
+        self.cog.bot.edit_coalescer.discard(interaction.message)
+        if isinstance(error, NoFishAvailable):
+            await interaction.response.edit_message(content="잡을 수 있는 물고기가 없습니다.", view=self)
+            return
         await interaction.response.edit_message(content="낚시하던중 오류가 발생하였습니다.", view=self)
         await super().on_error(interaction, error, item)
 
@@ -103,7 +140,39 @@ class FishingView(discord.ui.View):
 class Fishing(Cog):
     def __init__(self, bot: Bot):
         super().__init__(bot)
-        self.fishing_users: set[discord.Member] = set() # 낚시 유저 정보 저장
+        self.max_sessions = int(os.getenv("FISHING_MAX_SESSIONS", 10000)) # 동시에 낚시할 수 있는 최대 인원
+        self.net_size = self._load_net_size() # 그물낚시 한번에 잡는 물고기 수
+        self.active_views: set[FishingView] = set() # 진행중인 낚시
+        self.stats = {"started": 0, "caught": 0, "early": 0, "escaped": 0, "rejected": 0, "net": 0} # 낚시 통계
+
+    def _load_net_size(self) -> int:
+        """FISHING_NET_SIZE 환경 변수를 읽습니다. 잘못된 값이면 경고를 남기고 기본값을 사용합니다.
+
+        Returns:
+            int: 그물낚시 한번에 잡는 물고기 수
+        """
+        value = os.getenv("FISHING_NET_SIZE")
+        if value is None:
+            return NET_SIZE
+        try:
+            net_size = int(value)
+        except ValueError:
+            self.logger.warning("Invalid FISHING_NET_SIZE %r, using default %s", value, NET_SIZE)
+            return NET_SIZE
+        if net_size < 1:
+            self.logger.warning("FISHING_NET_SIZE must be at least 1 (got %s), using default %s", net_size, NET_SIZE)
+            return NET_SIZE
+        return net_size
+
+    def export_state(self) -> dict:
+        return {"active_views": self.active_views, "stats": self.stats}
+
+    def import_state(self, state: dict) -> None:
+        # 진행중인 낚시는 이전 코드로 끝까지 진행하되, 새 Cog의 목록과 통계를 사용하도록 연결
+        self.active_views = state["active_views"]
+        self.stats.update(state["stats"])
+        for view in self.active_views:
+            view.cog = self
 
     @commands.command(
         name="낚시",
@@ -113,19 +182,76 @@ class Fishing(Cog):
     )
     @command_checks.is_registered()
     async def fishing(self, ctx: commands.Context[Bot]):
-        if ctx.author in self.fishing_users:
+        if len(self.active_views) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            await ctx.reply("낚시터가 가득 찼습니다. 잠시 후 다시 시도해 주세요.", delete_after=3)
+            return
+
+        ttl = self.bot_setting.fishing_random_max + self.bot_setting.fishing_timeout + 60 # 낚시가 끝나지 않아도 풀리는 시간
+        if not await self.bot.sessions.acquire(SessionKind.FISHING, ctx.author.id, ttl): # 낚시 시작 처리
             await ctx.reply("이미 낚시중입니다.", delete_after=3)
             return
 
-        self.fishing_users.add(ctx.author) # 낚시 시작 처리
+        self.stats["started"] += 1
         view = FishingView(self, ctx)
         message = await ctx.reply("낚시하는중...", view=view)
         view.start_logic(message)
 
     @fishing.error
     async def fishing_error(self, ctx: commands.Context[Bot], error: commands.CommandError):
-        if ctx.author in self.fishing_users:
-            self.fishing_users.remove(ctx.author)
+        await self.bot.sessions.release(SessionKind.FISHING, ctx.author.id)
+
+
+
+    @commands.command(
+        name="그물낚시",
+        aliases=["그물", "ㄱㅁ"],
+        description="그물을 던져 물고기 여러 마리를 한번에 잡습니다.",
+        usage="그물낚시"
+    )
+    @commands.cooldown(1, NET_COOLDOWN, commands.BucketType.user)
+    @command_checks.is_registered()
+    async def net_fishing(self, ctx: commands.Context[Bot]):
+        if not await self.bot.sessions.acquire(SessionKind.FISHING, ctx.author.id, 60): # 낚싯대 낚시와 동시에 하지 못하도록 함
+            await ctx.reply("이미 낚시중입니다.", delete_after=3)
+            ctx.command.reset_cooldown(ctx)
+            return
+
+        try:
+            fishes = await self.database.get_fish_info().get_random_fishes(self.net_size)
+            total = sum(fish.price for fish in fishes)
+            async with self.bot.economy_lock(ctx.author.id): # 다른 작업이 돈을 바꾸는 중이면 기다림
+                await self.database.get_user_info(ctx.author).add_money(total, LedgerReason.FISH_SALE) # 잡은 물고기를 한번에 판매
+        finally:
+            await self.bot.sessions.release(SessionKind.FISHING, ctx.author.id)
+        self.stats["net"] += 1
+
+        best = max(fishes, key=lambda fish: (fish.rating.value, fish.price))
+        embed = discord.Embed(
+            title="그물낚시",
+            description=f"물고기 {len(fishes)}마리를 잡아 {total:,}원을 받았습니다.",
+            colour=fish_embed_color[best.rating]
+        )
+        grades: dict = {}
+        for fish in fishes:
+            count, price = grades.get(fish.rating, (0, 0))
+            grades[fish.rating] = (count + 1, price + fish.price)
+        for grade, (count, price) in sorted(grades.items(), key=lambda item: item[0].value, reverse=True):
+            embed.add_field(name=fish_kor_name[grade], value=f"{count}마리 | {price:,}원")
+        embed.add_field(
+            name="가장 좋은 물고기",
+            value=f"{best.name} ({best.rating_str}) | {best.length_str} | {best.price:,}원",
+            inline=False
+        )
+        await ctx.reply(embed=embed)
+
+    @net_fishing.error
+    async def net_fishing_error(self, ctx: commands.Context[Bot], error: commands.CommandError):
+        if isinstance(error, commands.CommandOnCooldown):
+            await ctx.reply(f"그물을 정리하고 있습니다. {error.retry_after:.0f}초 뒤에 다시 시도해 주세요.", delete_after=3)
+            ctx.command_failed = False
+        elif isinstance(getattr(error, "original", None), UserBusy): # 판매하지 못했으므로 바로 다시 시도할 수 있도록 함
+            ctx.command.reset_cooldown(ctx)
 
 
 async def setup(bot: Bot): # setup 함수로 명령어 추가
@@ -19,10 +19,10 @@ class CoinBetConverter(commands.Converter):
     """베팅 금액을 입력받아 int 값으로 변환하는 컨버터"""
 
     async def convert(self, ctx: commands.Context[Bot], argument: str) -> int:
-        user_info = ctx.bot.database.get_user_info(ctx.author)
+        wallet = ctx.bot.get_wallet(ctx) # 명령어에서도 같은 지갑을 사용
 
         if argument in ("올인", "모두", "ㅇㅇ", "ㅁㄷ"):
-            return await user_info.get_money()
+            return await wallet.load()
 
         elif argument.endswith("%"):
             if not argument[:-1].isnumeric():
@@ -31,7 +31,7 @@ class CoinBetConverter(commands.Converter):
             percent = int(argument[:-1])
             if not 0 < percent <= 100:
                 raise commands.BadArgument("백분율은 1~100 사이의 값이어야 합니다.")
-            return (await user_info.get_money()) * percent // 100
+            return (await wallet.load()) * percent // 100
 
         elif argument.isnumeric():
             return int(argument)
@@ -6,16 +6,14 @@ from typing import Optional
 
 from src.classes import command_checks
 from src.classes.bot import Bot, Cog
+from src.classes.session import SessionKind
+from src.classes.enums import LedgerReason
 from src.utils.math_utils import lerp
 from .view import TicTacToeInviteView
 from .converter import CoinFaceConverter, CoinBetConverter
 
 
 class Game(Cog):
-    def __init__(self, bot: Bot):
-        super().__init__(bot)
-        self.tic_tac_toe_users: set[discord.Member] = set() # 틱택토 유저 정보 저장
-
     @commands.command(
         name="동전던지기",
         aliases=["동전", "동전뒤집기", "ㄷㅈ"],
@@ -24,33 +22,35 @@ class Game(Cog):
     )
     @command_checks.is_registered()
     async def coin_flip(self, ctx: commands.Context[Bot], face: CoinFaceConverter, money: CoinBetConverter):
-        user_info = self.database.get_user_info(ctx.author.id)
-
-        money = await user_info.get_money() if money in ("올인", "모두") else money
-        if money > (user_money := await user_info.get_money()): # 돈이 부족하면
-            await ctx.reply(f"돈이 부족합니다. (현재 자산: {user_money:,}원)")
-            return
-        elif money <= 0:
-            await ctx.reply("베팅금액은 1원 이상이어야 합니다.")
-            return
-
-        random_face = bool(random.getrandbits(1)) # 랜덤 값 생성
-        if random_face == face:
-            money = 1 if money == 1 else money//2 # 배팅금액 조정
-            await user_info.add_money(money) # 돈 추가
-            face_str = "앞" if random_face else "뒷"
-            await ctx.reply(f"축하합니다! {face_str}면이 나와 {money:,}원을 받았습니다. (현재 자산: {await user_info.get_money():,}원)")
-        else:
-            face_str = "앞" if random_face else "뒷"
-            loss_value = random.randint(1, round(lerp(
-                self.bot_setting.coinflip_loss_min,
-                self.bot_setting.coinflip_loss_max,
-                money / await user_info.get_money()
-            )))
-            loss_money = 1 if money//loss_value < 1 else money//loss_value
-            message = "전부" if loss_value == 1 or loss_money == 1 else f"1/{loss_value} "
-            await user_info.add_money(-loss_money) # 돈 차감
-            await ctx.reply(f"안타깝게도 {face_str}면이 나와 배팅한 돈의 {message}({-loss_money:,}원)를 잃었습니다. (현재 자산: {await user_info.get_money():,}원)")
+        wallet = self.bot.get_wallet(ctx) # CoinBetConverter와 같은 지갑
+
+        async with self.bot.economy_lock(ctx.author.id): # 베팅 중에 돈이 바뀌지 않도록 잠금, 답장은 잠금을 푼 뒤에 보냄
+            user_money = await wallet.load()
+            if money > user_money: # 돈이 부족하면
+                content = f"돈이 부족합니다. (현재 자산: {user_money:,}원)"
+            elif money <= 0:
+                content = "베팅금액은 1원 이상이어야 합니다."
+            else:
+                random_face = bool(random.getrandbits(1)) # 랜덤 값 생성
+                face_str = "앞" if random_face else "뒷"
+                if random_face == face:
+                    money = 1 if money == 1 else money//2 # 배팅금액 조정
+                    wallet.add(money) # 돈 추가
+                    await wallet.commit(LedgerReason.COIN_FLIP)
+                    content = f"축하합니다! {face_str}면이 나와 {money:,}원을 받았습니다. (현재 자산: {wallet.balance:,}원)"
+                else:
+                    loss_value = random.randint(1, round(lerp(
+                        self.bot_setting.coinflip_loss_min,
+                        self.bot_setting.coinflip_loss_max,
+                        money / user_money
+                    )))
+                    loss_money = 1 if money//loss_value < 1 else money//loss_value
+                    message = "전부" if loss_value == 1 or loss_money == 1 else f"1/{loss_value} "
+                    wallet.add(-loss_money) # 돈 차감
+                    await wallet.commit(LedgerReason.COIN_FLIP)
+                    content = f"안타깝게도 {face_str}면이 나와 배팅한 돈의 {message}({-loss_money:,}원)를 잃었습니다. (현재 자산: {wallet.balance:,}원)"
+
+        await ctx.reply(content)
 
     @coin_flip.error
     async def coin_flip_error(self, ctx: commands.Context[Bot], error: commands.CommandError):
@@ -71,10 +71,11 @@ class Game(Cog):
     )
     @command_checks.is_registered()
     async def tic_tac_toe(self, ctx: commands.Context[Bot], another: Optional[discord.Member] = None):
-        if ctx.author in self.tic_tac_toe_users:
+        sessions = self.bot.sessions
+        if await sessions.is_active(SessionKind.TIC_TAC_TOE, ctx.author.id):
             await ctx.reply("이미 참가중인 게임이 있습니다.")
             return
-        elif another in self.tic_tac_toe_users:
+        elif another is not None and await sessions.is_active(SessionKind.TIC_TAC_TOE, another.id):
             await ctx.reply("이미 참가중인 게임이 있는 유저입니다.")
             return
 
@@ -89,7 +90,7 @@ class Game(Cog):
 
 
         async def view_on_timeout(message: discord.Message):
-            await message.edit(content="초대시간이 초과되었습니다.", view=None)
+            self.bot.edit_coalescer.edit(message, content="초대시간이 초과되었습니다.", view=None)
 
         view = TicTacToeInviteView(self, ctx.author, another)
         message = await ctx.send(
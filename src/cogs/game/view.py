@@ -3,6 +3,8 @@ import discord
 import random
 from typing import TYPE_CHECKING
 
+from src.classes.session import SessionKind
+
 if TYPE_CHECKING:
     from .game import Game
 
@@ -41,8 +43,7 @@ class TicTacToeButton(discord.ui.Button["TicTacToeView"]):
             content = f"{view.users[view.current_player].mention}님의 차례 입니다."
         else:
             for user in view.users.values():
-                if user in view.cog.tic_tac_toe_users:
-                    view.cog.tic_tac_toe_users.remove(user) # 게임에 참가중인 유저 목록에서 제거
+                await view.cog.bot.sessions.release(SessionKind.TIC_TAC_TOE, user.id) # 게임에 참가중인 유저 목록에서 제거
 
             if winner == view.Tie:
                 content = "비겼습니다."
@@ -56,6 +57,7 @@ class TicTacToeButton(discord.ui.Button["TicTacToeView"]):
 
         message = interaction.message.content.split("\n")
         message[-1] = content
+        view.cog.bot.edit_coalescer.discard(interaction.message) # 오래된 수정이 나중에 덮어쓰지 않도록 취소
         await interaction.response.edit_message(content="\n".join(message), view=view)
 
 
@@ -84,8 +86,7 @@ class TicTacToeView(discord.ui.View):
 
     async def on_timeout(self):
         for user in self.users.values():
-            if user in self.cog.tic_tac_toe_users:
-                self.cog.tic_tac_toe_users.remove(user) # 게임에 참가중인 유저 목록에서 제거
+            await self.cog.bot.sessions.release(SessionKind.TIC_TAC_TOE, user.id) # 게임에 참가중인 유저 목록에서 제거
 
         message = await self.message.fetch()
         content = message.content.split("\n")
@@ -95,7 +96,7 @@ class TicTacToeView(discord.ui.View):
 
         for child in self.children:
             child.disabled = True
-        await self.message.edit(content="\n".join(content), view=self)
+        self.cog.bot.edit_coalescer.edit(self.message, content="\n".join(content), view=self)
 
     def check_board_winner(self):
         for across in self.board:
@@ -152,16 +153,15 @@ class TicTacToeInviteView(discord.ui.View):
         if interaction.user != self._another: # 초대를 받은 사람이 맞는지 확인
             return
 
-        if self._another in self._cog.tic_tac_toe_users:
+        sessions = self._cog.bot.sessions
+        if not await sessions.acquire(SessionKind.TIC_TAC_TOE, self._another.id):
             await interaction.response.send_message("이미 참가중인 게임이 있습니다.", ephemeral=True)
             return
-        elif self._admin in self._cog.tic_tac_toe_users:
+        elif not await sessions.acquire(SessionKind.TIC_TAC_TOE, self._admin.id):
+            await sessions.release(SessionKind.TIC_TAC_TOE, self._another.id)
             await interaction.response.send_message("이미 참가중인 게임이 있는 유저입니다.", ephemeral=True)
             return
 
-        self._cog.tic_tac_toe_users.add(self._admin)
-        self._cog.tic_tac_toe_users.add(self._another)
-
         game_order = dict(zip([TicTacToeView.X, TicTacToeView.O], random.sample([self._admin, self._another], 2))) # 게임 순서
         content = (
             f"O: {game_order[TicTacToeView.O].mention}",
@@ -0,0 +1,135 @@
+"""샤드 클러스터 실행기
+
+전체 샤드를 여러 프로세스(클러스터)로 나누어 src.main을 실행하고, 종료된 프로세스는 다시 실행합니다.
+
+사용법:
+    python -m src.launcher
+
+환경변수:
+    SHARD_COUNT: 전체 샤드 수, auto면 디스코드에서 권장하는 값 사용
+    SHARD_CLUSTERS: 실행할 프로세스 수
+"""
+import os
+import sys
+import signal
+import asyncio
+import logging
+import dotenv
+import requests
+
+logger = logging.getLogger("discord.launcher")
+
+RESTART_DELAY_MIN = 5 # 프로세스를 다시 실행하기 전 대기 시간 (초)
+RESTART_DELAY_MAX = 300
+
+
+def get_recommended_shards(token: str) -> int:
+    """디스코드에서 권장하는 샤드 수를 가져옵니다.
+
+    Args:
+        token (str): 봇 토큰
+
+    Returns:
+        int: 샤드 수
+    """
+    response = requests.get(
+        "https://discord.com/api/v10/gateway/bot",
+        headers={"Authorization": f"Bot {token}"},
+        timeout=10
+    )
+    response.raise_for_status()
+    return response.json()["shards"]
+
+
+def split_shards(shard_count: int, clusters: int) -> list[list[int]]:
+    """샤드 번호를 클러스터 수만큼 최대한 고르게 나눕니다.
+
+    Args:
+        shard_count (int): 전체 샤드 수
+        clusters (int): 클러스터 수
+
+    Returns:
+        list[list[int]]: 클러스터별 샤드 번호 목록
+    """
+    clusters = max(1, min(clusters, shard_count))
+    return [list(range(shard_count))[i::clusters] for i in range(clusters)]
+
+
+class Cluster():
+    """하나의 src.main 프로세스"""
+
+    def __init__(self, cluster_id: int, shard_ids: list[int], shard_count: int) -> None:
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.process: asyncio.subprocess.Process | None = None
+        self.restarts = 0
+
+    async def start(self) -> None:
+        env = os.environ.copy()
+        env["CLUSTER_ID"] = str(self.cluster_id)
+        env["SHARD_COUNT"] = str(self.shard_count)
+        env["SHARD_IDS"] = ",".join(map(str, self.shard_ids))
+        self.process = await asyncio.create_subprocess_exec(sys.executable, "-m", "src.main", env=env)
+        logger.info("Cluster %s started (pid %s, shards %s)", self.cluster_id, self.process.pid, self.shard_ids)
+
+    async def run(self, stopping: asyncio.Event) -> None:
+        """프로세스를 실행하고, 종료되면 점점 늘어나는 대기 시간 후 다시 실행합니다."""
+        delay = RESTART_DELAY_MIN
+        while not stopping.is_set():
+            await self.start()
+            code = await self.process.wait()
+            if stopping.is_set():
+                break
+
+            logger.warning("Cluster %s exited with code %s, restarting in %ss", self.cluster_id, code, delay)
+            self.restarts += 1
+            try:
+                await asyncio.wait_for(stopping.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, RESTART_DELAY_MAX)
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.returncode is None:
+            self.process.terminate()
+
+
+async def main():
+    dotenv.load_dotenv() # .env 파일 로드
+
+    shard_count = os.getenv("SHARD_COUNT", "auto")
+    if shard_count == "auto":
+        shard_count = get_recommended_shards(os.getenv("DISCORD_BOT_TOKEN"))
+    shard_count = int(shard_count)
+
+    clusters = [
+        Cluster(cluster_id, shard_ids, shard_count)
+        for cluster_id, shard_ids in enumerate(split_shards(shard_count, int(os.getenv("SHARD_CLUSTERS", 1))))
+    ]
+    logger.info("Launching %s shards in %s clusters", shard_count, len(clusters))
+
+    stopping = asyncio.Event()
+    def stop():
+        stopping.set()
+        for cluster in clusters:
+            cluster.stop()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop)
+        except NotImplementedError: # Windows
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop))
+
+    await asyncio.gather(*(cluster.run(stopping) for cluster in clusters))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[{asctime}] [{levelname:<8}] {name}: {message}",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        style="{"
+    )
+    asyncio.run(main())
\ No newline at end of file
@@ -1,14 +1,19 @@
+import discord
 from discord.ext import commands
 from discord.utils import stream_supports_colour, _ColourFormatter
 
 import os
 import dotenv
 import logging
+from typing import Literal, Optional
 from logging.handlers import TimedRotatingFileHandler
 
-from src.classes.bot import Bot
+from src.classes.bot import Bot, ShardedBot
+from src.utils.log_utils import RateLimitFilter, setup_queue_logging
 
 dotenv.load_dotenv() # .env 파일 로드
+CLUSTER_ID = os.getenv("CLUSTER_ID") # src.launcher로 실행했을 때의 프로세스 번호
+LOG_SUFFIX = f"_cluster{CLUSTER_ID}" if CLUSTER_ID else "" # 프로세스마다 로그 파일을 따로 사용
 
 
 # 스트림 로그 설정
@@ -28,7 +33,7 @@ stream_handler.setLevel(logging.INFO)
 
 # 파일 로그 설정
 file_handler = TimedRotatingFileHandler(
-    filename=f"./logs/latest.log",
+    filename=f"./logs/latest{LOG_SUFFIX}.log",
     when="midnight",
     interval=1,
     backupCount=30,
@@ -42,55 +47,88 @@ file_handler.setFormatter(
     )
 )
 file_handler.setLevel(logging.INFO)
-logging.getLogger().addHandler(file_handler)
 
 
 # 디버그 파일 로그 설정
-file_handler = TimedRotatingFileHandler(
-    filename=f"./logs/debug/latest_debug.log",
+debug_file_handler = TimedRotatingFileHandler(
+    filename=f"./logs/debug/latest_debug{LOG_SUFFIX}.log",
     when="midnight",
     interval=1,
     backupCount=30,
     encoding="utf-8"
 )
-file_handler.setFormatter(
+debug_file_handler.setFormatter(
     logging.Formatter(
         fmt="[{asctime}] {levelname:<8} <{name}> [{funcName} | {lineno}] >> {message}",
         datefmt="%Y-%m-%d %H:%M:%S",
         style="{"
     )
 )
-file_handler.setLevel(logging.DEBUG)
-logging.getLogger().addHandler(file_handler)
+debug_file_handler.setLevel(logging.DEBUG)
 
 
-bot = Bot()
+# 느린 쿼리 로그 설정
+slow_query_handler = TimedRotatingFileHandler(
+    filename=f"./logs/slow_query/latest_slow_query{LOG_SUFFIX}.log",
+    when="midnight",
+    interval=1,
+    backupCount=30,
+    encoding="utf-8"
+)
+slow_query_handler.setFormatter(
+    logging.Formatter(
+        fmt="[{asctime}] {levelname:<8} >> {message}",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        style="{"
+    )
+)
+slow_query_handler.setLevel(logging.WARNING)
+slow_query_handler.addFilter(logging.Filter("discord.bot.database.slow_query"))
+
+
+# 로그 파이프라인 설정
+# 이벤트 루프에서는 레코드를 큐에 넣기만 하고, 실제 출력과 파일 쓰기는 백그라운드 스레드에서 처리
+log_listener = setup_queue_logging(
+    handlers=[stream_handler, file_handler, debug_file_handler, slow_query_handler],
+    level=logging.DEBUG,
+    filters=[
+        RateLimitFilter({ # 초당 기록할 수 있는 디버그 로그 수
+            "discord.bot.database.query": float(os.getenv("LOG_QUERY_DEBUG_PER_SEC", 20)),
+        })
+    ]
+)
+
+
+if os.getenv("SHARD_COUNT"): # 샤드 모드, auto면 디스코드에서 권장하는 샤드 수 사용
+    bot = ShardedBot(
+        shard_count=None if os.getenv("SHARD_COUNT") == "auto" else int(os.getenv("SHARD_COUNT")),
+        shard_ids=[int(i) for i in os.getenv("SHARD_IDS").split(",")] if os.getenv("SHARD_IDS") else None
+    )
+else:
+    bot = Bot()
 
 # @bot.hybrid_command(
 @bot.command(
     name="리로드",
-    description="Cog및 bot_setting을 리로드합니다.",
+    description="바뀐 Cog및 bot_setting을 리로드합니다.",
+    usage="리로드 [force]"
 )
 @commands.is_owner()
-async def reload_cog(ctx: commands.Context[Bot]):
-    bot.logger.info(f"{ctx.author}({ctx.author.id}) | {ctx.command}: {ctx.message.content}")
+async def reload_cog(ctx: commands.Context[Bot], mode: Optional[Literal["force"]] = None):
+    bot.logger.info("%s(%s) | %s: %s", ctx.author, ctx.author.id, ctx.command, ctx.message.content)
     await ctx.defer()
 
-    for filename in os.listdir("./src/cogs"):
-        if filename.startswith("_"):
-            continue
-
-        if os.path.isdir(f"./src/cogs/{filename}") and "__init__.py" in os.listdir(f"./src/cogs/{filename}"):
-            await bot.reload_extension(f"src.cogs.{filename}")
-            bot.logger.info(f"리로드 완료: src.cogs.{filename}")
-        elif filename.endswith(".py"):
-            await bot.reload_extension(f"src.cogs.{filename[:-3]}")
-            bot.logger.info(f"리로드 완료: src.cogs.{filename[:-3]}")
+    timings = await bot.reload_extensions(force=mode == "force") # force가 아니면 바뀐 Cog만 리로드
 
     if bot.bot_setting is not None:
         await bot.bot_setting.update_setting() # bot_setting 업데이트
+        await bot.database.fish_info.update_catalog() # 물고기 목록 업데이트
 
-    await ctx.send("리로드를 완료했습니다.")
+    if timings:
+        details = "\n".join(f"`{extension}` {elapsed*1000:.1f}ms" for extension, elapsed in timings.items())
+        await ctx.send(f"리로드를 완료했습니다.\n{details}")
+    else:
+        await ctx.send("리로드를 완료했습니다. (바뀐 Cog 없음)")
 
 @reload_cog.error
 async def reload_cog_error(ctx: commands.Context[Bot], error: commands.CommandError):
@@ -98,8 +136,31 @@ async def reload_cog_error(ctx: commands.Context[Bot], error: commands.CommandEr
         await ctx.reply("이 명령어는 관리자만 사용할 수 있습니다.")
         ctx.command_failed = False
 
-bot.run(
-    token=os.getenv("DISCORD_BOT_TOKEN"),
-    log_handler=stream_handler,
-    log_level=logging.DEBUG,
-)
\ No newline at end of file
+@bot.command(
+    name="동기화",
+    description="슬래시 명령어를 해시와 관계없이 다시 동기화합니다.",
+    usage="동기화"
+)
+@commands.is_owner()
+async def sync_tree(ctx: commands.Context[Bot]):
+    bot.logger.info("%s(%s) | %s: %s", ctx.author, ctx.author.id, ctx.command, ctx.message.content)
+    await ctx.defer()
+
+    guild = discord.Object(id=os.getenv("DISCORD_GUILD_ID"))
+    bot.tree.copy_global_to(guild=guild) # 리로드로 바뀐 명령어도 포함
+    await bot.sync_tree(guild, force=True)
+    await ctx.send("슬래시 명령어를 동기화했습니다.")
+
+@sync_tree.error
+async def sync_tree_error(ctx: commands.Context[Bot], error: commands.CommandError):
+    if isinstance(error, commands.NotOwner):
+        await ctx.reply("이 명령어는 관리자만 사용할 수 있습니다.")
+        ctx.command_failed = False
+
+try:
+    bot.run(
+        token=os.getenv("DISCORD_BOT_TOKEN"),
+        log_handler=None, # 로그 설정은 위에서 직접 함
+    )
+finally:
+    log_listener.stop() # 큐에 남은 로그를 모두 기록
\ No newline at end of file
@@ -0,0 +1,323 @@
+"""경제 시뮬레이터
+
+봇 설정(bot_setting)과 물고기 목록(fish_info)으로 유저들의 돈받기, 동전던지기, 낚시를 NumPy로 한번에 시뮬레이션하여
+돈 총량 증가, 자산 분포, 활동별 기대값(EV)을 계산합니다.
+여러 번의 독립적인 시뮬레이션은 프로세스 풀에 나눠 실행하므로, 설정을 바꾸기 전에 결과를 미리 확인할 수 있습니다.
+
+사용법:
+    python -m src.simulation.economy --players 10000 --days 365 --runs 8
+    python -m src.simulation.economy --set coinflip_loss_max=3 --set attendance_multiple=50
+    python -m src.simulation.economy --database mysql  # MYSQL_* 환경변수의 설정 사용
+"""
+import numpy as np
+
+import os
+import time
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.classes.database import DataSQL, FishInfo
+from src.classes.database.fish_info import FishBatchTable
+from src.classes.database.bot_setting import BotSettingColumns
+from src.classes.database.backends import StorageBackend, MySQLBackend, SQLiteBackend
+from src.classes.enums import FishInfoColumns, FishRating
+
+ACTIVITIES = ("attendance", "fishing", "coin_flip")
+PERCENTILES = (10, 50, 90, 99)
+
+
+class EconomyConfig():
+    """시뮬레이션에 사용할 봇 설정과 물고기 목록 (다른 프로세스로 넘길 수 있도록 기본 타입만 가짐)"""
+
+    def __init__(self, settings: BotSettingColumns, fish: list[tuple], grade_prob: dict[int, float]) -> None:
+        """시뮬레이션 설정
+
+        Args:
+            settings (BotSettingColumns): 봇 설정값
+            fish (list[tuple]): fish_info 테이블의 행 목록
+            grade_prob (dict[int, float]): 등급별 확률 (%)
+        """
+        self.settings = dict(settings)
+        self.fish = list(fish)
+        self.grade_prob = dict(grade_prob)
+
+    def override(self, **settings: Any) -> "EconomyConfig":
+        """일부 설정을 바꾼 새 설정을 반환합니다.
+
+        Args:
+            **settings (Any): 바꿀 설정값
+
+        Raises:
+            ValueError: 없는 설정이거나 타입에 맞지 않을 때
+
+        Returns:
+            EconomyConfig: 새 설정
+        """
+        values = dict(self.settings)
+        for name, value in settings.items():
+            _type = BotSettingColumns.__annotations__.get(name)
+            if _type is None:
+                raise ValueError(f"bot_setting에 {name} 설정이 없습니다.")
+            values[name] = _type(value)
+        return EconomyConfig(values, self.fish, self.grade_prob)
+
+    def fish_table(self) -> FishBatchTable:
+        """물고기 목록으로 FishInfo와 같은 규칙의 일괄 선택 테이블을 만듭니다."""
+        catalog: dict[FishRating, list[tuple]] = {}
+        for row in self.fish:
+            catalog.setdefault(FishRating(row[FishInfoColumns.RATING.value]), []).append(row)
+        return FishBatchTable(catalog, {FishRating(rating): prob for rating, prob in self.grade_prob.items()})
+
+
+def _attendance_claims(day: int, cooldown_hours: int) -> int:
+    """하루에 돈받기를 할 수 있는 횟수 (쿨타임이 끝나자마자 받는다고 가정)"""
+    return (day + 1) * 24 // cooldown_hours - day * 24 // cooldown_hours
+
+
+def simulate(
+    config: EconomyConfig,
+    players: int,
+    days: int,
+    seed: int,
+    fishing_per_day: float = 20,
+    coin_flips_per_day: float = 5,
+    bet_ratio: tuple[float, float] = (0.05, 0.5),
+    all_in_prob: float = 0.05,
+    initial_money: int = 0
+) -> dict[str, Any]:
+    """시뮬레이션 한번을 실행합니다. 모든 유저를 하루 단위로 한번에 계산합니다.
+
+    Args:
+        config (EconomyConfig): 설정
+        players (int): 유저 수
+        days (int): 일 수
+        seed (int): 난수 시드
+        fishing_per_day (float, optional): 유저 한명이 하루에 잡는 평균 물고기 수 (포아송 분포). Defaults to 20.
+        coin_flips_per_day (float, optional): 유저 한명이 하루에 하는 평균 동전던지기 수 (포아송 분포). Defaults to 5.
+        bet_ratio (tuple[float, float], optional): 자산 중 베팅하는 비율의 범위 (균등 분포). Defaults to (0.05, 0.5).
+        all_in_prob (float, optional): 올인할 확률. Defaults to 0.05.
+        initial_money (int, optional): 처음 자산. Defaults to 0.
+
+    Returns:
+        dict[str, Any]: 일별 돈 총량, 마지막 자산 분포, 활동별 합계와 횟수
+    """
+    rng = np.random.default_rng(seed)
+    settings = config.settings
+    fish_table = config.fish_table()
+
+    balance = np.full(players, initial_money, dtype=np.int64)
+    supply = np.empty(days, dtype=np.int64)
+    totals = dict.fromkeys(ACTIVITIES, 0)
+    counts = dict.fromkeys(ACTIVITIES, 0)
+
+    bonus_prob = settings["attendance_bonus_money_prob"] / 100
+    loss_min, loss_max = settings["coinflip_loss_min"], settings["coinflip_loss_max"]
+    for day in range(days):
+        # 돈받기 (Finance.attendance)
+        for _ in range(_attendance_claims(day, settings["attendance_cooldown"])):
+            money = np.where(
+                rng.random(players) < bonus_prob,
+                settings["attendance_bonus_money"],
+                rng.integers(
+                    settings["attendance_random_money_min"],
+                    settings["attendance_random_money_max"] + 1,
+                    players
+                ) * settings["attendance_multiple"]
+            )
+            balance += money
+            totals["attendance"] += int(money.sum())
+            counts["attendance"] += players
+
+        # 낚시 (FishingButton.callback)
+        catches = rng.poisson(fishing_per_day, players)
+        n = int(catches.sum())
+        if n:
+            _, _, prices = fish_table.sample(rng, n)
+            earned = np.bincount(np.repeat(np.arange(players), catches), weights=prices, minlength=players).astype(np.int64)
+            balance += earned
+            totals["fishing"] += int(prices.sum())
+            counts["fishing"] += n
+
+        # 동전던지기 (Game.coin_flip), 베팅금액이 자산에 따라 바뀌므로 한판씩 모든 유저를 한번에 계산
+        flips = rng.poisson(coin_flips_per_day, players)
+        for round_ in range(int(flips.max(initial=0))):
+            ratio = np.where(rng.random(players) < all_in_prob, 1.0, rng.uniform(*bet_ratio, players))
+            bet = (balance * ratio).astype(np.int64)
+            active = (flips > round_) & (bet > 0)
+            if not active.any():
+                continue
+
+            bet, user_money = bet[active], balance[active]
+            win = rng.random(bet.size) < 0.5
+            gain = np.where(bet == 1, 1, bet // 2)
+            loss_value = rng.integers(1, np.maximum(np.round(loss_min + (loss_max - loss_min) * (bet / user_money)), 1) + 1)
+            loss = np.maximum(bet // loss_value, 1)
+            change = np.where(win, gain, -loss)
+            balance[active] += change
+            totals["coin_flip"] += int(change.sum())
+            counts["coin_flip"] += int(bet.size)
+
+        supply[day] = balance.sum()
+
+    return {
+        "supply": supply,
+        "percentiles": np.percentile(balance, PERCENTILES),
+        "gini": gini(balance),
+        "totals": totals,
+        "counts": counts,
+    }
+
+
+def gini(values: np.ndarray) -> float:
+    """지니 계수를 계산합니다. (0: 모두 같음, 1: 한명이 모두 가짐)
+
+    Args:
+        values (np.ndarray): 음수가 아닌 값 배열
+
+    Returns:
+        float: 지니 계수
+    """
+    values = np.sort(values.astype(np.float64))
+    total = values.sum()
+    if values.size == 0 or total == 0:
+        return 0.0
+    index = np.arange(1, values.size + 1)
+    return float(((2 * index - values.size - 1) * values).sum() / (values.size * total))
+
+
+def run(config: EconomyConfig, runs: int, workers: int | None = None, seed: int = 0, **options: Any) -> dict[str, Any]:
+    """독립적인 시뮬레이션 여러 번을 프로세스 풀에서 실행하고 결과를 합칩니다.
+
+    Args:
+        config (EconomyConfig): 설정
+        runs (int): 시뮬레이션 횟수
+        workers (int | None, optional): 프로세스 수, None이면 CPU 수. Defaults to None.
+        seed (int, optional): 난수 시드. Defaults to 0.
+        **options (Any): simulate에 넘길 인자 (players, days 등)
+
+    Returns:
+        dict[str, Any]: 시뮬레이션별 결과와 평균
+    """
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(runs)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(simulate, config, seed=s, **options) for s in seeds]
+        results = [future.result() for future in futures]
+
+    totals = {name: sum(result["totals"][name] for result in results) for name in ACTIVITIES}
+    counts = {name: sum(result["counts"][name] for result in results) for name in ACTIVITIES}
+    final_supply = np.array([result["supply"][-1] for result in results], dtype=np.float64)
+    return {
+        "results": results,
+        "supply": np.mean([result["supply"] for result in results], axis=0),
+        "final_supply_std": float(final_supply.std()),
+        "percentiles": np.mean([result["percentiles"] for result in results], axis=0),
+        "gini": float(np.mean([result["gini"] for result in results])),
+        "ev": {name: totals[name] / counts[name] if counts[name] else 0.0 for name in ACTIVITIES},
+        "totals": totals,
+        "counts": counts,
+    }
+
+
+async def load_config(database: DataSQL) -> EconomyConfig:
+    """|coro|
+    데이터베이스에서 봇 설정과 물고기 목록을 불러옵니다.
+
+    Args:
+        database (DataSQL): 연결된 데이터베이스
+
+    Returns:
+        EconomyConfig: 설정
+    """
+    bot_setting = await database.get_bot_setting()
+    rows = await database._query("SELECT * FROM fish_info", fetch=True)
+    fish = [database.fish_info._parse_row(row) for row in rows]
+    return EconomyConfig(bot_setting._settings, fish, {rating.value: prob for rating, prob in FishInfo.grade_prob.items()})
+
+
+def _create_backend(name: str, sqlite_path: str) -> StorageBackend:
+    if name == "sqlite":
+        return SQLiteBackend(sqlite_path)
+    return MySQLBackend(
+        host=os.getenv("MYSQL_HOST"),
+        port=os.getenv("MYSQL_PORT"),
+        user=os.getenv("MYSQL_USER"),
+        password=os.getenv("MYSQL_PASSWORD"),
+        database=os.getenv("MYSQL_DB_NAME"),
+        loop=asyncio.get_running_loop(),
+    )
+
+
+async def _load(args: argparse.Namespace) -> EconomyConfig:
+    database = DataSQL(_create_backend(args.database, args.sqlite_path))
+    if not await database.connect():
+        raise SystemExit("데이터베이스에 연결하지 못했습니다.")
+    try:
+        return await load_config(database)
+    except ValueError as e: # 봇 설정이 비어있거나 잘못됨
+        raise SystemExit(f"봇 설정을 불러오지 못했습니다: {e}")
+    finally:
+        await database.close()
+
+
+def main(args: argparse.Namespace):
+    config = asyncio.run(_load(args))
+    if args.set:
+        config = config.override(**dict(item.split("=", 1) for item in args.set))
+
+    start = time.perf_counter()
+    result = run(
+        config,
+        runs=args.runs,
+        workers=args.workers,
+        seed=args.seed,
+        players=args.players,
+        days=args.days,
+        fishing_per_day=args.fishing_per_day,
+        coin_flips_per_day=args.coin_flips_per_day,
+        bet_ratio=(args.bet_min, args.bet_max),
+        all_in_prob=args.all_in_prob,
+        initial_money=args.initial_money,
+    )
+    elapsed = time.perf_counter() - start
+
+    player_days = args.players * args.days * args.runs
+    print(f"players={args.players} days={args.days} runs={args.runs} ({player_days:,} player-days, {elapsed:.1f}s)")
+    if args.set:
+        print(f"overrides: {', '.join(args.set)}")
+
+    print("\n[돈 총량]")
+    supply = result["supply"]
+    for day in sorted({0, args.days // 4, args.days // 2, args.days * 3 // 4, args.days - 1}):
+        print(f"  {day + 1:>5}일차 {supply[day]:>20,.0f}원 (1인당 {supply[day] / args.players:,.0f}원)")
+    print(f"  하루 평균 증가 {(supply[-1] - args.initial_money * args.players) / args.days:,.0f}원, 표준편차 {result['final_supply_std']:,.0f}원")
+
+    print("\n[자산 분포]")
+    for percentile, value in zip(PERCENTILES, result["percentiles"]):
+        print(f"  p{percentile:<3} {value:>20,.0f}원")
+    print(f"  지니 계수 {result['gini']:.3f}")
+
+    print("\n[활동별 기대값]")
+    for name in ACTIVITIES:
+        print(f"  {name:<12} 1회 {result['ev'][name]:>14,.1f}원 | {result['counts'][name]:>14,}회 | 합계 {result['totals'][name]:>20,}원")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Project-D 경제 시뮬레이터")
+    parser.add_argument("--database", choices=("sqlite", "mysql"), default="sqlite", help="설정을 불러올 저장소")
+    parser.add_argument("--sqlite-path", default=os.getenv("SQLITE_PATH", "./data/project-d.db"), help="SQLite 파일 경로")
+    parser.add_argument("--set", action="append", metavar="NAME=VALUE", help="바꿔서 시뮬레이션할 봇 설정")
+    parser.add_argument("--players", type=int, default=10_000, help="유저 수")
+    parser.add_argument("--days", type=int, default=365, help="일 수")
+    parser.add_argument("--runs", type=int, default=4, help="독립적인 시뮬레이션 횟수")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--fishing-per-day", type=float, default=20, help="하루 평균 낚시 횟수")
+    parser.add_argument("--coin-flips-per-day", type=float, default=5, help="하루 평균 동전던지기 횟수")
+    parser.add_argument("--bet-min", type=float, default=0.05, help="자산 중 베팅하는 최소 비율")
+    parser.add_argument("--bet-max", type=float, default=0.5, help="자산 중 베팅하는 최대 비율")
+    parser.add_argument("--all-in-prob", type=float, default=0.05, help="올인할 확률")
+    parser.add_argument("--initial-money", type=int, default=0, help="처음 자산")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+
+    main(parser.parse_args())
\ No newline at end of file
@@ -0,0 +1,114 @@
+import copy
+import time
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+
+class LazyQueueHandler(QueueHandler):
+    """로그 레코드를 포맷하지 않고 큐에 넣는 핸들러
+
+    기본 QueueHandler는 큐에 넣기 전에 핸들러의 포맷터로 전체 로그 문자열을 만듭니다.
+    이 핸들러는 메시지와 인자(args)만 합쳐두고 포맷은 QueueListener의 스레드로 미루며, 예외 정보는 미리 문자열로 바꿔둡니다.
+    인자는 이벤트 루프에서 계속 바뀌는 객체(Member, Message 등)일 수 있으므로, 로그를 남긴 시점의 값으로 문자열을 만들어야 합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage() # 다른 스레드에서 인자를 문자열로 바꾸지 않도록 미리 합침
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None # traceback 객체는 다른 스레드로 넘기지 않음
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """로거별로 초당 기록할 수 있는 로그 수를 제한하는 필터 (token bucket)
+
+    level 이하의 로그에만 적용되며, 제한을 넘어서 버려진 로그 수는 다음에 기록되는 로그에 함께 남깁니다.
+    """
+
+    def __init__(self, rates: dict[str, float], level: int = logging.DEBUG) -> None:
+        """로그 속도 제한 필터
+
+        Args:
+            rates (dict[str, float]): 로거 이름: 초당 최대 로그 수, 하위 로거에도 적용됨
+            level (int, optional): 제한을 적용할 최대 로그 레벨. Defaults to logging.DEBUG.
+        """
+        super().__init__()
+        self.rates = rates
+        self.level = level
+
+        self._buckets: dict[str, list[float]] = {} # 로거 이름: [남은 토큰, 마지막 갱신 시간]
+        self._rate_cache: dict[str, str | None] = {} # 로거 이름: 적용할 rates의 키
+        self.dropped: dict[str, int] = {} # 로거 이름: 버려진 로그 수
+
+    def _find_rate(self, name: str) -> str | None:
+        try:
+            return self._rate_cache[name]
+        except KeyError:
+            pass
+
+        key = name
+        while key and key not in self.rates:
+            key = key.rpartition(".")[0]
+        result = self._rate_cache[name] = key or None
+        return result
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+
+        key = self._find_rate(record.name)
+        if key is None:
+            return True
+
+        rate = self.rates[key]
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [rate, now]
+        else:
+            bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        if bucket[0] < 1:
+            self.dropped[key] = self.dropped.get(key, 0) + 1
+            return False
+
+        bucket[0] -= 1
+        dropped = self.dropped.pop(key, 0)
+        if dropped:
+            record.msg = f"{record.msg} ({dropped}개 로그 생략됨)"
+        return True
+
+
+def setup_queue_logging(
+    handlers: list[logging.Handler],
+    level: int = logging.DEBUG,
+    filters: list[logging.Filter] = ()
+) -> QueueListener:
+    """루트 로거에 QueueHandler를 연결하고, 실제 핸들러는 백그라운드 스레드에서 실행합니다.
+
+    Args:
+        handlers (list[logging.Handler]): 백그라운드 스레드에서 실행할 핸들러 목록
+        level (int, optional): 루트 로거 레벨. Defaults to logging.DEBUG.
+        filters (list[logging.Filter], optional): 큐에 넣기 전에 적용할 필터 목록. Defaults to ().
+
+    Returns:
+        QueueListener: 시작된 리스너, 종료할 때 stop()을 호출해야 합니다.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = LazyQueueHandler(log_queue)
+    for log_filter in filters:
+        queue_handler.addFilter(log_filter)
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
\ No newline at end of file
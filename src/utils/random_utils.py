@@ -0,0 +1,79 @@
+import random
+from typing import Iterable
+
+
+class AliasTable():
+    """Walker의 alias method를 이용한 가중치 랜덤 선택 테이블
+
+    테이블을 만들 때 O(n), 선택할 때 O(1)의 시간이 걸립니다.
+    """
+
+    __slots__ = ("_prob", "_alias", "_size")
+
+    def __init__(self, weights: Iterable[float]) -> None:
+        """가중치 랜덤 선택 테이블
+
+        Args:
+            weights (Iterable[float]): 각 인덱스의 가중치 (음수가 아닌 값)
+
+        Raises:
+            ValueError: 가중치가 비어있거나 합이 0 이하일 때
+        """
+        weights = list(weights)
+        total = sum(weights)
+        if len(weights) == 0 or total <= 0:
+            raise ValueError("가중치는 하나 이상이어야 하며, 합이 0보다 커야 합니다.")
+
+        size = len(weights)
+        scaled = [w * size / total for w in weights]
+        prob = [0.0] * size
+        alias = list(range(size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+
+        for i in small + large: # 부동소수점 오차로 남은 값은 확률 1로 처리
+            prob[i] = 1.0
+
+        self._prob = prob
+        self._alias = alias
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def prob(self) -> list[float]:
+        """각 칸에서 자기 자신이 선택될 확률을 반환합니다.
+
+        Returns:
+            list[float]: 확률 목록
+        """
+        return self._prob
+
+    @property
+    def alias(self) -> list[int]:
+        """각 칸의 대체 인덱스를 반환합니다.
+
+        Returns:
+            list[int]: 대체 인덱스 목록
+        """
+        return self._alias
+
+    def sample(self, rng: random.Random = random) -> int:
+        """가중치에 따라 인덱스 하나를 선택합니다.
+
+        Args:
+            rng (random.Random, optional): 사용할 난수 생성기. Defaults to random.
+
+        Returns:
+            int: 선택된 인덱스
+        """
+        i = int(rng.random() * self._size)
+        return i if rng.random() < self._prob[i] else self._alias[i]
@@ -0,0 +1,217 @@
+import time
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger("discord.utils.timer_wheel")
+
+
+class TimerHandle():
+    """TimerWheel.schedule로 예약된 타이머"""
+
+    __slots__ = ("expires", "callback", "args", "cancelled", "_bucket", "_wheel")
+
+    def __init__(self, wheel: "TimerWheel", expires: int, callback: Callable, args: tuple) -> None:
+        self.expires = expires # 실행될 tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._bucket: set | None = None
+        self._wheel = wheel
+
+    def cancel(self) -> bool:
+        """타이머를 취소합니다. O(1)
+
+        Returns:
+            bool: 취소 여부, 이미 실행되었거나 취소된 타이머면 False
+        """
+        if self.cancelled or self._bucket is None:
+            return False
+
+        self.cancelled = True
+        self._bucket.discard(self)
+        self._bucket = None
+        self._wheel._active -= 1
+        self._wheel.cancelled += 1
+        return True
+
+
+class TimerWheel():
+    """여러 단계의 바퀴(hierarchical timing wheel)로 많은 타이머를 한번에 관리하는 스케줄러
+
+    타이머마다 asyncio 작업을 만들지 않고, 하나의 작업이 tick마다 만료된 칸의 타이머만 실행합니다.
+    예약과 취소는 O(1)이며, 먼 미래의 타이머는 위 단계의 바퀴에 있다가 가까워지면 아래 단계로 내려옵니다.
+    """
+
+    def __init__(self, tick: float = 0.05, slots: int = 64, levels: int = 4) -> None:
+        """타이머 바퀴
+
+        Args:
+            tick (float, optional): 가장 아래 단계 한 칸의 시간 (초). Defaults to 0.05.
+            slots (int, optional): 한 단계의 칸 수 (2의 거듭제곱). Defaults to 64.
+            levels (int, optional): 단계 수, tick * slots ** levels 보다 먼 타이머는 가장 위 단계에서 다시 내려옴. Defaults to 4.
+        """
+        if slots & (slots - 1):
+            raise ValueError("slots는 2의 거듭제곱이어야 합니다.")
+
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._wheels: list[list[set[TimerHandle]]] = [[set() for _ in range(slots)] for _ in range(levels)]
+
+        self._start = time.monotonic()
+        self._current = 0 # 마지막으로 처리한 tick
+        self._active = 0
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: set[asyncio.Task] = set() # 실행중인 코루틴 콜백
+
+        self.scheduled = 0 # 예약된 타이머 수
+        self.fired = 0 # 실행된 타이머 수
+        self.cancelled = 0 # 취소된 타이머 수
+        self.errors = 0 # 콜백에서 발생한 예외 수
+        self.max_lag = 0.0 # tick이 늦게 처리된 최대 시간 (초)
+
+    def __len__(self) -> int:
+        return self._active
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """타이머 통계"""
+        return {
+            "active": self._active,
+            "running_callbacks": len(self._tasks),
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "errors": self.errors,
+            "max_lag_ms": self.max_lag * 1000,
+        }
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._start) / self.tick)
+
+    def _insert(self, handle: TimerHandle) -> None:
+        delta = handle.expires - self._current
+        level = 0
+        while level < self.levels - 1 and delta >= 1 << (self._bits * (level + 1)):
+            level += 1
+
+        if level == self.levels - 1 and delta >= 1 << (self._bits * self.levels):
+            # 가장 위 단계보다 먼 타이머는 한바퀴 뒤의 칸에 넣고, 내려올 때 다시 계산
+            index = (self._current >> (self._bits * level)) - 1 & self._mask
+        else:
+            index = (handle.expires >> (self._bits * level)) & self._mask
+        bucket = self._wheels[level][index]
+        bucket.add(handle)
+        handle._bucket = bucket
+
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """delay초 뒤에 callback을 실행하도록 예약합니다.
+        callback이 코루틴 함수라면 실행할 때 작업을 만들어 실행합니다.
+
+        Args:
+            delay (float): 기다릴 시간 (초), tick 단위로 올림됨
+            callback (Callable[..., Any]): 실행할 함수
+            *args (Any): callback에 넘길 인자
+
+        Returns:
+            TimerHandle: 취소할 때 사용하는 타이머
+        """
+        if self._task is None or self._task.done():
+            self._start_task()
+        if self._active == 0: # 비어있던 동안 지난 tick은 처리할 필요 없음
+            self._current = max(self._current, self._now_tick())
+
+        expires = max(self._now_tick() + max(int(-(-delay // self.tick)), 1), self._current + 1)
+        handle = TimerHandle(self, expires, callback, args)
+        self._insert(handle)
+        self._active += 1
+        self.scheduled += 1
+        self._wakeup.set()
+        return handle
+
+    def _start_task(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._current = self._now_tick()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="timer-wheel")
+
+    def _cascade(self, level: int) -> None:
+        """위 단계의 칸에 있던 타이머를 아래 단계로 내립니다."""
+        index = (self._current >> (self._bits * level)) & self._mask
+        bucket = self._wheels[level][index]
+        self._wheels[level][index] = set()
+        for handle in bucket:
+            self._insert(handle)
+
+    def _advance(self) -> None:
+        """한 tick을 진행하고 만료된 타이머를 실행합니다."""
+        self._current += 1
+        level = 1
+        while level < self.levels and self._current & ((1 << (self._bits * level)) - 1) == 0:
+            self._cascade(level)
+            level += 1
+
+        index = self._current & self._mask
+        bucket = self._wheels[0][index]
+        if not bucket:
+            return
+
+        self._wheels[0][index] = set()
+        for handle in bucket:
+            handle._bucket = None
+            self._active -= 1
+            self.fired += 1
+            self._fire(handle)
+
+    def _fire(self, handle: TimerHandle) -> None:
+        try:
+            result = handle.callback(*handle.args)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+        except Exception:
+            self.errors += 1
+            logger.exception("Timer callback %r failed", handle.callback)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            logger.error("Timer callback failed", exc_info=task.exception())
+
+    async def _run(self) -> None:
+        while True:
+            if self._active == 0: # 타이머가 없으면 새 타이머가 예약될 때까지 대기
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            target = self._current + 1
+            delay = self._start + target * self.tick - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                self.max_lag = max(self.max_lag, -delay)
+
+            now_tick = self._now_tick()
+            while self._current < now_tick: # 늦어진 만큼 한번에 처리
+                self._advance()
+
+    async def close(self) -> None:
+        """|coro|
+        스케줄러를 멈추고 예약된 타이머를 모두 취소합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for wheel in self._wheels:
+            for bucket in wheel:
+                for handle in list(bucket):
+                    handle.cancel()
+        for task in list(self._tasks):
+            task.cancel()
\ No newline at end of file